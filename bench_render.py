@@ -0,0 +1,151 @@
+#bench_render.py
+# Benchmark jalur render halaman (bukan engine): draw_gantt_3d, canvas.draw(), render_3d_gantt,
+# update_treeviews dan pengisian res_tree, di ukuran 10 .. 10^5 proses. Halaman dibuat di root
+# Tk yang disembunyikan (withdraw) dan figure dirender Agg, jadi tidak ada jendela yang muncul.
+# Waktu engine untuk workload yang sama ikut dicatat sebagai pembanding. Hasil ditambahkan ke
+# bench_output.txt supaya regresi UI kelihatan dari run ke run.
+#
+#   python bench_render.py --pages fcfs,rr --sizes 10,100,1000,10000,100000 --repeat 3
+import argparse, platform, statistics, sys, time
+from time import perf_counter
+from typing import Callable, Dict, Optional
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from gantt_plot import draw_gantt_3d
+from pool import ENGINES
+from workload import WorkloadSpec, generate_workload, to_tuples
+
+SIZES = (10, 100, 1000, 10000, 100000)
+OUTPUT = "bench_output.txt"
+# nama halaman -> (modul, kelas, engine, kwargs engine)
+PAGES = {
+    "fcfs": ("fcfs", "FCFSPage", "fcfs", {}),
+    "sjf": ("sjf", "SJFPage", "sjf", {}),
+    "priority": ("priority", "PriorityPage", "priority", {}),
+    "rr": ("rr", "RRPage", "rr", {"quantum": 2}),
+}
+STAGES = ("simulate", "update_treeviews", "res_tree", "draw_gantt_3d", "canvas.draw", "render_3d_gantt")
+
+# ---------------- Timing ----------------
+def _time(fn: Callable[[], None], repeat: int) -> float:
+    # median beberapa run (detik)
+    runs = []
+    for _ in range(repeat):
+        t0 = perf_counter()
+        fn()
+        runs.append(perf_counter() - t0)
+    return statistics.median(runs)
+
+class _AggTarget:
+    # pengganti halaman saat Tk tidak tersedia (mis. CI tanpa display): hanya stage Agg
+    def __init__(self):
+        self.fig = Figure(figsize=(7,5), dpi=100)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111, projection="3d")
+
+def _make_page(name: str):
+    # -> (root, page); root None kalau Tk tidak bisa dibuat
+    from tkinter import Tk, TclError
+    try:
+        root = Tk()
+    except TclError as e:
+        print(f"warning: Tk unavailable ({e}); timing Agg stages only", file=sys.stderr)
+        return None, _AggTarget()
+    root.withdraw()
+    module = __import__(PAGES[name][0])
+    page = getattr(module, PAGES[name][1])(root)
+    root.update_idletasks()
+    return root, page
+
+def bench_page(name: str, sizes=SIZES, repeat: int = 3, budget: float = 60.0,
+               seed: int = 0) -> Dict[int, Dict[str, Optional[float]]]:
+    # -> {n: {stage: detik atau None (dilewati)}}. Stage yang satu run-nya melebihi budget
+    # tidak dijalankan lagi untuk ukuran yang lebih besar.
+    _, _, engine, kwargs = PAGES[name]
+    fn, with_priority = ENGINES[engine]
+    root, page = _make_page(name)
+    over_budget = set()
+    results = {}
+    try:
+        for n in sizes:
+            at, bt, pr = generate_workload(n, WorkloadSpec(), seed=seed)
+            tuples = to_tuples(at, bt, pr if with_priority else None)
+            procs, gantt, total_time = fn(tuples, **kwargs)
+            title = f"3D Gantt ({name.upper()})"
+            pids = [p.pid for p in procs]
+
+            def draw_only():
+                draw_gantt_3d(page.ax, gantt, title, "#69259c", "#fb47b2", "#ffddff", pids=pids, total_time=total_time)
+
+            def fill_inputs():
+                page.process_list = tuples
+                page.update_treeviews()
+                root.update_idletasks()
+
+            def fill_results():
+                page.fill_results(procs)
+                root.update_idletasks()
+
+            def render():
+                page.render_3d_gantt(gantt, procs, total_time)
+                root.update_idletasks()
+
+            stages = {"simulate": lambda: fn(tuples, **kwargs), "draw_gantt_3d": draw_only,
+                      "canvas.draw": page.canvas.draw}
+            if root is not None:
+                stages.update({"update_treeviews": fill_inputs, "res_tree": fill_results, "render_3d_gantt": render})
+            row = {}
+            for stage in STAGES:
+                if stage not in stages or stage in over_budget:
+                    row[stage] = None
+                    continue
+                if stage == "canvas.draw":
+                    draw_only()
+                row[stage] = _time(stages[stage], repeat)
+                if row[stage] > budget:
+                    over_budget.add(stage)
+            results[n] = row
+            print(f"{name} n={n}: " + "  ".join(f"{s} {_fmt(row[s])}" for s in STAGES), file=sys.stderr)
+    finally:
+        if root is not None:
+            root.destroy()
+    return results
+
+# ---------------- Report ----------------
+def _fmt(v: Optional[float]) -> str:
+    return "-" if v is None else f"{v * 1000:.1f}ms"
+
+def format_report(page: str, results: Dict[int, Dict[str, Optional[float]]], repeat: int) -> str:
+    lines = [f"== render benchmark: {page}  {time.strftime('%Y-%m-%d %H:%M:%S')}  "
+             f"python {platform.python_version()}  matplotlib {matplotlib.__version__}  "
+             f"median of {repeat}, ms (- = skipped)"]
+    lines.append(f"{'n':>8}" + "".join(f"{s:>18}" for s in STAGES))
+    for n, row in results.items():
+        lines.append(f"{n:>8}" + "".join(f"{'-' if row[s] is None else f'{row[s] * 1000:.2f}':>18}" for s in STAGES))
+    return "\n".join(lines) + "\n"
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Offscreen benchmark of the Gantt and table render paths.")
+    ap.add_argument("--pages", default="fcfs", help=f"comma-separated subset of {','.join(PAGES)}")
+    ap.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma-separated process counts")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--budget", type=float, default=60.0, help="skip larger sizes of a stage once one run exceeds this many seconds")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("-o", "--output", default=OUTPUT, help="file the report is appended to")
+    args = ap.parse_args(argv)
+
+    pages = [p for p in args.pages.replace(" ", "").split(",") if p]
+    bad = [p for p in pages if p not in PAGES]
+    if bad:
+        ap.error(f"unknown page(s): {', '.join(bad)}")
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    for page in pages:
+        report = format_report(page, bench_page(page, sizes, args.repeat, args.budget, args.seed), args.repeat)
+        print(report)
+        with open(args.output, "a") as f:
+            f.write(report + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
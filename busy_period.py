@@ -0,0 +1,175 @@
+#busy_period.py
+# Simulasi paralel satu workload raksasa dengan dekomposisi busy period. Untuk policy
+# work-conserving tanpa overhead, semua pekerjaan sebelum idle gap selesai sebelum gap itu,
+# apa pun urutannya; jadi potongan di antara idle gap bisa disimulasikan terpisah.
+# Titik potong dicari sekali jalan (NumPy): dengan S = cumsum(burst), completion FCFS
+#   C_i = S_i + max_{j<=i}(a_j - S_{j-1})  ->  C = S + maximum.accumulate(a - S_prev)
+# dan proses i memulai busy period baru kalau a_i >= C_{i-1} dan a_i > a_{i-1} (arrival yang
+# sama tidak pernah dipisah, supaya tie-break engine tidak berubah). Busy period dikelompokkan
+# jadi range kontigu, disimulasikan di worker pool lewat shared memory (shm.py), lalu hasilnya
+# disambung urut waktu.
+import argparse, sys
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import List, Optional, Tuple
+import numpy as np
+from instrument import Time
+from metrics import Metrics, metrics_from_arrays
+from pool import ENGINES, SimPool, discard_results, get_pool
+from shm import SharedWorkload, WorkloadDescriptor, attached, export_result, gantt_from_rows, import_result_arrays
+from workload import BURST_MODELS, WorkloadSpec, decode_workload, generate_workload, to_tuples
+
+# engine yang work-conserving dan tidak membawa state melewati idle gap
+SPLIT_ENGINES = ("fcfs", "sjf", "priority", "rr")
+
+# ---------------- Cuts ----------------
+def busy_period_starts(arrival: np.ndarray, burst: np.ndarray) -> np.ndarray:
+    # arrival terurut; -> indeks awal tiap busy period (selalu diawali 0). Dihitung dalam dtype
+    # input: timestamp int64 nanodetik di atas 2^53 tidak boleh dibulatkan lewat float64.
+    n = len(arrival)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    dtype = np.result_type(np.asarray(arrival).dtype, np.asarray(burst).dtype)
+    a = np.asarray(arrival, dtype=dtype)
+    b = np.asarray(burst, dtype=dtype)
+    s = np.cumsum(b)
+    c = s + np.maximum.accumulate(a - (s - b))
+    cut = np.flatnonzero((a[1:] >= c[:-1]) & (a[1:] > a[:-1])) + 1
+    return np.concatenate(([0], cut)).astype(np.int64)
+
+def plan_ranges(starts: np.ndarray, n: int, parts: int) -> List[Tuple[int, int]]:
+    # kelompokkan busy period jadi <= parts range [lo, hi) dengan jumlah proses kira-kira sama
+    if n == 0:
+        return []
+    targets = np.linspace(0, n, parts + 1)[1:-1]
+    idx = np.searchsorted(starts, targets)
+    bounds = sorted(set(starts[np.minimum(idx, len(starts) - 1)].tolist()) | {0}) + [n]
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+# ---------------- Worker side ----------------
+def run_range(name: str, wdesc: WorkloadDescriptor, lo: int, hi: int, kwargs: dict):
+    with attached(wdesc.pids) as raw:
+        pids = [p.decode() for p in raw[lo:hi].tolist()]
+    with attached(wdesc.cols) as cols:
+        tuples = decode_workload(pids, cols[lo:hi], with_priority=ENGINES[name][1])
+    procs, gantt, total_time = ENGINES[name][0](tuples, **kwargs)
+    return export_result(procs, gantt, total_time, pids)
+
+# ---------------- Driver ----------------
+@dataclass
+class SplitResult:
+    pids: list                     # urut arrival (baris encode_workload)
+    cols: np.ndarray               # arrival, burst, priority
+    times: np.ndarray              # start, completion per baris
+    gantt_rows: np.ndarray         # (m, 3) start, end, baris proses (-1 = CS, -2 = DISP)
+    total_time: Time
+    periods: int                   # jumlah busy period
+    ranges: List[Tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def gantt(self) -> List[tuple]:
+        # list (start, end, pid) dibangun hanya kalau diminta (mis. untuk digambar)
+        return gantt_from_rows(self.gantt_rows, self.pids)
+
+    def metrics(self) -> Metrics:
+        idx = self.gantt_rows[:, 2]
+        idx = idx[idx >= 0]
+        return metrics_from_arrays(self.cols[:, 0], self.cols[:, 1], self.times[:, 0], self.times[:, 1],
+                                   context_switches=int(np.count_nonzero(idx[1:] != idx[:-1])))
+
+def simulate_split(proc_tuples: list, engine: str = "fcfs", pool: Optional[SimPool] = None,
+                   parts: Optional[int] = None, workers: Optional[int] = None, **kwargs) -> SplitResult:
+    # hasil identik dengan menjalankan engine sekali pada workload yang sudah diurutkan arrival.
+    # pool: pool milik caller; workers (tanpa pool): pool sementara sebesar itu untuk panggilan ini
+    if engine not in SPLIT_ENGINES:
+        raise ValueError(f"Engine {engine!r} cannot be split; use one of {', '.join(SPLIT_ENGINES)}")
+    if kwargs.get("cs_cost") or kwargs.get("dispatch_cost"):
+        raise ValueError("Busy-period splitting needs zero context-switch and dispatch cost")
+    if pool is None and workers is not None:
+        own = SimPool(workers)
+        try:
+            return simulate_split(proc_tuples, engine, own, parts, **kwargs)
+        finally:
+            own.shutdown()
+    pool = pool or get_pool()
+    parts = parts or 4 * pool.workers
+    with SharedWorkload(proc_tuples) as wl:
+        n = len(wl.pids)
+        starts = busy_period_starts(wl.cols[:, 0], wl.cols[:, 1])
+        ranges = plan_ranges(starts, n, parts)
+        futures = []
+        claimed = 0
+        try:
+            futures = [pool.submit(run_range, engine, wl.descriptor, lo, hi, kwargs) for lo, hi in ranges]
+            times = np.empty((n, 2), dtype=wl.cols.dtype)
+            blocks = []
+            total_time = 0
+            for (lo, hi), f in zip(ranges, futures):
+                rdesc = f.result()
+                t, rows = import_result_arrays(rdesc)
+                claimed += 1
+                if t.dtype != times.dtype:
+                    times = times.astype(np.result_type(times.dtype, t.dtype))
+                times[lo:hi] = t
+                # indeks proses di hasil worker relatif ke range; geser ke baris global
+                idx = rows[:, 2]
+                idx[idx >= 0] += lo
+                blocks.append(rows)
+                total_time = rdesc.total_time
+        finally:
+            discard_results(futures[claimed:])
+        gantt_rows = np.concatenate(blocks) if blocks else np.empty((0, 3), dtype=times.dtype)
+        return SplitResult(wl.pids, wl.cols, times, gantt_rows, total_time, len(starts), ranges)
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Simulate one large workload in parallel by cutting it at idle gaps.")
+    ap.add_argument("-n", type=int, default=1000000)
+    ap.add_argument("--engine", choices=SPLIT_ENGINES, default="sjf")
+    ap.add_argument("--quantum", type=int, default=2)
+    ap.add_argument("--preemptive", action="store_true")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--parts", type=int, default=None, help="ranges to submit (default 4 x workers)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--rate", type=float, default=0.18)
+    ap.add_argument("--burst", choices=BURST_MODELS, default="pareto")
+    ap.add_argument("--burst-mean", type=float, default=5.0)
+    ap.add_argument("--check", action="store_true", help="also run serially and compare")
+    args = ap.parse_args(argv)
+
+    kwargs = {}
+    if args.engine == "rr":
+        kwargs["quantum"] = args.quantum
+    elif args.engine == "priority":
+        kwargs["preemptive"] = args.preemptive
+    with_priority = ENGINES[args.engine][1]
+    at, bt, pr = generate_workload(args.n, WorkloadSpec(rate=args.rate, burst=args.burst, burst_mean=args.burst_mean),
+                                   seed=args.seed)
+    tuples = to_tuples(at, bt, pr)
+    pool = SimPool(args.workers)
+    try:
+        pool.start()
+        t0 = perf_counter()
+        res = simulate_split(tuples, args.engine, pool, args.parts, **kwargs)
+        dt = perf_counter() - t0
+        largest = max(hi - lo for lo, hi in res.ranges) if res.ranges else 0
+        print(f"{args.n} processes, {res.periods} busy periods, {len(res.ranges)} ranges "
+              f"(largest {largest}), {pool.workers} workers: {dt:.2f}s")
+        print(res.metrics().summary_text())
+        if args.check:
+            rows = sorted(tuples, key=lambda t: t[1])
+            t0 = perf_counter()
+            procs, gantt, total_time = ENGINES[args.engine][0](rows if with_priority else [t[:3] for t in rows], **kwargs)
+            print(f"serial: {perf_counter() - t0:.2f}s")
+            done = {p.pid: (p.start_time, p.completion_time) for p in procs}
+            same = (total_time == res.total_time and gantt == res.gantt
+                    and all(done[pid] == tuple(row) for pid, row in zip(res.pids, res.times.tolist())))
+            print("identical to serial run" if same else "MISMATCH with serial run")
+            if not same:
+                return 1
+    finally:
+        pool.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#cfs.py
+# Halaman fair-share gaya CFS (engine di cfs_core.py).
+# Halaman memakai layout PriorityPage; kolom priority dibaca sebagai nilai nice (bobot CPU).
+from tkinter import *
+from typing import Optional
+from cfs_core import Process, simulate_cfs
+from instrument import SimStats
+from priority import PriorityPage, APP_BG
+from pool import get_pool
+from workload import parse_time
+
+# ---------------- CFSPage ----------------
+class CFSPage(PriorityPage):
+    PAGE_TITLE = "CFS Scheduler"
+    GANTT_TITLE = "3D Gantt (CFS)"
+    PNG_NAME = "gantt_cfs.png"
+
+    def __init__(self, parent, app=None):
+        super().__init__(parent, app=app)
+        # engine CFS hanya single-CPU dan selalu berbasis slice
+        self.smp_controls.pack_forget()
+        self.chk_preempt.pack_forget()
+
+    def build_params(self, left_frame):
+        prm = Frame(left_frame, bg=APP_BG)
+        prm.pack(pady=2, fill=X)
+        Label(prm, text="Target latency", bg=APP_BG).grid(row=0, column=0, padx=4, sticky=W)
+        self.entry_latency = Entry(prm, width=5); self.entry_latency.grid(row=0, column=1, padx=2)
+        self.entry_latency.insert(0, "6")
+        Label(prm, text="Min granularity", bg=APP_BG).grid(row=0, column=2, padx=4, sticky=W)
+        self.entry_gran = Entry(prm, width=5); self.entry_gran.grid(row=0, column=3, padx=2)
+        self.entry_gran.insert(0, "0.75")
+        Label(prm, text="CS cost", bg=APP_BG).grid(row=1, column=0, padx=4, sticky=W)
+        self.entry_cs = Entry(prm, width=5); self.entry_cs.grid(row=1, column=1, padx=2)
+        self.entry_cs.insert(0, "0")
+        Label(prm, text="Dispatch cost", bg=APP_BG).grid(row=1, column=2, padx=4, sticky=W)
+        self.entry_disp = Entry(prm, width=5); self.entry_disp.grid(row=1, column=3, padx=2)
+        self.entry_disp.insert(0, "0")
+
+    def read_params(self) -> dict:
+        params = self.read_overhead()
+        try:
+            latency = parse_time(self.entry_latency.get())
+            gran = parse_time(self.entry_gran.get())
+        except ValueError:
+            latency = gran = 0
+        if latency <= 0 or gran <= 0:
+            raise ValueError("Target latency and min granularity must be positive numbers.")
+        params.update(target_latency=latency, min_granularity=gran)
+        return params
+
+    def simulate(self, snapshot, params: dict, stats: Optional[SimStats], cores: int, per_core: bool):
+        return get_pool().simulate("cfs", snapshot, stats=stats, **params)
+
+# ---------------- standalone fallback ----------------
+def main_standalone():
+    root = Tk()
+    root.title("CFS Scheduler - Kelompok 4 AB")
+    root.geometry("1300x760")
+    CFSPage(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main_standalone()
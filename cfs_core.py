@@ -0,0 +1,177 @@
+#cfs_core.py
+# Engine fair-share gaya CFS (Completely Fair Scheduler) tanpa dependensi UI; dipakai cfs.py
+# dan worker pool. Proses runnable diurutkan menurut vruntime di heap (O(log n)); yang jalan
+# dikeluarkan dari heap seperti 'curr' di kernel. vruntime bertambah delta * NICE_0_WEIGHT / weight,
+# weight dari field priority yang dibaca sebagai nilai nice (angka kecil = bobot besar, tabel
+# sched_prio_to_weight Linux). Slice = period * weight / total weight runnable, dengan
+# period = max(target_latency, nr_running * min_granularity). Proses baru mulai di min_vruntime.
+# Tidak ada wakeup preemption: arrival hanya ikut dipilih di akhir slice berikutnya.
+import heapq
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional
+from time import perf_counter
+from instrument import SimStats, Time, CS_PID, DISPATCH_PID
+
+# nice -20 .. 19 -> weight (kernel/sched/core.c); tiap langkah nice ~10% CPU
+PRIO_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+
+def weight_of(priority: int) -> int:
+    # priority dipakai langsung sebagai nice, di-clamp ke -20..19
+    return PRIO_TO_WEIGHT[min(19, max(-20, priority)) + 20]
+
+# ---------------- Data class ----------------
+@dataclass(order=True)
+class Process:
+    sort_index: tuple = field(init=False, repr=False)
+    pid: str
+    arrival: Time
+    burst: Time
+    priority: int
+    remaining: Time = field(init=False)
+    weight: int = field(init=False)
+    vruntime: float = 0.0
+    start_time: Optional[Time] = None
+    completion_time: Optional[Time] = None
+    waiting_time: Optional[Time] = None
+    turnaround_time: Optional[Time] = None
+
+    def __post_init__(self):
+        self.remaining = self.burst
+        self.weight = weight_of(self.priority)
+        self.sort_index = (self.arrival, self.pid)
+
+# ---------------- Scheduling logic ----------------
+def simulate_cfs(proc_tuples: List[Tuple[str,Time,Time,int]], target_latency: Time = 6, min_granularity: Time = 0.75,
+                 stats: Optional[SimStats] = None, cs_cost: Time = 0, dispatch_cost: Time = 0):
+    if stats is not None:
+        t0 = perf_counter()
+    if target_latency <= 0 or min_granularity <= 0:
+        raise ValueError("target_latency and min_granularity must be positive")
+    procs = [Process(pid, at, bt, pr) for (pid, at, bt, pr) in proc_tuples]
+    procs_sorted = sorted(procs, key=lambda p: (p.arrival, p.pid))
+    n = len(procs)
+    if n == 0:
+        return procs, [], 0
+    time_now = 0
+    completed = 0
+    # heap (vruntime, seq, proses); seq memutus seri secara FIFO. Proses yang jalan tidak di heap.
+    rq: List[tuple] = []
+    rq_weight = 0            # total weight proses di heap
+    seq = 0
+    min_vruntime = 0.0
+    arrival_idx = 0
+    cur = None
+    run_start = 0            # awal akuntansi vruntime cur (update_curr)
+    gantt_marks = []
+
+    def update_curr(t):
+        # tambahkan runtime cur sejak run_start ke vruntime, lalu majukan min_vruntime (monoton)
+        nonlocal run_start, min_vruntime
+        if cur is not None:
+            cur.vruntime += (t - run_start) * NICE_0_WEIGHT / cur.weight
+            run_start = t
+        v = cur.vruntime if cur is not None else None
+        if rq and (v is None or rq[0][0] < v):
+            v = rq[0][0]
+        if v is not None and v > min_vruntime:
+            min_vruntime = v
+
+    def enqueue(p):
+        nonlocal seq, rq_weight
+        heapq.heappush(rq, (p.vruntime, seq, p))
+        seq += 1
+        rq_weight += p.weight
+
+    def add_arrivals(t):
+        nonlocal arrival_idx
+        if arrival_idx < n and procs_sorted[arrival_idx].arrival <= t:
+            update_curr(t)
+        while arrival_idx < n and procs_sorted[arrival_idx].arrival <= t:
+            p = procs_sorted[arrival_idx]
+            p.vruntime = min_vruntime
+            enqueue(p)
+            arrival_idx += 1
+
+    add_arrivals(time_now)
+    last_pid = None
+    if stats is not None:
+        t1 = perf_counter()
+
+    while completed < n:
+        if not rq:
+            time_now = procs_sorted[arrival_idx].arrival
+            add_arrivals(time_now)
+            continue
+        _, _, cur = heapq.heappop(rq)
+        rq_weight -= cur.weight
+        if last_pid != cur.pid:
+            # overhead: context switch kalau ganti proses, lalu dispatch cost (cur belum jalan)
+            if cs_cost and last_pid is not None:
+                gantt_marks.append((time_now, CS_PID))
+                time_now += cs_cost
+                run_start = time_now
+                add_arrivals(time_now)
+            if dispatch_cost:
+                gantt_marks.append((time_now, DISPATCH_PID))
+                time_now += dispatch_cost
+                run_start = time_now
+                add_arrivals(time_now)
+            gantt_marks.append((time_now, cur.pid))
+            last_pid = cur.pid
+        if cur.start_time is None:
+            cur.start_time = time_now
+        run_start = time_now
+        # ideal slice dari jumlah & bobot runnable saat dispatch (termasuk cur)
+        nr = len(rq) + 1
+        period = max(target_latency, nr * min_granularity)
+        slice_ = period * cur.weight / (rq_weight + cur.weight)
+        run = min(cur.remaining, slice_)
+        end = time_now + run
+        # arrival selama slice: catat vruntime cur di titik itu supaya min_vruntime benar
+        while arrival_idx < n and procs_sorted[arrival_idx].arrival < end:
+            add_arrivals(procs_sorted[arrival_idx].arrival)
+        time_now = end
+        update_curr(time_now)
+        if run == cur.remaining:
+            cur.remaining = 0
+            cur.completion_time = time_now
+            cur.turnaround_time = cur.completion_time - cur.arrival
+            cur.waiting_time = cur.turnaround_time - cur.burst
+            completed += 1
+        else:
+            cur.remaining -= run
+            enqueue(cur)
+        cur = None
+        add_arrivals(time_now)
+
+    if stats is not None:
+        t2 = perf_counter()
+    merged = []
+    if gantt_marks:
+        done_at = {p.pid: p.completion_time for p in procs}
+        for i, (s, pid) in enumerate(gantt_marks):
+            if i == 0:
+                merged.append([s, None, pid])
+            else:
+                # segmen berhenti saat proses selesai, jangan ikut menutupi idle gap
+                prev = merged[-1]
+                done = done_at.get(prev[2])
+                prev[1] = min(s, done) if done is not None else s
+                merged.append([s, None, pid])
+        merged[-1][1] = time_now
+    gantt = [(m[0], m[1], m[2]) for m in merged]
+
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=t2 - t1, merge=perf_counter() - t2)
+        stats.collect(procs, gantt, time_now)
+    return procs, gantt, time_now
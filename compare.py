@@ -0,0 +1,284 @@
+#compare.py
+# Mode perbandingan: satu workload dijalankan dengan FCFS, SJF, Priority, RR dan CFS sekaligus
+# di worker process, lalu metrik + Gantt ditampilkan berdampingan pada sumbu waktu yang sama.
+# Workload diurutkan dan di-encode sekali (kolom int64) ke shared memory; worker pool
+# (pool.py) hanya menerima descriptor, dan hasil kembali lewat shared memory juga.
+from tkinter import *
+from tkinter import ttk, messagebox, filedialog
+import threading
+from typing import List, Tuple
+import matplotlib
+try:
+    matplotlib.use("TkAgg")
+except Exception:
+    pass
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from metrics import metrics_from_arrays, count_switches
+from shm import SharedWorkload, import_result
+from pool import ALGORITHMS, discard_results, engine_args, get_pool, run_shared
+from instrument import OVERHEAD_PIDS
+from widgets import LANE_COLORS, OVERHEAD_COLOR
+from workload import parse_time
+
+# ---------------- Pool dispatch ----------------
+def compare_all(proc_tuples: list, params: dict, algorithms=ALGORITHMS) -> dict:
+    # -> {algo: (gantt, total_time, Metrics)}; dijalankan di worker pool persisten
+    pool = get_pool()
+    results = {}
+    with SharedWorkload(proc_tuples) as wl:
+        futures = []
+        claimed = 0
+        try:
+            for algo in algorithms:
+                name, kwargs = engine_args(algo, params)
+                futures.append((algo, pool.submit(run_shared, name, wl.descriptor, kwargs)))
+            for algo, f in futures:
+                rdesc = f.result()
+                times, gantt = import_result(rdesc, wl.pids)
+                claimed += 1
+                m = metrics_from_arrays(wl.cols[:, 0], wl.cols[:, 1], times[:, 0], times[:, 1],
+                                        context_switches=count_switches(gantt))
+                results[algo] = (gantt, rdesc.total_time, m)
+        finally:
+            # satu run gagal: segmen hasil run lain tetap harus di-unlink (/dev/shm)
+            discard_results([f for _, f in futures[claimed:]])
+    return results
+
+# ---------------- UI constants ----------------
+APP_BG = "#69259c"
+BAR_COLOR = "#fb47b2"
+TEXT_COLOR = "#ffddff"
+
+# ---------------- ComparePage ----------------
+class ComparePage(Frame):
+    def __init__(self, parent, app=None):
+        super().__init__(parent, bg=APP_BG)
+        self.pack(fill=BOTH, expand=True)
+        self.app = app
+
+        # Prepare matplotlib figure (2D, satu lane per algoritma)
+        self.fig = plt.Figure(figsize=(7,5), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.fig.patch.set_facecolor(APP_BG)
+
+        self.process_list: List[Tuple[str,int,int,int]] = []
+
+        # Layout: three columns
+        main_frame = Frame(self, bg=APP_BG)
+        main_frame.pack(fill=BOTH, expand=True, padx=8, pady=8)
+
+        left_frame = Frame(main_frame, bg=APP_BG, width=330)
+        left_frame.pack(side=LEFT, fill=Y, padx=6, pady=6)
+        left_frame.pack_propagate(False)
+
+        mid_frame = Frame(main_frame, bg=APP_BG, width=460)
+        mid_frame.pack(side=LEFT, fill=Y, padx=6, pady=6)
+        mid_frame.pack_propagate(False)
+
+        right_frame = Frame(main_frame, bg=APP_BG)
+        right_frame.pack(side=LEFT, fill=BOTH, expand=True, padx=6, pady=6)
+
+        # Left widgets
+        Label(left_frame, text="Compare Schedulers", font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
+
+        inp_frame = Frame(left_frame, bg=APP_BG)
+        inp_frame.pack(pady=6)
+        Label(inp_frame, text="Arrival", bg=APP_BG).grid(row=0, column=0, padx=4, pady=4)
+        self.entry_at = Entry(inp_frame, width=6); self.entry_at.grid(row=0, column=1, padx=4)
+        Label(inp_frame, text="Burst", bg=APP_BG).grid(row=0, column=2, padx=4, pady=4)
+        self.entry_bt = Entry(inp_frame, width=6); self.entry_bt.grid(row=0, column=3, padx=4)
+        Label(inp_frame, text="Priority", bg=APP_BG).grid(row=0, column=4, padx=4, pady=4)
+        self.entry_pr = Entry(inp_frame, width=6); self.entry_pr.grid(row=0, column=5, padx=4)
+
+        self.btn_add = Button(left_frame, text="➕ Add Process", bg=BAR_COLOR, fg="white", command=self.add_process)
+        self.btn_add.pack(fill=X, padx=12, pady=6)
+
+        prm_frame = Frame(left_frame, bg=APP_BG)
+        prm_frame.pack(pady=4, fill=X)
+        Label(prm_frame, text="RR quantum", bg=APP_BG).pack(side=LEFT, padx=4)
+        self.entry_q = Entry(prm_frame, width=4); self.entry_q.pack(side=LEFT, padx=4)
+        self.entry_q.insert(0, "2")
+        self.preempt_var = BooleanVar(value=False)
+        Checkbutton(prm_frame, text="Preemptive priority", variable=self.preempt_var, bg=APP_BG).pack(side=LEFT, padx=4)
+
+        ctrl_frame = Frame(left_frame, bg=APP_BG)
+        ctrl_frame.pack(pady=6, fill=X)
+        self.btn_start = Button(ctrl_frame, text="▶ Compare", bg="#f2d6ef", command=self.run_sim)
+        self.btn_start.pack(side=LEFT, padx=6)
+        self.btn_reset = Button(ctrl_frame, text="🔁 Reset", bg="#f2d6ef", command=self.reset_all)
+        self.btn_reset.pack(side=LEFT, padx=6)
+
+        self.btn_save = Button(left_frame, text="Save Gantt PNG", fg="white", bg="#fb47b2", command=self.save_gantt_png)
+        self.btn_save.pack(fill=X, padx=12, pady=6)
+
+        Label(left_frame, text="Results (per-algorithm)", bg=APP_BG, fg=TEXT_COLOR, font=("Segoe UI",11,"bold")).pack(pady=6)
+        res_cols = ("Algo","WT","WTp99","TAT","TATp99","RTp50","CPU%","CS")
+        self.res_tree = ttk.Treeview(left_frame, columns=res_cols, show="headings", height=6)
+        for c in res_cols:
+            self.res_tree.heading(c, text=c)
+            self.res_tree.column(c, width=38, anchor=CENTER)
+        self.res_tree.pack(fill=BOTH, expand=False, padx=8, pady=6)
+
+        self.status_label = Label(left_frame, text="", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR)
+        self.status_label.pack(pady=6)
+
+        # Middle: process list + back button
+        Label(mid_frame, text="Processes", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
+        cols = ("PID","Arrival","Burst","Priority")
+        self.tree = ttk.Treeview(mid_frame, columns=cols, show="headings", height=20)
+        for c,w in zip(cols, (80,80,80,80)):
+            self.tree.heading(c, text=c)
+            self.tree.column(c, width=w, anchor=CENTER)
+        self.tree.pack(fill=BOTH, expand=True, padx=6, pady=6)
+
+        mid_btn_frame = Frame(mid_frame, bg=APP_BG)
+        mid_btn_frame.pack(fill=X, pady=4)
+        self.btn_back = Button(mid_btn_frame, text="↩ Back", bg="#f2d6ef", command=self._on_back)
+        self.btn_back.pack(side=LEFT, padx=6)
+
+        # Right: Gantt lanes per algoritma
+        Label(right_frame, text="Gantt Comparison", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=6, pady=6)
+
+        self.load_sample()
+
+    # ----- helpers -----
+    def update_treeviews(self):
+        self.tree.delete(*self.tree.get_children())
+        for pid, at, bt, pr in self.process_list:
+            self.tree.insert("", END, values=(pid, at, bt, pr))
+
+    def add_process(self):
+        try:
+            at = parse_time(self.entry_at.get())
+            bt = parse_time(self.entry_bt.get())
+            pr = int(self.entry_pr.get() or 0)
+        except ValueError:
+            messagebox.showerror("Input Error", "Arrival and Burst must be numbers, Priority an integer.")
+            return
+        pid = f"P{len(self.process_list)+1}"
+        self.process_list.append((pid, at, bt, pr))
+        self.entry_at.delete(0, END); self.entry_bt.delete(0, END); self.entry_pr.delete(0, END)
+        self.update_treeviews()
+
+    def load_sample(self):
+        self.process_list = [("P1",0,4,2),("P2",1,2,1),("P3",2,6,3)]
+        self.update_treeviews()
+
+    def reset_all(self):
+        self.process_list = []
+        self.update_treeviews()
+        self.res_tree.delete(*self.res_tree.get_children())
+        self.status_label.config(text="")
+        self.ax.clear()
+        self.canvas.draw()
+
+    # ----- Gantt rendering -----
+    def render_gantt_lanes(self, results: dict):
+        ax = self.ax
+        ax.clear()
+        ax.set_facecolor(APP_BG)
+        color_of = {}
+        for lane, algo in enumerate(ALGORITHMS):
+            gantt = results[algo][0]
+            spans = []; colors = []
+            for seg in gantt:
+                spans.append((seg[0], seg[1] - seg[0]))
+                if seg[2] in OVERHEAD_PIDS:
+                    colors.append(OVERHEAD_COLOR)
+                else:
+                    colors.append(color_of.setdefault(seg[2], LANE_COLORS[len(color_of) % len(LANE_COLORS)]))
+            if spans:
+                ax.broken_barh(spans, (lane - 0.3, 0.6), facecolors=colors, edgecolor="#222222", linewidth=0.3)
+        ax.set_yticks(range(len(ALGORITHMS)))
+        ax.set_yticklabels(ALGORITHMS, color=TEXT_COLOR)
+        ax.invert_yaxis()
+        ax.set_xlabel("Time", color=TEXT_COLOR)
+        ax.tick_params(axis="x", colors=TEXT_COLOR)
+        ax.set_xlim(0, max([results[a][1] for a in ALGORITHMS] + [1]))
+        ax.set_title("Gantt (shared time axis)", color=TEXT_COLOR)
+        self.canvas.draw()
+
+    # ----- simulate -----
+    def run_sim(self):
+        if not self.process_list:
+            messagebox.showwarning("No processes", "Add at least one process first.")
+            return
+        try:
+            q = parse_time(self.entry_q.get())
+            if q <= 0: raise ValueError
+        except ValueError:
+            messagebox.showerror("Input Error", "Quantum must be a positive number.")
+            return
+        params = {"quantum": q, "preemptive": self.preempt_var.get()}
+        snapshot = self.process_list.copy()
+        self.btn_start.config(state=DISABLED)
+        self.btn_reset.config(state=DISABLED)
+        self.status_label.config(text="Running...")
+        def worker():
+            try:
+                results = compare_all(snapshot, params)
+            except Exception as e:
+                self.after(0, self.sim_failed, e)
+                return
+            self.after(0, self.update_after_sim, results)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def sim_failed(self, err):
+        messagebox.showerror("Error", f"Comparison failed: {err}")
+        self.status_label.config(text="")
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def update_after_sim(self, results: dict):
+        self.res_tree.delete(*self.res_tree.get_children())
+        for algo in ALGORITHMS:
+            m = results[algo][2]
+            self.res_tree.insert("", END, values=(algo, f"{m.wt.mean:.2f}", f"{m.wt.p99:.1f}", f"{m.tat.mean:.2f}",
+                                                  f"{m.tat.p99:.1f}", f"{m.rt.p50:.1f}", f"{m.cpu_util*100:.0f}",
+                                                  m.context_switches))
+        best = min(ALGORITHMS, key=lambda a: results[a][2].wt.mean)
+        self.status_label.config(text=f"Lowest avg WT: {best}")
+        self.render_gantt_lanes(results)
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def save_gantt_png(self):
+        p = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG","*.png")], initialfile="gantt_compare.png")
+        if not p:
+            return
+        try:
+            self.fig.savefig(p, dpi=150)
+            messagebox.showinfo("Saved", f"Gantt PNG saved to:\n{p}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save PNG: {e}")
+
+    # ----- back handling -----
+    def _on_back(self):
+        if getattr(self, "app", None):
+            try:
+                if hasattr(self.app, "_mode_page"):
+                    self.app._mode_page()
+                else:
+                    self.app._home_page()
+            except Exception:
+                pass
+        else:
+            top = self.winfo_toplevel()
+            try:
+                top.destroy()
+            except:
+                pass
+
+# ---------------- standalone fallback ----------------
+def main_standalone():
+    root = Tk()
+    root.title("Compare Schedulers - Kelompok 4 AB")
+    root.geometry("1300x760")
+    ComparePage(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main_standalone()
@@ -0,0 +1,228 @@
+#export.py
+# Export massal tanpa Tk: setiap workload CSV (format workload.py / Import CSV) atau cache .npz disimulasikan
+# lalu Gantt (PNG/SVG) dan tabel metrik (CSV) ditulis oleh worker pool. Setiap worker
+# memakai satu Figure Agg yang di-reuse, dan hanya file yang belum ada yang ditulis.
+#
+#   python export.py runs/ -o out/ --algo rr --quantum 4 --formats png,csv --workers 8
+import argparse, csv, os, sys
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from gantt_plot import draw_gantt_3d
+from metrics import compute_metrics
+from pool import ENGINES, SimPool
+from workload import parse_time, read_workload
+
+FORMATS = ("png", "svg", "csv")
+EXPORT_ALGORITHMS = ("fcfs", "sjf", "priority", "rr", "mlfq", "cfs", "lottery", "stride")
+
+# sama dengan tema halaman
+APP_BG = "#69259c"
+BAR_COLOR = "#fb47b2"
+TEXT_COLOR = "#ffddff"
+
+# ---------------- Jobs ----------------
+@dataclass
+class ExportJob:
+    src: str
+    algo: str
+    kwargs: dict
+    outputs: Dict[str, List[str]] = field(default_factory=dict)   # format -> path yang belum ada
+
+def output_names(inputs: List[str]) -> Dict[str, str]:
+    # nama dasar output per input = stem file. Kalau stem dipakai lebih dari satu input (a/run.csv
+    # dan b/run.csv, atau run.csv dan run.npz), path relatif ke direktori bersama plus ekstensi
+    # ikut masuk nama supaya output tidak saling menimpa.
+    by_stem: Dict[str, List[str]] = {}
+    for src in inputs:
+        by_stem.setdefault(Path(src).stem, []).append(src)
+    names = {}
+    for stem, group in by_stem.items():
+        if len(group) == 1:
+            names[group[0]] = stem
+            continue
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(src)) for src in group])
+        for src in group:
+            rel = Path(os.path.relpath(os.path.abspath(src), root))
+            names[src] = "_".join(part for part in (*rel.parent.parts, rel.stem, rel.suffix.lstrip(".")) if part)
+    seen: Dict[str, str] = {}
+    for src, name in names.items():
+        if name in seen:
+            raise ValueError(f"{seen[name]} and {src} would be exported to the same file name ({name})")
+        seen[name] = src
+    return names
+
+def output_paths(name: str, out_dir: str, algo: str) -> Dict[str, List[str]]:
+    stem = os.path.join(out_dir, f"{name}_{algo}")
+    return {"png": [stem + ".png"], "svg": [stem + ".svg"],
+            "csv": [stem + ".csv", stem + "_summary.csv"]}
+
+def plan_jobs(inputs: List[str], out_dir: str, algo: str, kwargs: dict, formats=FORMATS,
+              force: bool = False) -> Tuple[List[ExportJob], int]:
+    # -> (job yang masih punya output hilang, jumlah input yang sudah lengkap)
+    jobs = []
+    up_to_date = 0
+    names = output_names(inputs)
+    for src in inputs:
+        paths = output_paths(names[src], out_dir, algo)
+        missing = {fmt: paths[fmt] for fmt in formats
+                   if force or not all(os.path.exists(p) for p in paths[fmt])}
+        if missing:
+            jobs.append(ExportJob(src, algo, kwargs, missing))
+        else:
+            up_to_date += 1
+    return jobs, up_to_date
+
+def collect_inputs(paths: List[str], out_dir: Optional[str] = None) -> List[str]:
+    # direktori di-scan untuk *.csv dan *.npz; hasil export sendiri (kalau out_dir sama) dilewati
+    skip = os.path.realpath(out_dir) if out_dir else None
+    out = []
+    for p in paths:
+        if os.path.isdir(p):
+            if skip and os.path.realpath(p) == skip:
+                continue
+            out.extend(sorted(str(f) for ext in ("*.csv", "*.npz") for f in Path(p).glob(ext)))
+        else:
+            out.append(p)
+    # file yang disebut dua kali (langsung dan lewat direktorinya) cukup diexport sekali
+    unique, seen = [], set()
+    for p in out:
+        real = os.path.realpath(p)
+        if real not in seen:
+            seen.add(real)
+            unique.append(p)
+    return unique
+
+# ---------------- Worker side ----------------
+_FIG: Optional[Figure] = None
+_AX = None
+
+def _figure():
+    # satu Figure per worker process, dibuat saat job pertama lalu di-reuse
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG = Figure(figsize=(7,5), dpi=100)
+        FigureCanvasAgg(_FIG)
+        _AX = _FIG.add_subplot(111, projection="3d")
+    return _FIG, _AX
+
+def _atomic(path: str, write):
+    # tulis ke file sementara lalu rename, supaya run yang terputus tidak meninggalkan file setengah jadi
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def _write_tables(procs: list, metrics, per_process: str, summary: str):
+    def write_procs(tmp):
+        with open(tmp, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(("PID","AT","BT","ST","CT","TAT","WT"))
+            for p in procs:
+                w.writerow((p.pid, p.arrival, p.burst, p.start_time, p.completion_time,
+                            p.turnaround_time, p.waiting_time))
+    def write_summary(tmp):
+        with open(tmp, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(("metric","mean","p50","p90","p99","max"))
+            for name in ("wt", "tat", "rt"):
+                s = getattr(metrics, name)
+                w.writerow((name, s.mean, s.p50, s.p90, s.p99, s.max))
+            for name in ("n", "makespan", "busy_time", "overhead_time", "throughput", "cpu_util",
+                         "context_switches", "cs_rate"):
+                w.writerow((name, getattr(metrics, name), "", "", "", ""))
+    _atomic(per_process, write_procs)
+    _atomic(summary, write_summary)
+
+def export_one(job: ExportJob) -> Tuple[str, List[str]]:
+    fn, with_priority = ENGINES[job.algo]
+    tuples = read_workload(job.src)
+    if not with_priority:
+        tuples = [t[:3] for t in tuples]
+    procs, gantt, total_time = fn(tuples, **job.kwargs)
+    written = []
+    drawn = False
+    for fmt in ("png", "svg"):
+        if fmt in job.outputs:
+            fig, ax = _figure()
+            if not drawn:
+                drawn = True
+                fig.patch.set_facecolor(APP_BG)
+                draw_gantt_3d(ax, gantt, f"3D Gantt ({job.algo.upper()}) - {Path(job.src).stem}",
+                              APP_BG, BAR_COLOR, TEXT_COLOR, pids=[p.pid for p in procs], total_time=total_time)
+            path = job.outputs[fmt][0]
+            _atomic(path, lambda tmp: fig.savefig(tmp, format=fmt, dpi=150, facecolor=fig.get_facecolor()))
+            written.append(path)
+    if "csv" in job.outputs:
+        _write_tables(procs, compute_metrics(procs, gantt, total_time), *job.outputs["csv"])
+        written.extend(job.outputs["csv"])
+    return job.src, written
+
+# ---------------- Driver ----------------
+def export_all(jobs: List[ExportJob], workers: Optional[int] = None, progress=None) -> Tuple[int, List[Tuple[str, str]]]:
+    # -> (jumlah file ditulis, [(src, error)])
+    pool = SimPool(workers)
+    n_files = 0
+    errors = []
+    try:
+        futures = {pool.submit(export_one, job): job.src for job in jobs}
+        for done, f in enumerate(as_completed(futures), start=1):
+            try:
+                n_files += len(f.result()[1])
+            except Exception as e:
+                errors.append((futures[f], str(e)))
+            if progress:
+                progress(done, len(jobs))
+    finally:
+        pool.shutdown()
+    return n_files, errors
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless export of Gantt charts (PNG/SVG) and metric tables (CSV) for workload CSV files.")
+    ap.add_argument("inputs", nargs="+", help="workload CSV/.npz files or directories containing them")
+    ap.add_argument("-o", "--output", required=True, help="output directory")
+    ap.add_argument("--algo", choices=EXPORT_ALGORITHMS, default="fcfs")
+    ap.add_argument("--quantum", type=parse_time, default=2, help="RR / lottery / stride quantum")
+    ap.add_argument("--preemptive", action="store_true", help="preemptive priority")
+    ap.add_argument("--formats", type=str, default=",".join(FORMATS), help="comma-separated subset of png,svg,csv")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--force", action="store_true", help="rewrite files that already exist")
+    args = ap.parse_args(argv)
+
+    formats = tuple(f for f in args.formats.replace(" ", "").split(",") if f)
+    bad = [f for f in formats if f not in FORMATS]
+    if bad:
+        ap.error(f"unknown format(s): {', '.join(bad)}")
+    if args.quantum <= 0:
+        ap.error("--quantum must be positive")
+    kwargs = {}
+    if args.algo in ("rr", "lottery", "stride"):
+        kwargs["quantum"] = args.quantum
+    elif args.algo == "priority":
+        kwargs["preemptive"] = args.preemptive
+    os.makedirs(args.output, exist_ok=True)
+
+    try:
+        jobs, up_to_date = plan_jobs(collect_inputs(args.inputs, args.output), args.output, args.algo, kwargs,
+                                     formats, args.force)
+    except ValueError as e:
+        ap.error(str(e))
+    def progress(done, total):
+        if done == total or done % 100 == 0:
+            print(f"\r{done}/{total}", end="", file=sys.stderr, flush=True)
+    n_files, errors = export_all(jobs, args.workers, progress)
+    if jobs:
+        print(file=sys.stderr)
+    print(f"{len(jobs)} run(s) exported ({n_files} files), {up_to_date} already up to date, {len(errors)} failed")
+    for src, err in errors:
+        print(f"  {src}: {err}", file=sys.stderr)
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
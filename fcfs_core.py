@@ -0,0 +1,175 @@
+#fcfs_core.py
+# Engine FCFS tanpa dependensi UI (tkinter/matplotlib), supaya worker pool cukup
+# meng-import modul ini. fcfs.py meng-import ulang Process dan simulate_fcfs dari sini.
+# Mode paralel: C_i = max(C_{i-1}, a_i) + b_i adalah scan max-plus yang asosiatif. Tiap chunk
+# setara fungsi C_out = max(C_in + B, M) (B = total burst, M = completion terakhir kalau C_in = -inf);
+# worker menghitung (B, M) per chunk lewat shared memory, carry digabung berurutan (murah, satu
+# per chunk), lalu worker mengisi start/completion chunknya: C = S + max(carry, cummax(a - S_prev)).
+# Jalur array-in/array-out (tanpa objek Process / gantt): fcfs_scan untuk array biasa, atau
+# fcfs_scan_shared langsung di segmen shared memory milik caller (tanpa salinan sama sekali).
+import argparse, multiprocessing as mp, sys
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional
+from time import perf_counter
+import numpy as np
+from instrument import SimStats, Time
+from shm import ShmDescriptor, alloc_array, attached
+
+# ---------------- Data class ----------------
+@dataclass
+class Process:
+    pid: str
+    arrival: Time
+    burst: Time
+    remaining: Time = field(init=False)
+    start_time: Optional[Time] = None
+    completion_time: Optional[Time] = None
+    waiting_time: Optional[Time] = None
+    turnaround_time: Optional[Time] = None
+
+    def __post_init__(self):
+        self.remaining = self.burst
+
+# ---------------- Scheduling logic ----------------
+def simulate_fcfs(proc_tuples: List[Tuple[str,Time,Time]], stats: Optional[SimStats] = None):
+    # workload besar (tanpa butuh objek Process / gantt): pakai fcfs_scan / fcfs_scan_shared
+    if stats is not None:
+        t0 = perf_counter()
+    procs = [Process(pid, at, bt) for (pid, at, bt) in proc_tuples]
+    procs.sort(key=lambda p: p.arrival)
+    time_now = 0
+    gantt = []
+    if stats is not None:
+        t1 = perf_counter()
+
+    for p in procs:
+        if time_now < p.arrival:
+            time_now = p.arrival
+        p.start_time = time_now
+        gantt.append((time_now, time_now + p.burst, p.pid))
+        time_now += p.burst
+        p.completion_time = time_now
+        p.turnaround_time = p.completion_time - p.arrival
+        p.waiting_time = p.start_time - p.arrival
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=perf_counter() - t1)
+        stats.collect(procs, gantt, time_now)
+    return procs, gantt, time_now
+
+# ---------------- Parallel max-plus scan ----------------
+def _scan_chunk(a: np.ndarray, b: np.ndarray, carry=None):
+    # completion chunk dengan C_in = carry (None = -inf)
+    s = np.cumsum(b)
+    c = np.maximum.accumulate(a - (s - b))
+    if carry is not None:
+        np.maximum(c, carry, out=c)
+    c += s
+    return c
+
+def _chunk_summary(cols: ShmDescriptor, lo: int, hi: int):
+    # -> (B, M) untuk fungsi chunk C_out = max(C_in + B, M)
+    with attached(cols) as view:
+        a, b = view[lo:hi, 0], view[lo:hi, 1]
+        return b.sum().item(), _scan_chunk(a, b)[-1].item()
+
+def _chunk_fill(cols: ShmDescriptor, out: ShmDescriptor, lo: int, hi: int, carry):
+    with attached(cols) as view, attached(out) as res:
+        a, b = view[lo:hi, 0], view[lo:hi, 1]
+        c = _scan_chunk(a, b, carry)
+        res[lo:hi, 1] = c
+        res[lo:hi, 0] = c - b
+
+def fcfs_scan_shared(cols: ShmDescriptor, out: ShmDescriptor, workers: int, pool=None):
+    # cols (n, 2) arrival terurut + burst, out (n, 2) start + completion: dua segmen milik caller,
+    # diisi di tempat. Parent hanya menggabung carry (satu per chunk), tidak menyentuh data.
+    n = cols.shape[0]
+    if pool is None:
+        from pool import get_pool     # import lokal: pool.py meng-import modul ini
+        pool = get_pool()
+    bounds = np.linspace(0, n, workers + 1).astype(np.int64).tolist()
+    ranges = [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+    summaries = [f.result() for f in [pool.submit(_chunk_summary, cols, lo, hi) for lo, hi in ranges]]
+    carries, carry = [], 0
+    for total, last in summaries:
+        carries.append(carry)
+        carry = max(carry + total, last)
+    for f in [pool.submit(_chunk_fill, cols, out, lo, hi, cin) for (lo, hi), cin in zip(ranges, carries)]:
+        f.result()
+
+def fcfs_scan(arrival: np.ndarray, burst: np.ndarray, workers: Optional[int] = None, pool=None):
+    # arrival harus sudah terurut; -> (start, completion). Dengan workers > 1 kedua pass jalan
+    # paralel di worker pool (satu salinan masuk ke shared memory, satu keluar); di dalam
+    # worker (proses daemon) selalu satu chunk lokal.
+    n = len(arrival)
+    dtype = np.result_type(arrival.dtype, burst.dtype)
+    if not workers or workers <= 1 or n < 2 * workers or mp.current_process().daemon:
+        c = _scan_chunk(arrival.astype(dtype, copy=False), burst.astype(dtype, copy=False), 0)
+        return c - burst, c
+    shm_cols, d_cols = alloc_array((n, 2), dtype)
+    shm_out, d_out = alloc_array((n, 2), dtype)
+    try:
+        with attached(d_cols) as view:
+            view[:, 0] = arrival
+            view[:, 1] = burst
+        fcfs_scan_shared(d_cols, d_out, workers, pool)
+        with attached(d_out) as res:
+            start, completion = res[:, 0].copy(), res[:, 1].copy()
+    finally:
+        for shm in (shm_cols, shm_out):
+            shm.close()
+            shm.unlink()
+    return start, completion
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    from pool import SimPool
+    from workload import BURST_MODELS, WorkloadSpec, generate_workload
+    ap = argparse.ArgumentParser(description="FCFS start/completion times for a large generated workload via a parallel max-plus scan.")
+    ap.add_argument("-n", type=int, default=10000000)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--rate", type=float, default=0.18)
+    ap.add_argument("--burst", choices=BURST_MODELS, default="pareto")
+    ap.add_argument("--burst-mean", type=float, default=5.0)
+    ap.add_argument("--check", action="store_true", help="also run the single-chunk scan and compare")
+    args = ap.parse_args(argv)
+
+    at, bt, _ = generate_workload(args.n, WorkloadSpec(rate=args.rate, burst=args.burst, burst_mean=args.burst_mean),
+                                  seed=args.seed)
+    order = np.argsort(at, kind="stable")
+    dtype = np.result_type(at.dtype, bt.dtype)
+    pool = SimPool(args.workers)
+    shm_cols, d_cols = alloc_array((args.n, 2), dtype)
+    shm_out, d_out = alloc_array((args.n, 2), dtype)
+    try:
+        # workload ditulis langsung ke segmen; scan tidak membuat salinan lagi
+        with attached(d_cols) as view:
+            view[:, 0] = at[order]
+            view[:, 1] = bt[order]
+        del at, bt
+        pool.start()
+        t0 = perf_counter()
+        fcfs_scan_shared(d_cols, d_out, pool.workers, pool)
+        dt = perf_counter() - t0
+        with attached(d_cols) as view, attached(d_out) as res:
+            print(f"{args.n} processes, {pool.workers} workers: {dt:.2f}s, "
+                  f"makespan {res[-1, 1]}, avg WT {(res[:, 0] - view[:, 0]).mean():.2f}")
+            if args.check:
+                t0 = perf_counter()
+                s1, c1 = fcfs_scan(view[:, 0], view[:, 1])
+                print(f"single chunk: {perf_counter() - t0:.2f}s")
+                same = np.array_equal(res[:, 0], s1) and np.array_equal(res[:, 1], c1)
+                del s1, c1
+        if args.check:
+            print("identical" if same else "MISMATCH")
+            if not same:
+                return 1
+    finally:
+        pool.shutdown()
+        for shm in (shm_cols, shm_out):
+            shm.close()
+            shm.unlink()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+#gantt_plot.py
+# Gambar Gantt 3D ke sebuah Axes3D. Tidak bergantung pada tkinter, jadi bisa dipakai
+# halaman (TkAgg) maupun export headless (Agg).
+from typing import Optional
+from instrument import OVERHEAD_PIDS
+
+# ---------------- 3D Gantt ----------------
+LANE_COLORS = ["#fb47b2", "#47b2fb", "#b2fb47", "#fbb247", "#b247fb", "#47fbb2", "#fb4747", "#f2d6e4"]
+OVERHEAD_COLOR = "#888888"
+
+def draw_gantt_3d(ax, gantt_segments: list, title: str, bg: str, bar_color: str, text_color: str,
+                  pids: Optional[list] = None, total_time: int = 0):
+    ax.clear()
+    ax.set_facecolor(bg)
+    smp = bool(gantt_segments) and len(gantt_segments[0]) > 3
+    if smp:
+        # mode SMP: satu lane per core, warna per proses
+        n_lanes = max(seg[3] for seg in gantt_segments) + 1
+        labels = [f"CPU{c}" for c in range(n_lanes)]
+        color_of = {}
+        for seg in gantt_segments:
+            color_of.setdefault(seg[2], LANE_COLORS[len(color_of) % len(LANE_COLORS)])
+    else:
+        order = {}
+        for seg in gantt_segments:
+            order.setdefault(seg[2], len(order))
+        if not order and pids:
+            for pid in pids:
+                order.setdefault(pid, len(order))
+        labels = list(order)
+    xs=[]; ys=[]; zs=[]; dxs=[]; dys=[]; dzs=[]; colors=[]
+    for seg in gantt_segments:
+        start, end, pid = seg[0], seg[1], seg[2]
+        xs.append(start); ys.append(seg[3] if smp else order[pid]); zs.append(0)
+        dxs.append(end - start); dys.append(0.6); dzs.append(1)
+        if pid in OVERHEAD_PIDS:
+            colors.append(OVERHEAD_COLOR)
+        else:
+            colors.append(color_of[pid] if smp else bar_color)
+    if xs:
+        ax.bar3d(xs, ys, zs, dxs, dys, dzs, color=colors, shade=True, edgecolor="#222222", linewidth=0.2)
+    ax.set_yticks(list(range(len(labels))))
+    ax.set_yticklabels(labels)
+    ax.set_xlabel("Time")
+    ax.set_zlim(0,1.5)
+    ax.set_zlabel("")
+    ax.set_title(title, color=text_color)
+    ax.view_init(elev=20, azim=-60)
+    max_t = int(max([seg[1] for seg in gantt_segments] + [total_time, 1]))
+    step = max(1, max_t//10)
+    ax.set_xticks(range(0, max_t+1, step))
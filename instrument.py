@@ -0,0 +1,90 @@
+#instrument.py
+# Counter instrumentasi untuk simulate_*. Engine hanya menyentuh SimStats kalau
+# argumen stats diberikan; kalau None, loop dispatch tidak berubah sama sekali.
+# Counter dihitung dari gantt + procs setelah loop selesai (model ready queue logis),
+# jadi angkanya konsisten antar algoritma. Segmen bersambung milik pid yang sama di satu lane
+# (mis. slice RR berturut-turut tanpa proses lain, boleh diselingi overhead) dihitung satu run:
+# satu dispatch, dan preemption hanya kalau run itu berakhir sebelum proses selesai.
+# queue_ops = operasi ready queue logis (masuk: arrival & preemption, keluar: dispatch).
+from dataclasses import dataclass, field
+from typing import Dict, List, Union
+
+# timestamp engine: int (termasuk int64 nanodetik) atau float; engine maju per event,
+# jadi ongkosnya tidak bergantung pada resolusi waktu
+Time = Union[int, float]
+
+# pid untuk segmen overhead di gantt (bukan proses)
+CS_PID = "CS"
+DISPATCH_PID = "DISP"
+OVERHEAD_PIDS = (CS_PID, DISPATCH_PID)
+
+@dataclass
+class SimStats:
+    dispatches: int = 0
+    preemptions: int = 0
+    context_switches: int = 0
+    ready_peak: int = 0
+    queue_ops: int = 0
+    idle_time: int = 0
+    overhead_time: int = 0
+    phases: Dict[str, float] = field(default_factory=dict)   # nama fase -> detik (wall clock)
+
+    def collect(self, procs: list, gantt: List[tuple], total_time: int, cores: int = 1):
+        done = {p.pid: p.completion_time for p in procs}
+        # (time, kind): kind 0 = masuk ready queue, 1 = keluar (dispatch); masuk diproses duluan
+        events = [(p.arrival, 0) for p in procs]
+        busy = 0
+        overhead = 0
+        last_pid = {}     # per core (gantt SMP punya elemen ke-4 = core)
+        runs = []         # [pid, start, end] setelah segmen bersambung pid yang sama digabung
+        tail = {}         # lane -> (indeks run terakhir, waktu aktivitas terakhir di lane itu)
+        for seg in gantt:
+            start, end, pid = seg[0], seg[1], seg[2]
+            lane = seg[3] if len(seg) > 3 else 0
+            t = tail.get(lane)
+            if pid not in done:
+                if pid in OVERHEAD_PIDS:
+                    overhead += end - start
+                    if t is not None and t[1] == start:
+                        tail[lane] = (t[0], end)
+                continue
+            busy += end - start
+            if t is not None and t[1] == start and runs[t[0]][0] == pid:
+                # proses yang sama jalan terus di lane ini: bukan dispatch / preemption baru
+                runs[t[0]][2] = end
+                tail[lane] = (t[0], end)
+                continue
+            if lane in last_pid and pid != last_pid[lane]:
+                self.context_switches += 1
+            last_pid[lane] = pid
+            runs.append([pid, start, end])
+            tail[lane] = (len(runs) - 1, end)
+        for pid, start, end in runs:
+            self.dispatches += 1
+            events.append((start, 1))
+            if end != done[pid]:
+                self.preemptions += 1
+                events.append((end, 0))
+        self.queue_ops += len(events)
+        self.overhead_time += overhead
+        self.idle_time += max(0, total_time * cores - busy - overhead)
+        events.sort()
+        cur = 0
+        for _, kind in events:
+            cur += -1 if kind else 1
+            if cur > self.ready_peak:
+                self.ready_peak = cur
+
+    def summary_lines(self) -> List[str]:
+        lines = [
+            f"Dispatches: {self.dispatches}",
+            f"Preemptions: {self.preemptions}",
+            f"Context switches: {self.context_switches}",
+            f"Ready-queue peak: {self.ready_peak}",
+            f"Queue ops: {self.queue_ops}",
+            f"Idle time: {self.idle_time}",
+            f"Overhead time: {self.overhead_time}",
+        ]
+        for name, secs in self.phases.items():
+            lines.append(f"{name}: {secs * 1000:.3f} ms")
+        return lines
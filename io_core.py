@@ -0,0 +1,248 @@
+#io_core.py
+# Engine CPU / I-O burst (discrete event) tanpa dependensi UI. Tiap proses bergantian CPU dan
+# I/O (workload.IOWorkload). Proses yang selesai satu burst CPU pindah ke blocked set; selesainya
+# I/O dijadwalkan di timer heap, lalu proses kembali ke ready queue dengan burst CPU berikutnya.
+# I/O tiap proses berjalan paralel (tanpa antrian device), CPU satu core.
+# Event diproses urut waktu; pada waktu yang sama: CPU slice selesai, I/O selesai, arrival, lalu
+# proses yang quantum-nya habis masuk ke belakang ready queue (sama seperti rr_core).
+# Statistik: WT = total waktu di ready queue, CPU utilization, dan I/O overlap
+# (bagian waktu I/O berjalan yang tertutup oleh komputasi CPU).
+import argparse, heapq, sys
+from collections import deque
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import List, Tuple
+import numpy as np
+from instrument import Time
+from metrics import Metrics, metrics_from_arrays
+from workload import (BURST_MODELS, IOWorkload, WorkloadSpec, generate_io_workload, read_io_workload)
+
+IO_ALGORITHMS = ("fcfs", "sjf", "priority", "rr")
+INF = float("inf")
+
+# ---------------- Result ----------------
+@dataclass
+class IOResult:
+    algorithm: str
+    metrics: Metrics
+    total_time: Time = 0
+    cpu_bursts: int = 0
+    io_bursts: int = 0
+    io_busy: Time = 0          # waktu dengan >= 1 proses di I/O
+    overlap: Time = 0          # waktu CPU sibuk sekaligus ada I/O berjalan
+    preemptions: int = 0
+    ready_peak: int = 0
+    blocked_peak: int = 0
+    gantt: List[Tuple[Time, Time, str]] = field(default_factory=list)
+    gantt_truncated: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def overlap_ratio(self) -> float:
+        return self.overlap / self.io_busy if self.io_busy else 0.0
+
+    def summary_text(self) -> str:
+        m = self.metrics
+        return "\n".join([
+            f"{self.algorithm.upper()}  {m.n} processes, {self.cpu_bursts} CPU + {self.io_bursts} I/O bursts",
+            m.summary_text(),
+            f"I/O busy {self.io_busy:g}  overlap {self.overlap_ratio * 100:.1f}%  "
+            f"preemptions {self.preemptions}  ready peak {self.ready_peak}  blocked peak {self.blocked_peak}",
+        ])
+
+# ---------------- Scheduling logic ----------------
+def simulate_io(wl: IOWorkload, algorithm: str = "fcfs", quantum: Time = 2, preemptive: bool = False,
+                gantt_limit: int = 10000) -> IOResult:
+    # algorithm: fcfs / rr (quantum) / sjf (burst CPU berikutnya; preemptive = SRTF) /
+    # priority (angka kecil = tinggi). Kunci SJF/priority dipakai per burst, bukan per proses.
+    t0 = perf_counter()
+    if algorithm not in IO_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if algorithm == "rr" and quantum <= 0:
+        raise ValueError("quantum must be positive")
+    n = len(wl)
+    # list Python: akses skalar jauh lebih cepat daripada indexing NumPy
+    arrival = wl.arrival.tolist()
+    prio = wl.priority.tolist()
+    offsets = wl.offsets.tolist()
+    bursts = wl.bursts.tolist()
+    pids = wl.pids
+    order = sorted(range(n), key=lambda i: arrival[i])
+    pos = offsets[:-1]                 # indeks burst CPU yang sedang/akan dijalankan per proses
+    rem = [0] * n                      # sisa burst CPU sekarang
+    start = [None] * n
+    completion = [0] * n
+    ready_seq = [0] * n                # urutan masuk ready queue; dipertahankan saat preempt
+    res = IOResult(algorithm, Metrics())
+
+    heap_ready = algorithm in ("sjf", "priority")
+    ready = [] if heap_ready else deque()
+    timers: List[tuple] = []           # (waktu selesai I/O, seq, proses)
+    blocked = 0
+    seq = 0
+    next_arr = 0
+    done = 0
+    t = 0
+    cur = None
+    slice_start = slice_end = 0
+    last = None
+    busy = io_busy = overlap = 0
+    gantt = res.gantt
+
+    def key(i):
+        return rem[i] if algorithm == "sjf" else prio[i]
+
+    def enqueue(i, keep_seq=False):
+        nonlocal seq
+        if heap_ready:
+            # proses yang di-preempt tetap di depan proses lain dengan kunci sama
+            if not keep_seq:
+                ready_seq[i] = seq
+                seq += 1
+            heapq.heappush(ready, (key(i), ready_seq[i], i))
+        else:
+            ready.append(i)
+        if len(ready) > res.ready_peak:
+            res.ready_peak = len(ready)
+
+    def record(i, s, e):
+        if e <= s:
+            return
+        if gantt and gantt[-1][2] == pids[i] and gantt[-1][1] == s:
+            gantt[-1] = (gantt[-1][0], e, pids[i])
+        elif len(gantt) < gantt_limit:
+            gantt.append((s, e, pids[i]))
+        else:
+            res.gantt_truncated = True
+
+    while done < n:
+        t_next = slice_end if cur is not None else INF
+        if timers and timers[0][0] < t_next:
+            t_next = timers[0][0]
+        if next_arr < n and arrival[order[next_arr]] < t_next:
+            t_next = arrival[order[next_arr]]
+        # akumulasi [t, t_next): status CPU / blocked konstan di interval ini
+        dt = t_next - t
+        if cur is not None:
+            busy += dt
+            if blocked:
+                overlap += dt
+        if blocked:
+            io_busy += dt
+        t = t_next
+
+        # 1. CPU slice selesai (burst habis atau quantum RR habis)
+        expired = None
+        if cur is not None and slice_end == t:
+            i = cur
+            cur = None
+            record(i, slice_start, t)
+            rem[i] -= t - slice_start
+            if rem[i] > 0:
+                expired = i                             # quantum RR habis
+                res.preemptions += 1
+            else:
+                res.cpu_bursts += 1
+                p = pos[i]
+                if p + 1 < offsets[i + 1]:
+                    # masuk I/O, lanjut ke burst CPU berikutnya setelah timer
+                    pos[i] = p + 2
+                    heapq.heappush(timers, (t + bursts[p + 1], seq, i))
+                    seq += 1
+                    blocked += 1
+                    res.io_bursts += 1
+                    if blocked > res.blocked_peak:
+                        res.blocked_peak = blocked
+                else:
+                    completion[i] = t
+                    done += 1
+        # 2. I/O selesai
+        while timers and timers[0][0] <= t:
+            i = heapq.heappop(timers)[2]
+            blocked -= 1
+            rem[i] = bursts[pos[i]]
+            enqueue(i)
+        # 3. arrival
+        while next_arr < n and arrival[order[next_arr]] <= t:
+            i = order[next_arr]
+            next_arr += 1
+            rem[i] = bursts[pos[i]]
+            enqueue(i)
+        if expired is not None:
+            enqueue(expired)
+
+        # preemption: SRTF / priority preemptive, dibandingkan dengan sisa burst sekarang
+        if cur is not None and preemptive and heap_ready and ready:
+            left = rem[cur] - (t - slice_start)
+            cur_key = left if algorithm == "sjf" else prio[cur]
+            if ready[0][0] < cur_key:
+                i = cur
+                cur = None
+                record(i, slice_start, t)
+                rem[i] = left
+                enqueue(i, keep_seq=True)
+                res.preemptions += 1
+
+        # dispatch
+        if cur is None and ready:
+            i = heapq.heappop(ready)[2] if heap_ready else ready.popleft()
+            if start[i] is None:
+                start[i] = t
+            if last is not None and last != i:
+                res.metrics.context_switches += 1
+            last = i
+            cur = i
+            slice_start = t
+            slice_end = t + (min(rem[i], quantum) if algorithm == "rr" else rem[i])
+
+    # burst = total CPU + I/O, jadi WT = TAT - burst = total waktu di ready queue
+    offs = wl.offsets
+    demand = np.add.reduceat(wl.bursts, offs[:-1]) if n and len(wl.bursts) else np.zeros(n)
+    switches = res.metrics.context_switches
+    res.metrics = metrics_from_arrays(wl.arrival, demand, np.array(start, dtype=np.float64),
+                                      np.array(completion, dtype=np.float64), busy_time=busy,
+                                      context_switches=switches)
+    res.total_time = t
+    res.io_busy = io_busy
+    res.overlap = overlap
+    res.elapsed = perf_counter() - t0
+    return res
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Simulate alternating CPU / I-O burst workloads with an event-queue engine.")
+    ap.add_argument("workload", nargs="?", help=".npz or CSV pid,arrival,priority,bursts (default: generate one)")
+    ap.add_argument("--algos", default=",".join(IO_ALGORITHMS), help=f"comma-separated subset of {','.join(IO_ALGORITHMS)}")
+    ap.add_argument("--quantum", type=float, default=2)
+    ap.add_argument("--preemptive", action="store_true", help="SRTF for sjf, preemptive priority")
+    ap.add_argument("-n", type=int, default=10000, help="processes to generate")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--rate", type=float, default=0.05)
+    ap.add_argument("--burst", choices=BURST_MODELS, default="exponential")
+    ap.add_argument("--burst-mean", type=float, default=4.0)
+    ap.add_argument("--cycles", type=float, default=4.0, help="mean CPU bursts per process")
+    ap.add_argument("--io-mean", type=float, default=20.0)
+    args = ap.parse_args(argv)
+
+    algos = [a for a in args.algos.replace(" ", "").split(",") if a]
+    bad = [a for a in algos if a not in IO_ALGORITHMS]
+    if bad:
+        ap.error(f"unknown algorithm(s): {', '.join(bad)}")
+    quantum = int(args.quantum) if args.quantum == int(args.quantum) else args.quantum
+    try:
+        if args.workload:
+            wl = read_io_workload(args.workload)
+        else:
+            spec = WorkloadSpec(rate=args.rate, burst=args.burst, burst_mean=args.burst_mean)
+            wl = generate_io_workload(args.n, spec, args.seed, args.cycles, args.io_mean)
+    except (OSError, ValueError) as e:
+        ap.error(str(e))
+    for algo in algos:
+        res = simulate_io(wl, algo, quantum, args.preemptive, gantt_limit=0)
+        print(res.summary_text())
+        bursts = res.cpu_bursts + res.io_bursts
+        print(f"({res.elapsed:.2f}s, {bursts / res.elapsed if res.elapsed else 0:,.0f} bursts/s)\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
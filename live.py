@@ -0,0 +1,259 @@
+#live.py
+# Halaman live: engine mengikuti file jsonl yang terus bertambah (engine di live_core.py).
+# Tiap tick record baru di-admit, engine maju, lalu chart digeser: lane CPU menampilkan
+# retention window terakhir (warna per pid) dan grafik bawah menampilkan riwayat metrik rolling.
+# Semua buffer (segmen, proses selesai, riwayat) dibatasi, jadi halaman bisa dibiarkan jalan.
+from tkinter import *
+from tkinter import ttk, messagebox, filedialog
+from collections import deque
+from typing import Dict, Optional
+import matplotlib
+try:
+    matplotlib.use("TkAgg")
+except Exception:
+    pass
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
+from live_core import LIVE_ALGORITHMS, LiveEngine, LiveSession
+from widgets import LANE_COLORS
+from workload import parse_time
+
+# ---------------- UI constants ----------------
+APP_BG = "#69259c"
+BAR_COLOR = "#fb47b2"
+TEXT_COLOR = "#ffddff"
+TICK_MS = 200            # interval poll + redraw
+HISTORY = 600            # titik riwayat metrik (~2 menit pada TICK_MS)
+BAR_HEIGHT = 0.6
+
+# ---------------- LivePage ----------------
+class LivePage(Frame):
+    def __init__(self, parent, app=None):
+        super().__init__(parent, bg=APP_BG)
+        self.pack(fill=BOTH, expand=True)
+        self.app = app
+        self.session: Optional[LiveSession] = None
+        self._job = None
+        self._colors: Dict[str, str] = {}
+        self.hist_t = deque(maxlen=HISTORY)
+        self.hist_wt = deque(maxlen=HISTORY)
+        self.hist_q = deque(maxlen=HISTORY)
+
+        main_frame = Frame(self, bg=APP_BG)
+        main_frame.pack(fill=BOTH, expand=True, padx=8, pady=8)
+
+        left_frame = Frame(main_frame, bg=APP_BG, width=330)
+        left_frame.pack(side=LEFT, fill=Y, padx=6, pady=6)
+        left_frame.pack_propagate(False)
+
+        right_frame = Frame(main_frame, bg=APP_BG)
+        right_frame.pack(side=LEFT, fill=BOTH, expand=True, padx=6, pady=6)
+
+        # Left widgets
+        Label(left_frame, text="Live Scheduler", font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
+
+        src_frame = Frame(left_frame, bg=APP_BG)
+        src_frame.pack(pady=4, fill=X)
+        Label(src_frame, text="Workload (.jsonl, - = stdin)", bg=APP_BG).pack(anchor=W, padx=4)
+        self.entry_path = Entry(src_frame, width=30); self.entry_path.pack(side=LEFT, padx=4)
+        Button(src_frame, text="...", bg="#f2d6ef", command=self.browse).pack(side=LEFT, padx=2)
+
+        prm = Frame(left_frame, bg=APP_BG)
+        prm.pack(pady=4, fill=X)
+        Label(prm, text="Algorithm", bg=APP_BG).grid(row=0, column=0, padx=4, sticky=W)
+        self.algo_var = StringVar(value="fcfs")
+        ttk.Combobox(prm, textvariable=self.algo_var, values=LIVE_ALGORITHMS, state="readonly",
+                     width=8).grid(row=0, column=1, padx=2, sticky=W)
+        Label(prm, text="Quantum", bg=APP_BG).grid(row=0, column=2, padx=4, sticky=W)
+        self.entry_q = Entry(prm, width=5); self.entry_q.grid(row=0, column=3, padx=2)
+        self.entry_q.insert(0, "2")
+        Label(prm, text="Window", bg=APP_BG).grid(row=1, column=0, padx=4, sticky=W)
+        self.entry_window = Entry(prm, width=8); self.entry_window.grid(row=1, column=1, padx=2, sticky=W)
+        self.entry_window.insert(0, "200")
+        Label(prm, text="Speed", bg=APP_BG).grid(row=1, column=2, padx=4, sticky=W)
+        self.entry_speed = Entry(prm, width=5); self.entry_speed.grid(row=1, column=3, padx=2)   # kosong = ikuti file
+        self.preempt_var = BooleanVar(value=False)
+        Checkbutton(prm, text="Preemptive", variable=self.preempt_var, bg=APP_BG).grid(row=2, column=0, columnspan=2, sticky=W)
+        self.from_end_var = BooleanVar(value=False)
+        Checkbutton(prm, text="Skip existing lines", variable=self.from_end_var, bg=APP_BG).grid(row=2, column=2, columnspan=2, sticky=W)
+        Label(left_frame, text="(empty speed = follow the file's arrivals)", bg=APP_BG).pack(anchor=W, padx=4)
+
+        ctrl_frame = Frame(left_frame, bg=APP_BG)
+        ctrl_frame.pack(pady=6, fill=X)
+        self.btn_start = Button(ctrl_frame, text="▶ Start", bg="#f2d6ef", command=self.start)
+        self.btn_start.pack(side=LEFT, padx=6)
+        self.btn_stop = Button(ctrl_frame, text="⏹ Stop", bg="#f2d6ef", command=self.stop, state=DISABLED)
+        self.btn_stop.pack(side=LEFT, padx=6)
+        self.btn_back = Button(ctrl_frame, text="↩ Back", bg="#f2d6ef", command=self._on_back)
+        self.btn_back.pack(side=LEFT, padx=6)
+
+        self.status_label = Label(left_frame, text="", bg=APP_BG, font=("Segoe UI",9), fg=TEXT_COLOR,
+                                  justify=LEFT, wraplength=310)
+        self.status_label.pack(pady=4, anchor=W)
+        Label(left_frame, text="Rolling metrics (window)", bg=APP_BG, fg=TEXT_COLOR, font=("Segoe UI",11,"bold")).pack(pady=4)
+        self.avg_label = Label(left_frame, text="", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR, justify=LEFT)
+        self.avg_label.pack(pady=4, anchor=W)
+
+        # Right: lane CPU yang bergulir + riwayat metrik
+        Label(right_frame, text="Live Gantt", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
+        self.fig = plt.Figure(figsize=(7,5), dpi=100)
+        self.fig.patch.set_facecolor(APP_BG)
+        self.ax = self.fig.add_subplot(211)
+        self.ax_hist = self.fig.add_subplot(212)
+        self.bars = PolyCollection([], edgecolors="#222222", linewidths=0.3)
+        self.ax.add_collection(self.bars)
+        self.cursor = self.ax.axvline(0, color=TEXT_COLOR, linewidth=1)
+        self.line_wt, = self.ax_hist.plot([], [], color=BAR_COLOR, label="avg WT (window)")
+        self.ax_q = self.ax_hist.twinx()
+        self.line_q, = self.ax_q.plot([], [], color="#3c8dde", label="queued")
+        self._style_axes()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=6, pady=6)
+        self.canvas.draw()
+
+    def _style_axes(self):
+        for ax in (self.ax, self.ax_hist):
+            ax.set_facecolor(APP_BG)
+        self.ax.set_ylim(-0.5, 0.5)
+        self.ax.set_yticks([0])
+        self.ax.set_yticklabels(["CPU"])
+        self.ax.set_xlabel("Time")
+        self.ax_hist.set_xlabel("Time")
+        self.ax_hist.set_ylabel("avg WT", color=BAR_COLOR)
+        self.ax_q.set_ylabel("queued", color="#3c8dde")
+
+    # ----- input -----
+    def browse(self):
+        path = filedialog.askopenfilename(filetypes=[("JSON lines","*.jsonl"),("All files","*.*")])
+        if path:
+            self.entry_path.delete(0, END)
+            self.entry_path.insert(0, path)
+
+    def read_params(self) -> dict:
+        path = self.entry_path.get().strip()
+        if not path:
+            raise ValueError("Choose a workload file to follow.")
+        try:
+            quantum = parse_time(self.entry_q.get())
+            window = parse_time(self.entry_window.get())
+            speed = float(self.entry_speed.get()) if self.entry_speed.get().strip() else None
+        except ValueError:
+            raise ValueError("Quantum, window and speed must be numbers.")
+        if quantum <= 0 or window <= 0 or (speed is not None and speed <= 0):
+            raise ValueError("Quantum, window and speed must be positive.")
+        return dict(path=path, quantum=quantum, window=window, speed=speed)
+
+    # ----- run -----
+    def start(self):
+        try:
+            prm = self.read_params()
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.stop()
+        engine = LiveEngine(self.algo_var.get(), prm["quantum"], self.preempt_var.get(), prm["window"])
+        self.session = LiveSession(prm["path"], engine, prm["speed"], not self.from_end_var.get())
+        self._colors.clear()
+        for h in (self.hist_t, self.hist_wt, self.hist_q):
+            h.clear()
+        self.session.start()
+        self.btn_start.config(state=DISABLED)
+        self.btn_stop.config(state=NORMAL)
+        self._job = self.after(TICK_MS, self._tick)
+
+    def stop(self):
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        if self.session is not None:
+            self.session.stop()
+        self.btn_start.config(state=NORMAL)
+        self.btn_stop.config(state=DISABLED)
+
+    def _tick(self):
+        sess = self.session
+        try:
+            sess.poll()
+            if sess.finished:
+                sess.engine.drain()
+        except Exception as e:
+            self.stop()
+            messagebox.showerror("Error", f"Live simulation failed: {e}")
+            return
+        self.redraw()
+        if sess.finished:
+            self.stop()
+            self.status_label.config(text=sess.status_text() + "\nInput closed.")
+            return
+        self._job = self.after(TICK_MS, self._tick)
+
+    # ----- drawing -----
+    def _color(self, pid: str) -> str:
+        c = self._colors.get(pid)
+        if c is None:
+            if len(self._colors) > 4 * len(LANE_COLORS):
+                self._colors.clear()      # warna cukup siklus; jangan simpan semua pid selamanya
+            c = self._colors[pid] = LANE_COLORS[len(self._colors) % len(LANE_COLORS)]
+        return c
+
+    def redraw(self):
+        eng = self.session.engine
+        now = eng.time_now
+        lo = now - eng.retention
+        segs = [s for s in eng.segments if s[1] > lo]
+        h = BAR_HEIGHT / 2
+        self.bars.set_verts([[(s, -h), (s, h), (e, h), (e, -h)] for s, e, _ in segs])
+        self.bars.set_facecolors([self._color(pid) for _, _, pid in segs])
+        self.cursor.set_xdata([now, now])
+        self.ax.set_xlim(lo, now if now > lo else lo + 1)
+        running = eng.cur[0] if eng.cur is not None else "idle"
+        self.ax.set_title(f"Last {eng.retention:g} time units  (running: {running})", color=TEXT_COLOR)
+
+        m = eng.window_metrics()
+        self.hist_t.append(now)
+        self.hist_wt.append(m.wt.mean if m.n else 0.0)
+        self.hist_q.append(eng.queued)
+        self.line_wt.set_data(self.hist_t, self.hist_wt)
+        self.line_q.set_data(self.hist_t, self.hist_q)
+        for ax in (self.ax_hist, self.ax_q):
+            ax.relim()
+            ax.autoscale_view()
+        self.canvas.draw_idle()
+
+        self.status_label.config(text=self.session.status_text())
+        self.avg_label.config(text=m.summary_text() if m.n else "No completions in window yet.")
+
+    def destroy(self):
+        # pindah halaman dari launcher: hentikan tick & thread tailer dulu
+        self.stop()
+        super().destroy()
+
+    # ----- back handling -----
+    def _on_back(self):
+        self.stop()
+        if getattr(self, "app", None):
+            try:
+                if hasattr(self.app, "_mode_page"):
+                    self.app._mode_page()
+                else:
+                    self.app._home_page()
+            except Exception:
+                pass
+        else:
+            top = self.winfo_toplevel()
+            try:
+                top.destroy()
+            except:
+                pass
+
+# ---------------- standalone fallback ----------------
+def main_standalone():
+    root = Tk()
+    root.title("Live Scheduler - Kelompok 4 AB")
+    root.geometry("1300x760")
+    LivePage(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main_standalone()
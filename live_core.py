@@ -0,0 +1,380 @@
+#live_core.py
+# Mode live tanpa dependensi UI: workload dibaca dari file jsonl yang terus bertambah (atau pipe
+# stdin), proses baru masuk ke state engine yang sedang jalan tanpa restart, dan engine terus
+# mengeluarkan segmen gantt + metrik rolling. Memori dibatasi retention window (waktu simulasi)
+# dan batas jumlah item, jadi run bisa berjalan tanpa batas.
+# Satu record per baris: {"pid": "web#1", "arrival": 12, "burst": 3, "priority": 2}. pid dan
+# priority opsional; tanpa arrival, proses dianggap datang saat record dibaca (jam engine).
+# Jam engine: default mengikuti watermark (arrival terbesar yang sudah dibaca) -- semua yang
+# <= watermark sudah final karena file urut arrival. Dengan speed, jam maju speed unit per detik
+# (untuk file yang jarang ditulis); arrival yang tertinggal dari jam dihitung "late".
+# Urutan dispatch sama dengan streaming.py (FCFS/SJF/Priority/RR, tanpa overhead).
+import argparse, heapq, json, os, queue, sys, threading
+from collections import deque
+from time import perf_counter, sleep
+from typing import Deque, List, Optional
+import numpy as np
+from instrument import Time
+from metrics import Metrics, StreamingMetrics, metrics_from_arrays
+from workload import parse_time
+
+LIVE_ALGORITHMS = ("fcfs", "sjf", "priority", "rr")
+POLL_S = 0.2              # interval cek file saat tidak ada baris baru
+QUEUE_MAX = 50000         # record di antrian tailer -> engine (backpressure ke pembaca file)
+MAX_SEGMENTS = 20000      # batas keras segmen gantt yang disimpan
+MAX_DONE = 200000         # batas keras proses selesai di window metrik
+
+# ---------------- Records ----------------
+def parse_record(line: str, seq: int) -> Optional[tuple]:
+    # -> (pid, arrival | None, burst, priority); None untuk baris kosong
+    line = line.strip()
+    if not line:
+        return None
+    d = json.loads(line)
+    if not isinstance(d, dict):
+        raise ValueError("record must be a JSON object")
+    burst = parse_time(d["burst"])
+    if burst < 0:
+        raise ValueError("burst must be >= 0")
+    arrival = parse_time(d["arrival"]) if d.get("arrival") is not None else None
+    return (str(d.get("pid", f"L{seq}")), arrival, burst, int(d.get("priority", 0)))
+
+class FileTail(threading.Thread):
+    # thread pembaca: ikuti file seperti `tail -F` (termasuk truncate/rotasi) atau baca pipe ("-")
+    def __init__(self, path: str, from_start: bool = True, poll_s: float = POLL_S):
+        super().__init__(daemon=True)
+        self.path = path
+        self.from_start = from_start
+        self.poll_s = poll_s
+        self.records: "queue.Queue[tuple]" = queue.Queue(maxsize=QUEUE_MAX)
+        self.stop_event = threading.Event()
+        self.lines = 0
+        self.errors = 0
+        self.last_error = ""
+        self.eof = False          # pipe ditutup penulisnya
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _emit(self, line: str):
+        try:
+            rec = parse_record(line, self.lines)
+        except (ValueError, KeyError, TypeError) as e:
+            self.errors += 1
+            self.last_error = f"line {self.lines + 1}: {e}"
+            rec = None
+        self.lines += 1
+        while rec is not None and not self.stop_event.is_set():
+            try:
+                self.records.put(rec, timeout=self.poll_s)
+                return
+            except queue.Full:
+                continue
+
+    def run(self):
+        if self.path == "-":
+            for line in sys.stdin:
+                if self.stop_event.is_set():
+                    return
+                self._emit(line)
+            self.eof = True
+            return
+        f = None
+        partial = ""
+        while not self.stop_event.is_set():
+            if f is None:
+                try:
+                    f = open(self.path, "r", encoding="utf-8")
+                except FileNotFoundError:
+                    self.stop_event.wait(self.poll_s)
+                    continue
+                if not self.from_start:
+                    f.seek(0, os.SEEK_END)
+                    self.from_start = True   # setelah rotasi file baru dibaca dari awal
+                ino = os.fstat(f.fileno()).st_ino
+            chunk = f.readline()
+            if chunk:
+                partial += chunk
+                if partial.endswith("\n"):
+                    self._emit(partial)
+                    partial = ""
+                continue
+            # tidak ada data baru: cek truncate / rotasi sebelum tidur
+            try:
+                st = os.stat(self.path)
+                if st.st_ino != ino or st.st_size < f.tell():
+                    f.close()
+                    f, partial = None, ""
+                    continue
+            except FileNotFoundError:
+                pass
+            self.stop_event.wait(self.poll_s)
+        if f is not None:
+            f.close()
+
+    def drain(self, limit: int) -> List[tuple]:
+        out = []
+        try:
+            while len(out) < limit:
+                out.append(self.records.get_nowait())
+        except queue.Empty:
+            pass
+        return out
+
+# ---------------- Incremental engine ----------------
+class LiveEngine:
+    # item: [pid, arrival, burst, remaining, start, priority, seq]
+    def __init__(self, algorithm: str = "fcfs", quantum: Time = 2, preemptive: bool = False,
+                 retention: Time = 200):
+        if algorithm not in LIVE_ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {', '.join(LIVE_ALGORITHMS)}")
+        if algorithm == "rr" and quantum <= 0:
+            raise ValueError("quantum must be positive")
+        if retention <= 0:
+            raise ValueError("retention must be positive")
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.preemptive = preemptive and algorithm == "priority"
+        self.retention = retention
+        self.time_now: Time = 0
+        self.watermark: Time = 0
+        self.pending: List[tuple] = []          # heap (arrival, seq, item) yang belum masuk ready
+        self.ready = deque() if algorithm in ("fcfs", "rr") else []
+        self.cur: Optional[list] = None
+        self.slice_left: Time = 0
+        self.last_pid: Optional[str] = None
+        self.seq = 0
+        self.late = 0
+        self.segments: Deque[list] = deque(maxlen=MAX_SEGMENTS)   # [start, end, pid]
+        self.done: Deque[tuple] = deque(maxlen=MAX_DONE)          # (arrival, burst, start, completion)
+        self.window_switches: Deque[Time] = deque(maxlen=MAX_SEGMENTS)
+        self.total = StreamingMetrics()                           # sejak awal, memori konstan
+
+    # ----- input -----
+    def admit(self, rec: tuple):
+        pid, arrival, burst, priority = rec
+        if arrival is None:
+            arrival = self.time_now
+        elif arrival < self.time_now:
+            self.late += 1
+        item = [pid, arrival, burst, burst, None, priority, self.seq]
+        self.seq += 1
+        if arrival > self.watermark:
+            self.watermark = arrival
+        # selalu lewat heap pending: yang datang lebih awal tetap masuk ready queue lebih dulu
+        heapq.heappush(self.pending, (arrival, item[6], item))
+
+    def _enqueue(self, item: list):
+        if self.algorithm in ("fcfs", "rr"):
+            self.ready.append(item)
+        elif self.algorithm == "sjf":
+            heapq.heappush(self.ready, (item[2], item[6], item))
+        else:
+            heapq.heappush(self.ready, (item[5], item[1], item[0], item[6], item))
+
+    def _pop_ready(self) -> list:
+        if self.algorithm in ("fcfs", "rr"):
+            return self.ready.popleft()
+        return heapq.heappop(self.ready)[-1]
+
+    def _release(self, t: Time):
+        while self.pending and self.pending[0][0] <= t:
+            self._enqueue(heapq.heappop(self.pending)[2])
+
+    @property
+    def queued(self) -> int:
+        return len(self.ready) + len(self.pending) + (self.cur is not None)
+
+    # ----- output -----
+    def _emit(self, start: Time, end: Time, pid: str):
+        segs = self.segments
+        if segs and segs[-1][2] == pid and segs[-1][1] == start:
+            segs[-1][1] = end
+        else:
+            segs.append([start, end, pid])
+
+    def _complete(self, item: list):
+        row = (item[1], item[2], item[4], self.time_now)
+        self.done.append(row)
+        self.total.add(*row)
+
+    def _trim(self):
+        lo = self.time_now - self.retention
+        while self.segments and self.segments[0][1] < lo:
+            self.segments.popleft()
+        while self.done and self.done[0][3] < lo:
+            self.done.popleft()
+        while self.window_switches and self.window_switches[0] < lo:
+            self.window_switches.popleft()
+
+    # ----- simulation -----
+    def advance(self, until: Time, idle: bool = True):
+        # jalankan sampai waktu until; proses yang sedang jalan dilanjutkan di panggilan berikutnya.
+        # Keputusan tepat di titik until (dispatch, requeue, preempt) ditunda: record dengan
+        # arrival == until mungkin belum terbaca. idle=False: jam berhenti di akhir pekerjaan terakhir.
+        while True:
+            if self.cur is None:
+                if self.time_now >= until:
+                    break
+                self._release(self.time_now)
+                if not self.ready:
+                    nxt = self.pending[0][0] if self.pending else None
+                    if nxt is None or nxt >= until:
+                        if idle and until > self.time_now:
+                            self.time_now = until
+                        break
+                    self.time_now = max(self.time_now, nxt)
+                    continue
+                cur = self.cur = self._pop_ready()
+                self.slice_left = self.quantum
+                if self.last_pid is not None and cur[0] != self.last_pid:
+                    self.total.context_switches += 1
+                    self.window_switches.append(self.time_now)
+                self.last_pid = cur[0]
+                if cur[4] is None:
+                    cur[4] = self.time_now
+            cur = self.cur
+            # batas dibandingkan sebagai waktu absolut, supaya sisa float kecil tidak membuat jam macet
+            finish = end = self.time_now + cur[3]
+            slice_end = self.time_now + self.slice_left
+            if self.algorithm == "rr" and slice_end < end:
+                end = slice_end
+            if self.preemptive and self.pending and self.pending[0][0] < end:
+                end = max(self.pending[0][0], self.time_now)
+            stop = min(end, until)
+            if stop > self.time_now:
+                ran = stop - self.time_now
+                self._emit(self.time_now, stop, cur[0])
+                cur[3] -= ran
+                self.slice_left -= ran
+                self.time_now = stop
+            if stop >= finish:
+                cur[3] = 0
+            if stop >= slice_end:
+                self.slice_left = 0
+            if cur[3] <= 0:
+                cur[3] = 0
+                self._complete(cur)
+                self.cur = None
+            elif self.time_now >= until:
+                break
+            elif self.algorithm == "rr" and self.slice_left <= 0:
+                # arrival di akhir slice masuk antrian lebih dulu (seperti simulate_rr)
+                self._release(self.time_now)
+                self.ready.append(cur)
+                self.cur = None
+            elif self.preemptive and self.pending and self.pending[0][0] <= self.time_now:
+                self._release(self.time_now)
+                self._enqueue(cur)
+                self.cur = None
+        self._trim()
+
+    def drain(self):
+        # selesaikan semua yang sudah diterima (akhir input)
+        self.advance(float("inf"), idle=False)
+
+    # ----- rolling metrics -----
+    def busy_in_window(self) -> float:
+        lo = self.time_now - self.retention
+        return float(sum(min(e, self.time_now) - max(s, lo) for s, e, _ in self.segments if e > lo))
+
+    def window_metrics(self) -> Metrics:
+        if not self.done:
+            return Metrics()
+        arr = np.array(self.done, dtype=np.float64)
+        m = metrics_from_arrays(arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3],
+                                context_switches=len(self.window_switches))
+        # rate dan utilisasi relatif terhadap panjang window, bukan makespan proses di window
+        span = min(self.retention, self.time_now) or 1
+        m.throughput = m.n / span
+        m.cpu_util = self.busy_in_window() / span
+        m.cs_rate = len(self.window_switches) / span
+        return m
+
+    def status_text(self) -> str:
+        return (f"t={self.time_now:g}  watermark={self.watermark:g}  queued={self.queued}  "
+                f"done={self.total.n}  late={self.late}")
+
+# ---------------- Session ----------------
+class LiveSession:
+    # tailer + engine + jam. poll() dipanggil berkala (after() di UI, loop di CLI); tiap poll
+    # memproses paling banyak batch record supaya latensi per tick tetap terbatas
+    def __init__(self, path: str, engine: LiveEngine, speed: Optional[float] = None,
+                 from_start: bool = True, batch: int = 5000):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.engine = engine
+        self.speed = speed
+        self.batch = batch
+        self.tail = FileTail(path, from_start)
+        self._last = None
+
+    def start(self):
+        self.tail.start()
+        self._last = perf_counter()
+
+    def stop(self):
+        self.tail.stop()
+
+    def poll(self) -> int:
+        eng = self.engine
+        recs = self.tail.drain(self.batch)
+        for rec in recs:
+            eng.admit(rec)
+        now = perf_counter()
+        if self.speed is None:
+            target = eng.watermark
+        else:
+            target = eng.time_now + (now - self._last) * self.speed
+        self._last = now
+        eng.advance(target)
+        return len(recs)
+
+    @property
+    def finished(self) -> bool:
+        return self.tail.eof and self.tail.records.empty()
+
+    def status_text(self) -> str:
+        text = self.engine.status_text()
+        if self.tail.errors:
+            text += f"  bad lines={self.tail.errors} ({self.tail.last_error})"
+        return text
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Follow a growing jsonl workload file (or '-' for stdin) and print rolling metrics.")
+    ap.add_argument("path")
+    ap.add_argument("--algo", choices=LIVE_ALGORITHMS, default="fcfs")
+    ap.add_argument("--quantum", type=parse_time, default=2)
+    ap.add_argument("--preemptive", action="store_true")
+    ap.add_argument("--retention", type=parse_time, default=200, help="rolling window in time units")
+    ap.add_argument("--speed", type=float, default=None, help="time units per second (default: follow the file)")
+    ap.add_argument("--from-end", action="store_true", help="skip lines already in the file")
+    ap.add_argument("--interval", type=float, default=1.0, help="seconds between reports")
+    args = ap.parse_args(argv)
+
+    eng = LiveEngine(args.algo, args.quantum, args.preemptive, args.retention)
+    sess = LiveSession(args.path, eng, args.speed, not args.from_end)
+    sess.start()
+    next_report = perf_counter()
+    try:
+        while True:
+            if sess.poll() == 0:
+                if sess.finished:
+                    eng.drain()
+                    break
+                sleep(0.05)
+            if perf_counter() >= next_report:
+                print(sess.status_text())
+                print(eng.window_metrics().summary_text(), flush=True)
+                next_report = perf_counter() + args.interval
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sess.stop()
+    print(sess.status_text())
+    print("Total:\n" + eng.total.result().summary_text())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
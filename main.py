@@ -4,14 +4,33 @@
 # - FCFS
 # - SJF
 # - Priority
+# - CFS (fair share, vruntime)
+# - Lottery / Stride (proportional share per tenant)
 # - Round Robin
+# - MLFQ
+# - Compare (semua algoritma pada satu workload)
+# - Monte Carlo (banyak workload acak, interval kepercayaan)
+# - Real-Time (task periodik, EDF / RM)
+# - Live (mengikuti file workload yang terus bertambah)
+
+from pool import get_pool
+if __name__ == "__main__":
+    # worker pool di-fork sebelum tkinter/matplotlib di-import: worker hanya berisi modul engine
+    get_pool().start()
 
 import tkinter as tk
 from tkinter import messagebox, font as tkfont
 from fcfs import FCFSPage
 from sjf import SJFPage
 from priority import PriorityPage
+from cfs import CFSPage
+from share import LotteryPage, StridePage
 from rr import RRPage
+from mlfq import MLFQPage
+from compare import ComparePage
+from montecarlo import MonteCarloPage
+from realtime import RealTimePage
+from live import LivePage
 
 # Theme colors
 BG_TOP = "#1c0f3d"
@@ -204,21 +223,26 @@ class App(tk.Tk):
         btn_w = int(self.W * 0.18)
         btn_h = max(int(self.H * 0.08), 48)
         line_height = int(self.H * 0.03)
-        gap_y = line_height * 3
         cy_start = cy + 80
 
         # posisi kiri & kanan
         bx_left = (self.W // 2) - btn_w - 10
         bx_right = (self.W // 2) + 10
 
+        left_buttons = [("SJF", SJFPage), ("Priority", PriorityPage), ("CFS", CFSPage), ("MLFQ", MLFQPage), ("Monte Carlo", MonteCarloPage), ("Live", LivePage)]
+        right_buttons = [("FCFS", FCFSPage), ("Round Robin", RRPage), ("Lottery", LotteryPage), ("Stride", StridePage), ("Compare", ComparePage), ("Real-Time", RealTimePage)]
+
+        # jarak antar baris (dan tinggi tombol kalau perlu) menyesuaikan jumlah tombol (+1 baris untuk BACK)
+        rows = max(len(left_buttons), len(right_buttons)) + 1
+        btn_h = max(32, min(btn_h, (self.H - cy_start - 20) // rows - 8))
+        gap_y = min(line_height * 3, max(8, (self.H - cy_start - 20) // rows - btn_h))
+
         # tombol kiri
-        left_buttons = [("SJF", SJFPage), ("Priority", PriorityPage)]
         for i, (text, page) in enumerate(left_buttons):
             by = cy_start + i * (btn_h + gap_y)
             CanvasButton(canvas, bx_left, by, btn_w, btn_h, text, lambda p=page: self.show_page(p), font=(self.pixel_font_name, max(12, int(self.H * 0.03)), "bold"))
 
         # tombol kanan
-        right_buttons = [("FCFS", FCFSPage), ("Round Robin", RRPage)]
         for i, (text, page) in enumerate(right_buttons):
             by = cy_start + i * (btn_h + gap_y)
             CanvasButton(canvas, bx_right, by, btn_w, btn_h, text, lambda p=page: self.show_page(p), font=(self.pixel_font_name, max(12, int(self.H * 0.03)), "bold"))
@@ -255,3 +279,4 @@ class App(tk.Tk):
 if __name__ == "__main__":
     app = App()
     app.mainloop()
+    get_pool().shutdown(wait=False)
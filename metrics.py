@@ -0,0 +1,252 @@
+#metrics.py
+# Metrik hasil simulasi: persentil WT / TAT / RT, throughput, utilisasi CPU dan
+# context-switch rate. compute_metrics menghitung semuanya sekali jalan secara
+# vectorized (NumPy); StreamingMetrics adalah versi online dengan memori konstan
+# (Welford mean/std, kuantil dari histogram log-linear, max) untuk hasil yang terlalu besar
+# untuk disimpan; lihat streaming.py.
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from instrument import OVERHEAD_PIDS
+
+PERCENTILES = (50, 90, 99)
+
+# ---------------- Result ----------------
+@dataclass
+class Summary:
+    mean: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+    std: float = 0.0
+
+    def short(self) -> str:
+        return f"p50 {self.p50:.1f} p90 {self.p90:.1f} p99 {self.p99:.1f} max {self.max:.1f}"
+
+@dataclass
+class Metrics:
+    n: int = 0
+    wt: Optional[Summary] = None
+    tat: Optional[Summary] = None
+    rt: Optional[Summary] = None
+    makespan: float = 0.0
+    busy_time: float = 0.0
+    overhead_time: float = 0.0   # CPU time hilang untuk context switch / dispatch
+    throughput: float = 0.0      # proses selesai per unit waktu
+    cpu_util: float = 0.0        # 0..1
+    context_switches: int = 0
+    cs_rate: float = 0.0         # context switch per unit waktu
+
+    def __post_init__(self):
+        self.wt = self.wt or Summary()
+        self.tat = self.tat or Summary()
+        self.rt = self.rt or Summary()
+
+    def summary_text(self) -> str:
+        return "\n".join([
+            f"Avg WT: {self.wt.mean:.2f}    Avg TAT: {self.tat.mean:.2f}",
+            f"WT  {self.wt.short()}",
+            f"TAT {self.tat.short()}",
+            f"RT  {self.rt.short()}",
+            f"Thr {self.throughput:.3f}/u  CPU {self.cpu_util*100:.1f}%  CS {self.cs_rate:.3f}/u"
+            + (f"  Lost {self.overhead_time:g}" if self.overhead_time else ""),
+        ])
+
+# ---------------- Vectorized ----------------
+def metrics_from_arrays(arrival: np.ndarray, burst: np.ndarray, start: np.ndarray, completion: np.ndarray,
+                        busy_time: Optional[float] = None, context_switches: int = 0, cores: int = 1,
+                        overhead_time: float = 0.0) -> Metrics:
+    arrival = np.asarray(arrival, dtype=np.float64)
+    n = len(arrival)
+    if n == 0:
+        return Metrics()
+    burst = np.asarray(burst, dtype=np.float64)
+    start = np.asarray(start, dtype=np.float64)
+    completion = np.asarray(completion, dtype=np.float64)
+    # baris: WT, TAT, RT
+    tat = completion - arrival
+    m = np.stack((tat - burst, tat, start - arrival))
+    pct = np.percentile(m, PERCENTILES, axis=1)
+    means = m.mean(axis=1)
+    maxs = m.max(axis=1)
+    stds = m.std(axis=1, ddof=1) if n > 1 else np.zeros(3)
+    wt_s, tat_s, rt_s = (Summary(means[i], pct[0, i], pct[1, i], pct[2, i], maxs[i], stds[i]) for i in range(3))
+    if busy_time is None:
+        busy_time = float(burst.sum())
+    makespan = float(completion.max() - arrival.min())
+    return Metrics(
+        n=n, wt=wt_s, tat=tat_s, rt=rt_s,
+        makespan=makespan,
+        busy_time=busy_time,
+        overhead_time=overhead_time,
+        throughput=n / makespan if makespan > 0 else 0.0,
+        cpu_util=busy_time / (makespan * cores) if makespan > 0 else 0.0,
+        context_switches=context_switches,
+        cs_rate=context_switches / makespan if makespan > 0 else 0.0,
+    )
+
+def count_switches(gantt: Sequence[tuple]) -> int:
+    gantt = [seg for seg in gantt if seg[2] not in OVERHEAD_PIDS]
+    if len(gantt) < 2:
+        return 0
+    if len(gantt[0]) > 3:
+        # SMP: hitung per lane core
+        return sum(count_switches([seg[:3] for seg in gantt if seg[3] == c]) for c in {seg[3] for seg in gantt})
+    pids = np.array([seg[2] for seg in gantt])
+    return int(np.count_nonzero(pids[1:] != pids[:-1]))
+
+def compute_metrics(procs: list, gantt: Sequence[tuple], total_time: int, stats=None, cores: int = 1) -> Metrics:
+    done = [p for p in procs if p.completion_time is not None]
+    k = len(done)
+    arrival = np.fromiter((p.arrival for p in done), dtype=np.float64, count=k)
+    burst = np.fromiter((p.burst for p in done), dtype=np.float64, count=k)
+    start = np.fromiter((p.start_time for p in done), dtype=np.float64, count=k)
+    completion = np.fromiter((p.completion_time for p in done), dtype=np.float64, count=k)
+    switches = stats.context_switches if stats is not None else count_switches(gantt)
+    overhead = sum(seg[1] - seg[0] for seg in gantt if seg[2] in OVERHEAD_PIDS)
+    return metrics_from_arrays(arrival, burst, start, completion, context_switches=switches, cores=cores,
+                               overhead_time=overhead)
+
+# ---------------- Streaming (constant memory) ----------------
+class LogHistogram:
+    # histogram log-linear (gaya HDR): SUB bucket sama lebar per oktaf [2^k, 2^(k+1)) untuk
+    # MIN_EXP <= k < MAX_EXP, jadi waktu pecahan kecil maupun timestamp nanodetik sama-sama
+    # terwakili; bucket 0 untuk x < 2^MIN_EXP (termasuk 0). Jumlah bucket tetap; kuantil dari sini
+    # punya error relatif <= 1/SUB di seluruh rentang itu.
+    SUB = 16
+    MIN_EXP = -32
+    MAX_EXP = 64
+    OCTAVES = MAX_EXP - MIN_EXP
+
+    def __init__(self):
+        self.counts = [0] * (1 + self.SUB * self.OCTAVES)
+        self.total = 0
+
+    def _index(self, x: float) -> int:
+        if x < 2.0 ** self.MIN_EXP:
+            return 0
+        m, e = math.frexp(x)                 # x = m * 2^e, 0.5 <= m < 1
+        octave = e - 1 - self.MIN_EXP
+        if octave >= self.OCTAVES:
+            return len(self.counts) - 1
+        sub = min(int((m * 2 - 1) * self.SUB), self.SUB - 1)
+        return 1 + octave * self.SUB + sub
+
+    def _bounds(self, i: int) -> Tuple[float, float]:
+        if i == 0:
+            return 0.0, 2.0 ** self.MIN_EXP
+        octave, sub = divmod(i - 1, self.SUB)
+        base = 2.0 ** (octave + self.MIN_EXP)
+        width = base / self.SUB
+        low = base + sub * width
+        return low, low + width
+
+    def add(self, x: float):
+        self.counts[self._index(x)] += 1
+        self.total += 1
+
+    def quantile(self, q: float) -> float:
+        # interpolasi linear di dalam bucket yang memuat rank ke-q
+        if self.total == 0:
+            return 0.0
+        rank = q * (self.total - 1)
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c > rank:
+                low, high = self._bounds(i)
+                return low + (high - low) * (rank - seen + 0.5) / c
+            seen += c
+        return self._bounds(len(self.counts) - 1)[1]
+
+    def buckets(self) -> List[Tuple[float, float, int]]:
+        # -> [(low, high, count)] per oktaf, hanya yang tidak kosong (untuk ditampilkan)
+        out = []
+        if self.counts[0]:
+            out.append((*self._bounds(0), self.counts[0]))
+        for octave in range(self.OCTAVES):
+            c = sum(self.counts[1 + octave * self.SUB: 1 + (octave + 1) * self.SUB])
+            if c:
+                k = octave + self.MIN_EXP
+                out.append((2.0 ** k, 2.0 ** (k + 1), c))
+        return out
+
+class _StreamSummary:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0          # Welford: jumlah kuadrat deviasi
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.hist = LogHistogram()
+
+    def add(self, x: float):
+        self.count += 1
+        d = x - self.mean
+        self.mean += d / self.count
+        self.m2 += d * (x - self.mean)
+        if x > self.max:
+            self.max = x
+        if x < self.min:
+            self.min = x
+        self.hist.add(x)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def result(self) -> Summary:
+        if self.count == 0:
+            return Summary()
+        p50, p90, p99 = (min(self.max, max(self.min, self.hist.quantile(p / 100))) for p in PERCENTILES)
+        return Summary(self.mean, p50, p90, p99, self.max, self.variance ** 0.5)
+
+class StreamingMetrics:
+    # tambah hasil per proses (atau per chunk array) lalu buang; memori konstan
+    def __init__(self):
+        self.wt = _StreamSummary()
+        self.tat = _StreamSummary()
+        self.rt = _StreamSummary()
+        self.n = 0
+        self.busy_time = 0.0
+        self.first_arrival = float("inf")
+        self.last_completion = float("-inf")
+        self.context_switches = 0
+        self.overhead_time = 0.0
+        self.ready_peak = 0    # diisi engine streaming
+
+    def add(self, arrival, burst, start, completion):
+        tat = completion - arrival
+        self.wt.add(tat - burst)
+        self.tat.add(tat)
+        self.rt.add(start - arrival)
+        self.n += 1
+        self.busy_time += burst
+        if arrival < self.first_arrival:
+            self.first_arrival = arrival
+        if completion > self.last_completion:
+            self.last_completion = completion
+
+    def add_process(self, p):
+        self.add(p.arrival, p.burst, p.start_time, p.completion_time)
+
+    def add_arrays(self, arrival, burst, start, completion):
+        for row in zip(np.asarray(arrival).tolist(), np.asarray(burst).tolist(),
+                       np.asarray(start).tolist(), np.asarray(completion).tolist()):
+            self.add(*row)
+
+    def result(self) -> Metrics:
+        if self.n == 0:
+            return Metrics()
+        makespan = self.last_completion - self.first_arrival
+        return Metrics(
+            n=self.n, wt=self.wt.result(), tat=self.tat.result(), rt=self.rt.result(),
+            makespan=makespan,
+            busy_time=self.busy_time,
+            overhead_time=self.overhead_time,
+            throughput=self.n / makespan if makespan > 0 else 0.0,
+            cpu_util=self.busy_time / makespan if makespan > 0 else 0.0,
+            context_switches=self.context_switches,
+            cs_rate=self.context_switches / makespan if makespan > 0 else 0.0,
+        )
@@ -0,0 +1,65 @@
+#mlfq.py
+# Halaman Multilevel Feedback Queue (engine di mlfq_core.py).
+# Halaman memakai layout RRPage; hasil tetap (procs, gantt, total_time).
+from tkinter import *
+from typing import Optional
+from mlfq_core import Process, simulate_mlfq, default_quanta
+from instrument import SimStats
+from rr import RRPage, APP_BG
+from pool import get_pool
+
+# ---------------- MLFQPage ----------------
+class MLFQPage(RRPage):
+    PAGE_TITLE = "MLFQ Scheduler"
+    GANTT_TITLE = "3D Gantt (MLFQ)"
+    PNG_NAME = "gantt_mlfq.png"
+
+    def __init__(self, parent, app=None):
+        super().__init__(parent, app=app)
+        # engine MLFQ hanya single-CPU
+        self.smp_controls.pack_forget()
+
+    def build_params(self, left_frame):
+        prm = Frame(left_frame, bg=APP_BG)
+        prm.pack(anchor=W, padx=12, pady=4)
+        Label(prm, text="Levels", bg=APP_BG).grid(row=0, column=0, padx=2, sticky=W)
+        self.entry_levels = Entry(prm, width=4); self.entry_levels.grid(row=0, column=1, padx=2)
+        self.entry_levels.insert(0, "3")
+        Label(prm, text="Quanta", bg=APP_BG).grid(row=0, column=2, padx=2, sticky=W)
+        self.entry_quanta = Entry(prm, width=8); self.entry_quanta.grid(row=0, column=3, padx=2)
+        self.entry_quanta.insert(0, "2,4,8")
+        Label(prm, text="Boost", bg=APP_BG).grid(row=0, column=4, padx=2, sticky=W)
+        self.entry_boost = Entry(prm, width=4); self.entry_boost.grid(row=0, column=5, padx=2)
+        self.entry_boost.insert(0, "20")
+
+    def read_params(self) -> dict:
+        try:
+            levels = int(self.entry_levels.get())
+            quanta = [int(x) for x in self.entry_quanta.get().replace(" ", "").split(",") if x]
+            boost = int(self.entry_boost.get() or 0)
+        except ValueError:
+            raise ValueError("Levels, quanta and boost must be integers.")
+        if levels < 1:
+            raise ValueError("Levels must be a positive integer.")
+        if len(quanta) == 1 and levels > 1:
+            quanta = default_quanta(levels, quanta[0])
+        if len(quanta) != levels or any(q <= 0 for q in quanta):
+            raise ValueError("Give one positive quantum per level (e.g. 2,4,8).")
+        if boost < 0:
+            raise ValueError("Boost period must be >= 0 (0 = off).")
+        return {"levels": levels, "quanta": quanta, "boost": boost}
+
+    def simulate(self, snapshot, params: dict, stats: Optional[SimStats], cores: int, per_core: bool):
+        return get_pool().simulate("mlfq", snapshot, stats=stats, levels=params["levels"],
+                                   quanta=params["quanta"], boost=params["boost"])
+
+# ---------------- standalone fallback ----------------
+def main_standalone():
+    root = Tk()
+    root.title("MLFQ Scheduler - Kelompok 4 AB")
+    root.geometry("1300x760")
+    MLFQPage(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main_standalone()
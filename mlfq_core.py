@@ -0,0 +1,120 @@
+#mlfq_core.py
+# Multilevel Feedback Queue tanpa dependensi UI: satu deque O(1) per level + bitmap level
+# yang tidak kosong. Proses baru masuk level 0, turun satu level kalau jatah quantum di
+# level itu habis, dan semua proses dinaikkan lagi ke level 0 setiap periode boost.
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+from time import perf_counter
+from instrument import SimStats, Time
+
+# ---------------- Data class ----------------
+@dataclass
+class Process:
+    pid: str
+    arrival: Time
+    burst: Time
+    remaining: Time = field(init=False)
+    start_time: Optional[Time] = None
+    completion_time: Optional[Time] = None
+    waiting_time: Optional[Time] = None
+    turnaround_time: Optional[Time] = None
+    level: int = 0
+    used: Time = 0      # waktu CPU yang sudah dipakai di level sekarang
+
+    def __post_init__(self):
+        self.remaining = self.burst
+
+def default_quanta(levels: int, base: int = 2) -> List[int]:
+    return [base * (2 ** i) for i in range(levels)]
+
+# ---------------- Scheduling logic ----------------
+def simulate_mlfq(proc_tuples: List[Tuple[str,Time,Time]], levels: int = 3, quanta: Optional[Sequence[Time]] = None,
+                  boost: Time = 0, stats: Optional[SimStats] = None):
+    if levels < 1:
+        raise ValueError("levels must be >= 1")
+    quanta = list(quanta) if quanta is not None else default_quanta(levels)
+    if len(quanta) != levels or any(q <= 0 for q in quanta):
+        raise ValueError("quanta must have one positive value per level")
+    if stats is not None:
+        t0 = perf_counter()
+    procs = [Process(pid, at, bt) for (pid, at, bt) in proc_tuples]
+    order = sorted(procs, key=lambda p: p.arrival)
+    n = len(procs)
+    queues = [deque() for _ in range(levels)]
+    mask = 0            # bit i = 1 kalau queues[i] tidak kosong
+    gantt: List[Tuple[Time,Time,str]] = []
+    time_now = 0
+    completed = 0
+    arr_i = 0
+    next_boost = boost if boost > 0 else None
+    if stats is not None:
+        t1 = perf_counter()
+
+    while completed < n:
+        while arr_i < n and order[arr_i].arrival <= time_now:
+            queues[0].append(order[arr_i])
+            mask |= 1
+            arr_i += 1
+        if not mask:
+            # CPU idle: lompat ke arrival berikutnya
+            time_now = order[arr_i].arrival
+            if next_boost is not None and next_boost <= time_now:
+                next_boost = (time_now // boost + 1) * boost
+            continue
+
+        lvl = (mask & -mask).bit_length() - 1
+        q = queues[lvl]
+        cur = q.popleft()
+        if not q:
+            mask &= ~(1 << lvl)
+        if cur.start_time is None:
+            cur.start_time = time_now
+
+        end = time_now + min(cur.remaining, quanta[lvl] - cur.used)
+        # arrival baru masuk level 0 -> preempt proses dari level bawah
+        if lvl > 0 and arr_i < n and order[arr_i].arrival < end:
+            end = order[arr_i].arrival
+        if next_boost is not None and next_boost < end:
+            end = next_boost
+        gantt.append((time_now, end, cur.pid))
+        cur.remaining -= end - time_now
+        cur.used += end - time_now
+        time_now = end
+
+        # arrival masuk sebelum proses yang di-requeue (sama seperti simulate_rr)
+        while arr_i < n and order[arr_i].arrival <= time_now:
+            queues[0].append(order[arr_i])
+            mask |= 1
+            arr_i += 1
+
+        if next_boost is not None and time_now >= next_boost:
+            # priority boost: semua proses kembali ke level 0, urutan antar level dipertahankan
+            top = queues[0]
+            for l in range(1, levels):
+                top.extend(queues[l])
+                queues[l].clear()
+            for p in top:
+                p.level = 0
+                p.used = 0
+            mask = 1 if top else 0
+            cur.level = 0
+            cur.used = 0
+            next_boost = (time_now // boost + 1) * boost
+
+        if cur.remaining == 0:
+            cur.completion_time = time_now
+            cur.turnaround_time = cur.completion_time - cur.arrival
+            cur.waiting_time = cur.turnaround_time - cur.burst
+            completed += 1
+        else:
+            if cur.used >= quanta[cur.level]:
+                cur.level = min(cur.level + 1, levels - 1)
+                cur.used = 0
+            queues[cur.level].append(cur)
+            mask |= 1 << cur.level
+
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=perf_counter() - t1)
+        stats.collect(procs, gantt, time_now)
+    return procs, gantt, time_now
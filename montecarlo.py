@@ -0,0 +1,270 @@
+#montecarlo.py
+# Mode Monte Carlo: ribuan workload acak dari WorkloadSpec dijalankan dengan algoritma terpilih
+# di worker pool, lalu rata-rata + persentil metrik ditampilkan dengan interval kepercayaan.
+# Run berhenti sendiri saat interval sudah lebih sempit dari toleransi (lihat montecarlo_core).
+from tkinter import *
+from tkinter import ttk, messagebox
+import threading
+from time import perf_counter
+from typing import Dict, List
+import matplotlib
+try:
+    matplotlib.use("TkAgg")
+except Exception:
+    pass
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from montecarlo_core import MCResult, run_montecarlo
+from pool import ALGORITHMS
+from widgets import LANE_COLORS
+from workload import BURST_MODELS, WorkloadSpec, parse_time
+
+# ---------------- UI constants ----------------
+APP_BG = "#69259c"
+BAR_COLOR = "#fb47b2"
+TEXT_COLOR = "#ffddff"
+REDRAW_S = 0.25      # plot konvergensi digambar ulang paling sering tiap 250 ms
+
+# ---------------- MonteCarloPage ----------------
+class MonteCarloPage(Frame):
+    def __init__(self, parent, app=None):
+        super().__init__(parent, bg=APP_BG)
+        self.pack(fill=BOTH, expand=True)
+        self.app = app
+
+        self.fig = plt.Figure(figsize=(7,5), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.fig.patch.set_facecolor(APP_BG)
+
+        self.cancel = None
+        # riwayat konvergensi: algo -> [(replika, mean, half-width)]
+        self.history: Dict[str, List[tuple]] = {}
+        self._last_draw = 0.0
+
+        # Layout: three columns
+        main_frame = Frame(self, bg=APP_BG)
+        main_frame.pack(fill=BOTH, expand=True, padx=8, pady=8)
+
+        left_frame = Frame(main_frame, bg=APP_BG, width=330)
+        left_frame.pack(side=LEFT, fill=Y, padx=6, pady=6)
+        left_frame.pack_propagate(False)
+
+        mid_frame = Frame(main_frame, bg=APP_BG, width=460)
+        mid_frame.pack(side=LEFT, fill=Y, padx=6, pady=6)
+        mid_frame.pack_propagate(False)
+
+        right_frame = Frame(main_frame, bg=APP_BG)
+        right_frame.pack(side=LEFT, fill=BOTH, expand=True, padx=6, pady=6)
+
+        # Left widgets
+        Label(left_frame, text="Monte Carlo", font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
+
+        inp_frame = Frame(left_frame, bg=APP_BG)
+        inp_frame.pack(pady=6)
+        self.entries = {}
+        fields = [("Processes / workload", "n", "200"), ("Arrival rate", "rate", "0.2"),
+                  ("Burst mean", "burst_mean", "4"), ("RR quantum", "quantum", "2"),
+                  ("Tolerance (%)", "tol", "2"), ("Confidence (%)", "confidence", "95"),
+                  ("Max replicas", "max_replicas", "5000")]
+        for row, (label, key, default) in enumerate(fields):
+            Label(inp_frame, text=label, bg=APP_BG).grid(row=row, column=0, sticky=W, padx=4, pady=2)
+            e = Entry(inp_frame, width=8)
+            e.grid(row=row, column=1, padx=4, pady=2)
+            e.insert(0, default)
+            self.entries[key] = e
+        Label(inp_frame, text="Burst model", bg=APP_BG).grid(row=len(fields), column=0, sticky=W, padx=4, pady=2)
+        self.burst_var = StringVar(value="pareto")
+        ttk.Combobox(inp_frame, textvariable=self.burst_var, values=BURST_MODELS, width=10,
+                     state="readonly").grid(row=len(fields), column=1, padx=4, pady=2)
+
+        algo_frame = Frame(left_frame, bg=APP_BG)
+        algo_frame.pack(pady=4, fill=X)
+        self.algo_vars = {}
+        for algo in ALGORITHMS:
+            v = BooleanVar(value=True)
+            Checkbutton(algo_frame, text=algo, variable=v, bg=APP_BG).pack(side=LEFT, padx=4)
+            self.algo_vars[algo] = v
+        self.preempt_var = BooleanVar(value=False)
+        Checkbutton(left_frame, text="Preemptive priority", variable=self.preempt_var, bg=APP_BG).pack(anchor=W, padx=12)
+
+        ctrl_frame = Frame(left_frame, bg=APP_BG)
+        ctrl_frame.pack(pady=6, fill=X)
+        self.btn_start = Button(ctrl_frame, text="▶ Run", bg="#f2d6ef", command=self.run_sim)
+        self.btn_start.pack(side=LEFT, padx=6)
+        self.btn_stop = Button(ctrl_frame, text="⏹ Stop", bg="#f2d6ef", command=self.stop_sim, state=DISABLED)
+        self.btn_stop.pack(side=LEFT, padx=6)
+        self.btn_reset = Button(ctrl_frame, text="🔁 Reset", bg="#f2d6ef", command=self.reset_all)
+        self.btn_reset.pack(side=LEFT, padx=6)
+
+        self.status_label = Label(left_frame, text="", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR,
+                                  wraplength=300, justify=LEFT)
+        self.status_label.pack(pady=6)
+
+        # Middle: tabel hasil + back button
+        Label(mid_frame, text="Results (mean ± CI half-width)", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
+        res_cols = ("Algo","WT","WTp90","WTp99","TAT","RT","CPU%")
+        self.res_tree = ttk.Treeview(mid_frame, columns=res_cols, show="headings", height=8)
+        for c in res_cols:
+            self.res_tree.heading(c, text=c)
+            self.res_tree.column(c, width=62, anchor=CENTER)
+        self.res_tree.pack(fill=X, padx=6, pady=6)
+
+        mid_btn_frame = Frame(mid_frame, bg=APP_BG)
+        mid_btn_frame.pack(fill=X, pady=4)
+        self.btn_back = Button(mid_btn_frame, text="↩ Back", bg="#f2d6ef", command=self._on_back)
+        self.btn_back.pack(side=LEFT, padx=6)
+
+        # Right: konvergensi rata-rata WT
+        Label(right_frame, text="Convergence (avg WT)", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=6, pady=6)
+
+    # ----- input -----
+    def read_params(self) -> dict:
+        try:
+            n = int(self.entries["n"].get())
+            rate = float(self.entries["rate"].get())
+            burst_mean = float(self.entries["burst_mean"].get())
+            quantum = parse_time(self.entries["quantum"].get())
+            tol = float(self.entries["tol"].get()) / 100
+            confidence = float(self.entries["confidence"].get()) / 100
+            max_replicas = int(self.entries["max_replicas"].get())
+        except ValueError:
+            raise ValueError("All fields must be numbers.")
+        if n <= 0 or max_replicas <= 0 or quantum <= 0:
+            raise ValueError("Processes, quantum and max replicas must be positive.")
+        if not 0 < tol < 1 or not 0 < confidence < 1:
+            raise ValueError("Tolerance and confidence must be between 0 and 100%.")
+        algos = [a for a, v in self.algo_vars.items() if v.get()]
+        if not algos:
+            raise ValueError("Select at least one algorithm.")
+        spec = WorkloadSpec(rate=rate, burst=self.burst_var.get(), burst_mean=burst_mean)
+        spec.validate()
+        return {"n": n, "spec": spec, "algorithms": algos, "tol": tol, "confidence": confidence,
+                "max_replicas": max_replicas,
+                "params": {"quantum": quantum, "preemptive": self.preempt_var.get()}}
+
+    # ----- simulate -----
+    def run_sim(self):
+        try:
+            kw = self.read_params()
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.history = {a: [] for a in kw["algorithms"]}
+        self.cancel = threading.Event()
+        self.btn_start.config(state=DISABLED)
+        self.btn_reset.config(state=DISABLED)
+        self.btn_stop.config(state=NORMAL)
+        self.status_label.config(text="Running...")
+        cancel = self.cancel
+        def progress(r: MCResult):
+            # dipanggil di thread worker; snapshot angka lalu serahkan ke thread UI
+            snap = {a: (r.interval(a, "wt_mean"), r.estimates[a]["wt_mean"].count) for a in r.estimates}
+            self.after(0, self.on_progress, r.replicas, r.worst_relative(), snap)
+        def worker():
+            try:
+                result = run_montecarlo(progress=progress, cancel=cancel, **kw)
+            except Exception as e:
+                self.after(0, self.sim_failed, e)
+                return
+            self.after(0, self.update_after_sim, result)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def stop_sim(self):
+        if self.cancel is not None:
+            self.cancel.set()
+            self.status_label.config(text="Stopping...")
+
+    def sim_failed(self, err):
+        messagebox.showerror("Error", f"Monte Carlo run failed: {err}")
+        self._idle()
+
+    def _idle(self):
+        self.status_label.config(text="")
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+        self.btn_stop.config(state=DISABLED)
+
+    def on_progress(self, replicas: int, worst: float, snap: dict):
+        for algo, ((mean, hw), count) in snap.items():
+            self.history[algo].append((count, mean, hw))
+        self.status_label.config(text=f"{replicas} replicas, widest CI ±{worst * 100:.2f}% of mean")
+        now = perf_counter()
+        if now - self._last_draw >= REDRAW_S:
+            self._last_draw = now
+            self.render_convergence()
+
+    def update_after_sim(self, result: MCResult):
+        self.res_tree.delete(*self.res_tree.get_children())
+        for algo in result.estimates:
+            cells = []
+            for metric in ("wt_mean", "wt_p90", "wt_p99", "tat_mean", "rt_mean"):
+                mean, hw = result.interval(algo, metric)
+                cells.append(f"{mean:.2f}±{hw:.2f}")
+            cpu, cpu_hw = result.interval(algo, "cpu_util")
+            self.res_tree.insert("", END, values=(algo, *cells, f"{cpu*100:.1f}±{cpu_hw*100:.1f}"))
+        self.render_convergence()
+        self._idle()
+        state = "converged" if result.converged else "stopped" if result.cancelled else "max replicas reached"
+        pct = f"{result.confidence * 100:g}%"
+        self.status_label.config(text=f"{result.replicas} replicas, {pct} CI, {state} "
+                                      f"(widest ±{result.worst_relative() * 100:.2f}%)")
+
+    def reset_all(self):
+        self.history = {}
+        self.res_tree.delete(*self.res_tree.get_children())
+        self.status_label.config(text="")
+        self.ax.clear()
+        self.canvas.draw()
+
+    # ----- plot -----
+    def render_convergence(self):
+        ax = self.ax
+        ax.clear()
+        ax.set_facecolor(APP_BG)
+        for i, (algo, hist) in enumerate(self.history.items()):
+            if not hist:
+                continue
+            xs = [h[0] for h in hist]
+            mean = [h[1] for h in hist]
+            lo = [h[1] - h[2] for h in hist]
+            hi = [h[1] + h[2] for h in hist]
+            color = LANE_COLORS[i % len(LANE_COLORS)]
+            ax.plot(xs, mean, color=color, label=algo, linewidth=1.2)
+            ax.fill_between(xs, lo, hi, color=color, alpha=0.25, linewidth=0)
+        if self.history:
+            ax.legend(loc="upper right", fontsize=8)
+        ax.set_xlabel("Replicas", color=TEXT_COLOR)
+        ax.set_ylabel("Avg WT", color=TEXT_COLOR)
+        ax.tick_params(colors=TEXT_COLOR)
+        self.canvas.draw()
+
+    # ----- back handling -----
+    def _on_back(self):
+        self.stop_sim()
+        if getattr(self, "app", None):
+            try:
+                if hasattr(self.app, "_mode_page"):
+                    self.app._mode_page()
+                else:
+                    self.app._home_page()
+            except Exception:
+                pass
+        else:
+            top = self.winfo_toplevel()
+            try:
+                top.destroy()
+            except:
+                pass
+
+# ---------------- standalone fallback ----------------
+def main_standalone():
+    root = Tk()
+    root.title("Monte Carlo - Kelompok 4 AB")
+    root.geometry("1300x760")
+    MonteCarloPage(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main_standalone()
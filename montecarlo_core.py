@@ -0,0 +1,199 @@
+#montecarlo_core.py
+# Evaluasi Monte Carlo tanpa dependensi UI; dipakai montecarlo.py dan CLI di bawah.
+# Setiap replika = satu workload acak (WorkloadSpec + seed) yang dijalankan dengan semua
+# algoritma terpilih (workload sama untuk semua algoritma -> perbandingan lebih tajam).
+# Replika dikirim ke worker pool per batch seed; metrik per replika diakumulasi (Welford) dan
+# interval kepercayaan rata-ratanya dicek setiap batch. Run berhenti begitu semua metrik
+# "gate" punya half-width relatif <= tol, atau saat max_replicas tercapai.
+import argparse, sys, threading
+from collections import deque
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from metrics import compute_metrics
+from pool import ALGORITHMS, ENGINES, SimPool, engine_args, get_pool
+from workload import ARRIVAL_MODELS, BURST_MODELS, WorkloadSpec, generate_workload, to_tuples
+
+# metrik per replika: rata-rata dan persentil WT/TAT/RT dari satu workload
+MC_METRICS = ("wt_mean", "wt_p90", "wt_p99", "tat_mean", "tat_p99", "rt_mean", "cpu_util", "throughput")
+GATE_METRICS = ("wt_mean", "tat_mean")
+
+# ---------------- Worker side ----------------
+def run_replicas(seeds: Sequence[int], n: int, spec: WorkloadSpec, algorithms: Sequence[str],
+                 params: dict) -> List[Dict[str, Tuple[float, ...]]]:
+    # -> per seed: {algo: nilai MC_METRICS}
+    out = []
+    for seed in seeds:
+        at, bt, pr = generate_workload(n, spec, seed=seed)
+        tuples = to_tuples(at, bt, pr)
+        row = {}
+        for algo in algorithms:
+            name, kwargs = engine_args(algo, params)
+            fn, with_priority = ENGINES[name]
+            procs, gantt, total_time = fn(tuples if with_priority else [t[:3] for t in tuples], **kwargs)
+            m = compute_metrics(procs, gantt, total_time)
+            row[algo] = (m.wt.mean, m.wt.p90, m.wt.p99, m.tat.mean, m.tat.p99, m.rt.mean,
+                         m.cpu_util, m.throughput)
+        out.append(row)
+    return out
+
+# ---------------- Estimates ----------------
+class Estimate:
+    # rata-rata antar replika + interval kepercayaan (normal; valid untuk replika >= ~30)
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float):
+        self.count += 1
+        d = x - self.mean
+        self.mean += d / self.count
+        self.m2 += d * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+    def half_width(self, z: float) -> float:
+        return z * self.std / self.count ** 0.5 if self.count > 1 else float("inf")
+
+    def relative(self, z: float) -> float:
+        hw = self.half_width(z)
+        if hw == 0:
+            return 0.0
+        return hw / abs(self.mean) if self.mean else float("inf")
+
+@dataclass
+class MCResult:
+    confidence: float
+    replicas: int = 0
+    converged: bool = False
+    cancelled: bool = False
+    estimates: Dict[str, Dict[str, Estimate]] = field(default_factory=dict)   # algo -> metrik -> Estimate
+
+    @property
+    def z(self) -> float:
+        return NormalDist().inv_cdf(0.5 + self.confidence / 2)
+
+    def interval(self, algo: str, metric: str) -> Tuple[float, float]:
+        # -> (mean, half-width)
+        e = self.estimates[algo][metric]
+        return e.mean, e.half_width(self.z)
+
+    def worst_relative(self, gate: Sequence[str] = GATE_METRICS) -> float:
+        return max((self.estimates[a][m].relative(self.z) for a in self.estimates for m in gate), default=float("inf"))
+
+# ---------------- Driver ----------------
+def run_montecarlo(n: int, spec: Optional[WorkloadSpec] = None, algorithms: Sequence[str] = ALGORITHMS,
+                   params: Optional[dict] = None, tol: float = 0.02, confidence: float = 0.95,
+                   min_replicas: int = 30, max_replicas: int = 5000, batch: int = 8, seed: int = 0,
+                   gate: Sequence[str] = GATE_METRICS, pool: Optional[SimPool] = None,
+                   progress: Optional[Callable[[MCResult], None]] = None,
+                   cancel: Optional[threading.Event] = None) -> MCResult:
+    # replika ke-i memakai seed (seed + i). Hasil diproses urut submit, jadi titik berhenti
+    # (dan angka akhirnya) deterministik untuk argumen yang sama, berapa pun jumlah worker.
+    spec = spec or WorkloadSpec()
+    spec.validate()
+    params = params or {}
+    bad = [m for m in gate if m not in MC_METRICS]
+    if bad:
+        raise ValueError(f"Unknown gate metric(s): {', '.join(bad)}")
+    pool = pool or get_pool()
+    result = MCResult(confidence, estimates={a: {m: Estimate() for m in MC_METRICS} for a in algorithms})
+    in_flight = deque()
+    next_seed = 0
+    depth = 2 * pool.workers
+
+    def submit_more():
+        nonlocal next_seed
+        while len(in_flight) < depth and next_seed < max_replicas:
+            seeds = [seed + i for i in range(next_seed, min(max_replicas, next_seed + batch))]
+            next_seed += len(seeds)
+            in_flight.append(pool.submit(run_replicas, seeds, n, spec, list(algorithms), params))
+
+    try:
+        submit_more()
+        while in_flight:
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            rows = in_flight.popleft().result()
+            for row in rows:
+                for algo, values in row.items():
+                    for metric, x in zip(MC_METRICS, values):
+                        result.estimates[algo][metric].add(x)
+            result.replicas += len(rows)
+            if result.replicas >= min_replicas and result.worst_relative(gate) <= tol:
+                result.converged = True
+                break
+            if progress:
+                progress(result)
+            submit_more()
+    finally:
+        for f in in_flight:
+            f.cancel()
+    if progress:
+        progress(result)
+    return result
+
+def format_table(result: MCResult, metrics: Sequence[str] = MC_METRICS) -> str:
+    pct = f"{result.confidence * 100:g}%"
+    lines = [f"{result.replicas} replicas, {pct} CI, "
+             + ("converged" if result.converged else "cancelled" if result.cancelled else "max replicas reached")]
+    lines.append(f"{'algo':<10}" + "".join(f"{m:>22}" for m in metrics))
+    for algo in result.estimates:
+        cells = []
+        for m in metrics:
+            mean, hw = result.interval(algo, m)
+            cells.append(f"{mean:.4g} ± {hw:.2g}")
+        lines.append(f"{algo:<10}" + "".join(f"{c:>22}" for c in cells))
+    return "\n".join(lines)
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Monte Carlo comparison of scheduling algorithms over random workloads, with confidence intervals and early stopping.")
+    ap.add_argument("-n", type=int, default=200, help="processes per workload")
+    ap.add_argument("--algos", default=",".join(ALGORITHMS), help=f"comma-separated subset of {','.join(ALGORITHMS)}")
+    ap.add_argument("--tol", type=float, default=0.02, help="stop when every gate metric's CI half-width is within this fraction of its mean")
+    ap.add_argument("--confidence", type=float, default=0.95)
+    ap.add_argument("--gate", default=",".join(GATE_METRICS), help=f"metrics that must converge ({','.join(MC_METRICS)})")
+    ap.add_argument("--min-replicas", type=int, default=30)
+    ap.add_argument("--max-replicas", type=int, default=5000)
+    ap.add_argument("--batch", type=int, default=8, help="replicas per worker task")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--arrival", choices=ARRIVAL_MODELS, default="poisson")
+    ap.add_argument("--rate", type=float, default=0.2)
+    ap.add_argument("--burst", choices=BURST_MODELS, default="pareto")
+    ap.add_argument("--burst-mean", type=float, default=4.0)
+    ap.add_argument("--quantum", type=int, default=2)
+    ap.add_argument("--preemptive", action="store_true")
+    ap.add_argument("--aging", type=float, default=None, help="priority aging: waiting time per priority level")
+    args = ap.parse_args(argv)
+
+    algos = [a for a in args.algos.replace(" ", "").split(",") if a]
+    bad = [a for a in algos if a not in ALGORITHMS]
+    if bad:
+        ap.error(f"unknown algorithm(s): {', '.join(bad)}")
+    spec = WorkloadSpec(arrival=args.arrival, rate=args.rate, burst=args.burst, burst_mean=args.burst_mean)
+    pool = SimPool(args.workers)
+    def progress(r: MCResult):
+        print(f"\r{r.replicas} replicas, worst relative half-width {r.worst_relative(gate):.4f}",
+              end="", file=sys.stderr, flush=True)
+    gate = [g for g in args.gate.split(",") if g]
+    try:
+        result = run_montecarlo(args.n, spec, algos, {"quantum": args.quantum, "preemptive": args.preemptive,
+                                                          "aging": args.aging},
+                                args.tol, args.confidence, args.min_replicas, args.max_replicas, args.batch,
+                                args.seed, gate, pool, progress)
+    except ValueError as e:
+        ap.error(str(e))
+    finally:
+        pool.shutdown()
+    print(file=sys.stderr)
+    print(format_table(result))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
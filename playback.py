@@ -0,0 +1,245 @@
+#playback.py
+# Playback jadwal hasil simulasi: Gantt 2D yang "tumbuh" seiring waktu, plus proses yang
+# sedang jalan dan isi ready queue. Artist dibuat sekali lalu datanya di-update di tempat;
+# setiap frame memakai blitting: segmen yang sudah selesai di-"bake" ke background sekali
+# saja, jadi ongkos per frame sebanding dengan segmen baru/berjalan, bukan panjang jadwal.
+from tkinter import *
+from itertools import islice
+from time import perf_counter
+from typing import Dict, List, Optional
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
+from instrument import OVERHEAD_PIDS
+from widgets import LANE_COLORS, OVERHEAD_COLOR
+
+FRAME_MS = 16          # ~60 fps
+BAR_HEIGHT = 0.6
+READY_SHOWN = 8        # jumlah pid ready queue yang ditampilkan di teks status
+MAX_LANE_LABELS = 40   # di atas ini label lane disembunyikan (workload besar)
+
+# ---------------- Timeline ----------------
+class Timeline:
+    # index event untuk playback; semua query maju (t naik) dan amortized O(1) per event
+    def __init__(self, gantt: list, procs: list, total_time: int):
+        self.total_time = max(total_time, max([seg[1] for seg in gantt] + [1]))
+        self.smp = bool(gantt) and len(gantt[0]) > 3
+        if self.smp:
+            self.labels = [f"CPU{c}" for c in range(max(seg[3] for seg in gantt) + 1)]
+            lane = [seg[3] for seg in gantt]
+        else:
+            order: Dict[str, int] = {}
+            for seg in gantt:
+                order.setdefault(seg[2], len(order))
+            self.labels = list(order)
+            lane = [order[seg[2]] for seg in gantt]
+        self.start = np.array([seg[0] for seg in gantt], dtype=float)
+        self.end = np.array([seg[1] for seg in gantt], dtype=float)
+        self.lane = np.array(lane, dtype=float)
+        self.pid = [seg[2] for seg in gantt]
+        self.by_start = np.argsort(self.start, kind="stable")
+        self.by_end = np.argsort(self.end, kind="stable")
+        self.start_sorted = self.start[self.by_start]
+        self.end_sorted = self.end[self.by_end]
+
+        real = [p for p in procs if p.completion_time is not None]
+        self.arr_pids = [p.pid for p in sorted(real, key=lambda p: p.arrival)]
+        self.arr_times = np.array(sorted(p.arrival for p in real), dtype=float)
+        self.done_pids = [p.pid for p in sorted(real, key=lambda p: p.completion_time)]
+        self.done_times = np.array(sorted(p.completion_time for p in real), dtype=float)
+
+        color_of: Dict[str, str] = {}
+        colors = []
+        for pid in self.pid:
+            if pid in OVERHEAD_PIDS:
+                colors.append(OVERHEAD_COLOR)
+            else:
+                colors.append(color_of.setdefault(pid, LANE_COLORS[len(color_of) % len(LANE_COLORS)]))
+        self.colors = colors
+        self.rewind()
+
+    def rewind(self):
+        self.t = 0.0
+        self.n_started = 0
+        self.n_baked = 0
+        self.n_arrived = 0
+        self.n_done = 0
+        self.open: Dict[int, None] = {}        # segmen yang sudah mulai tapi belum selesai
+        self.active: Dict[str, None] = {}      # proses yang sudah datang tapi belum selesai (urut arrival)
+
+    def rects(self, idx, t: Optional[float] = None) -> np.ndarray:
+        # -> (k, 4, 2) verts; ujung kanan dipotong di t (segmen yang sedang berjalan)
+        idx = np.asarray(idx, dtype=int)
+        x0 = self.start[idx]
+        x1 = self.end[idx] if t is None else np.minimum(self.end[idx], t)
+        y0 = self.lane[idx] - BAR_HEIGHT / 2
+        y1 = y0 + BAR_HEIGHT
+        return np.stack([np.column_stack([x0, y0]), np.column_stack([x0, y1]),
+                         np.column_stack([x1, y1]), np.column_stack([x1, y0])], axis=1)
+
+    def advance(self, t: float) -> List[int]:
+        # maju ke waktu t; -> index segmen yang baru selesai (perlu di-bake ke background)
+        self.t = t
+        k = int(np.searchsorted(self.start_sorted, t, side="right"))
+        for i in self.by_start[self.n_started:k].tolist():
+            self.open[i] = None
+        self.n_started = k
+        k = int(np.searchsorted(self.end_sorted, t, side="right"))
+        finished = self.by_end[self.n_baked:k].tolist()
+        for i in finished:
+            self.open.pop(i, None)
+        self.n_baked = k
+        k = int(np.searchsorted(self.arr_times, t, side="right"))
+        for pid in self.arr_pids[self.n_arrived:k]:
+            self.active[pid] = None
+        self.n_arrived = k
+        k = int(np.searchsorted(self.done_times, t, side="right"))
+        for pid in self.done_pids[self.n_done:k]:
+            self.active.pop(pid, None)
+        self.n_done = k
+        return finished
+
+    def running(self) -> Dict[int, str]:
+        # lane -> pid yang sedang jalan (overhead ikut ditampilkan)
+        return {int(self.lane[i]): self.pid[i] for i in self.open if self.start[i] < self.end[i]}
+
+    def status_text(self) -> str:
+        run = self.running()
+        busy = set(run.values())
+        n_ready = len(self.active) - len(busy.intersection(self.active))
+        ready = islice((pid for pid in self.active if pid not in busy), READY_SHOWN)
+        if self.smp:
+            run_txt = "  ".join(f"{self.labels[c]}: {run.get(c, '-')}" for c in range(len(self.labels)))
+        else:
+            run_txt = f"Running: {next(iter(run.values()), '-')}"
+        shown = " ".join(ready) + (" …" if n_ready > READY_SHOWN else "")
+        return f"t = {self.t:.1f}   {run_txt}\nReady ({n_ready}): {shown}"
+
+# ---------------- Playback window ----------------
+class PlaybackWindow(Toplevel):
+    def __init__(self, parent, gantt: list, procs: list, total_time: int, title: str,
+                 bg: str, text_color: str):
+        super().__init__(parent, bg=bg)
+        self.title(title)
+        self.geometry("900x520")
+        self.timeline = Timeline(gantt, procs, total_time)
+        self.playing = False
+        self._job = None
+        self._last = None
+        self._background = None
+
+        self.fig = plt.Figure(figsize=(8,4), dpi=100)
+        self.fig.patch.set_facecolor(bg)
+        self.ax = self.fig.add_subplot(111)
+        ax = self.ax
+        ax.set_facecolor(bg)
+        ax.set_xlim(0, self.timeline.total_time)
+        ax.set_ylim(-0.5, max(1, len(self.timeline.labels)) - 0.5)
+        if len(self.timeline.labels) <= MAX_LANE_LABELS:
+            ax.set_yticks(list(range(len(self.timeline.labels))))
+            ax.set_yticklabels(self.timeline.labels)
+        else:
+            ax.set_ylabel(f"{len(self.timeline.labels)} lanes")
+        ax.invert_yaxis()
+        ax.set_xlabel("Time")
+        ax.set_title(title, color=text_color)
+
+        # artist animated=True tidak ikut canvas.draw(); digambar manual lewat draw_artist
+        self.baked = PolyCollection([], edgecolors="#222222", linewidths=0.3, animated=True)
+        self.live = PolyCollection([], edgecolors="#222222", linewidths=0.3, animated=True)
+        self.cursor = ax.axvline(0, color=text_color, linewidth=1, animated=True)
+        self.status = ax.text(0.01, 0.98, "", transform=ax.transAxes, va="top", ha="left",
+                              color=text_color, fontsize=9, animated=True)
+        ax.add_collection(self.baked)
+        ax.add_collection(self.live)
+
+        ctrl = Frame(self, bg=bg)
+        ctrl.pack(fill=X, padx=6, pady=4)
+        self.btn_play = Button(ctrl, text="▶ Play", bg="#f2d6ef", command=self.toggle)
+        self.btn_play.pack(side=LEFT, padx=4)
+        Button(ctrl, text="⏮ Restart", bg="#f2d6ef", command=self.restart).pack(side=LEFT, padx=4)
+        Label(ctrl, text="Speed (time units/s):", bg=bg).pack(side=LEFT, padx=4)
+        default_speed = max(1, self.timeline.total_time // 10)
+        self.speed_var = DoubleVar(value=default_speed)
+        Scale(ctrl, from_=1, to=max(10, self.timeline.total_time), orient=HORIZONTAL,
+              variable=self.speed_var, length=260).pack(side=LEFT, padx=4)
+
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=6, pady=6)
+        # background di-cache ulang setiap kali canvas digambar penuh (mis. resize)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.canvas.draw()
+
+    # ----- blitting -----
+    def _on_draw(self, event=None):
+        tl = self.timeline
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        if tl.n_baked:
+            # setelah redraw penuh, semua segmen selesai di-bake sekali lagi
+            self._bake(tl.by_end[:tl.n_baked].tolist())
+        self._draw_live()
+
+    def _bake(self, idx: List[int]):
+        tl = self.timeline
+        self.canvas.restore_region(self._background)
+        self.baked.set_verts(tl.rects(idx))
+        self.baked.set_facecolors([tl.colors[i] for i in idx])
+        self.ax.draw_artist(self.baked)
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _draw_live(self):
+        tl = self.timeline
+        self.canvas.restore_region(self._background)
+        idx = list(tl.open)
+        self.live.set_verts(tl.rects(idx, tl.t) if idx else [])
+        self.live.set_facecolors([tl.colors[i] for i in idx])
+        self.cursor.set_xdata([tl.t, tl.t])
+        self.status.set_text(tl.status_text())
+        self.ax.draw_artist(self.live)
+        self.ax.draw_artist(self.cursor)
+        self.ax.draw_artist(self.status)
+        self.canvas.blit(self.ax.bbox)
+
+    # ----- controls -----
+    def toggle(self):
+        if self.playing:
+            self.pause()
+        else:
+            if self.timeline.t >= self.timeline.total_time:
+                self.restart()
+            self.playing = True
+            self.btn_play.config(text="⏸ Pause")
+            self._last = perf_counter()
+            self._job = self.after(FRAME_MS, self._tick)
+
+    def pause(self):
+        self.playing = False
+        self.btn_play.config(text="▶ Play")
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+
+    def restart(self):
+        self.timeline.rewind()
+        # canvas.draw() -> draw_event -> background bersih tanpa segmen lama
+        self.canvas.draw()
+
+    def _tick(self):
+        now = perf_counter()
+        tl = self.timeline
+        t = min(tl.total_time, tl.t + (now - self._last) * self.speed_var.get())
+        self._last = now
+        finished = tl.advance(t)
+        if finished:
+            self._bake(finished)
+        self._draw_live()
+        if t >= tl.total_time:
+            self.pause()
+            return
+        self._job = self.after(FRAME_MS, self._tick)
+
+    def close(self):
+        self.pause()
+        self.destroy()
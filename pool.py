@@ -0,0 +1,149 @@
+#pool.py
+# Worker pool persisten untuk semua simulasi. Dibuat sekali saat launcher start lalu dipakai
+# ulang oleh tombol Start di setiap halaman dan oleh mode Compare. Worker hanya berisi modul
+# engine (*_core, smp, shm) -- tanpa tkinter/matplotlib -- jadi run kecil cukup bayar ongkos
+# kirim-terima antar proses, bukan import ulang.
+# Jumlah worker default = jumlah CPU; bisa diatur lewat env SIM_WORKERS atau SimPool(workers).
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
+from typing import Optional, Tuple
+from instrument import SimStats
+from fcfs_core import simulate_fcfs
+from sjf_core import simulate_sjf
+from priority_core import simulate_priority_processes
+from rr_core import simulate_rr
+from mlfq_core import simulate_mlfq
+from cfs_core import simulate_cfs
+from share_core import simulate_lottery, simulate_stride
+from smp import simulate_smp
+from shm import WorkloadDescriptor, load_workload, export_result, release_result
+
+# nama engine -> (fungsi, butuh kolom priority di proc_tuples)
+ENGINES = {
+    "fcfs": (simulate_fcfs, False),
+    "sjf": (simulate_sjf, False),
+    "priority": (simulate_priority_processes, True),
+    "rr": (simulate_rr, False),
+    "mlfq": (simulate_mlfq, False),
+    "cfs": (simulate_cfs, True),
+    "lottery": (simulate_lottery, True),
+    "stride": (simulate_stride, True),
+    "smp": (simulate_smp, True),
+}
+
+# label algoritma di UI (Compare, Monte Carlo) -> engine
+ALGORITHMS = ("FCFS", "SJF", "Priority", "RR", "CFS")
+
+def engine_args(algo: str, params: dict) -> Tuple[str, dict]:
+    if algo == "Priority":
+        kwargs = {"preemptive": params.get("preemptive", False)}
+        if params.get("aging"):
+            kwargs["aging"] = params["aging"]
+        return "priority", kwargs
+    if algo == "RR":
+        return "rr", {"quantum": params.get("quantum", 2)}
+    if algo == "CFS":
+        return "cfs", {k: params[k] for k in ("target_latency", "min_granularity") if k in params}
+    if algo in ("FCFS", "SJF"):
+        return algo.lower(), {}
+    raise ValueError(f"Unknown algorithm: {algo}")
+
+# ---------------- Worker side ----------------
+def _warm() -> int:
+    # dipanggil sekali per worker saat start; import engine sudah terjadi di level modul
+    return os.getpid()
+
+def _run(name: str, proc_tuples: list, kwargs: dict, want_stats: bool):
+    stats = SimStats() if want_stats else None
+    procs, gantt, total_time = ENGINES[name][0](proc_tuples, stats=stats, **kwargs)
+    return procs, gantt, total_time, stats
+
+def run_shared(name: str, wdesc: WorkloadDescriptor, kwargs: dict):
+    # varian untuk workload besar: input & output lewat shared memory (lihat shm.py)
+    pids, tuples = load_workload(wdesc, with_priority=ENGINES[name][1])
+    procs, gantt, total_time = ENGINES[name][0](tuples, **kwargs)
+    return export_result(procs, gantt, total_time, pids)
+
+def discard_results(futures):
+    # future run_shared yang hasilnya tidak akan diambil: tunggu selesai lalu lepas segmennya
+    for f in futures:
+        f.cancel()
+        try:
+            rdesc = f.result()
+        except Exception:
+            continue
+        release_result(rdesc)
+
+# ---------------- Pool ----------------
+def _context():
+    # POSIX: fork. main.py men-start pool sebelum tkinter/matplotlib di-import, jadi worker
+    # hanya mewarisi modul engine (spawn/forkserver akan menjalankan ulang __main__ = launcher).
+    # Windows hanya punya spawn; ongkos import dibayar sekali per worker saat warm-up.
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context("spawn")
+
+def default_workers() -> int:
+    env = os.environ.get("SIM_WORKERS", "").strip()
+    if env:
+        try:
+            n = int(env)
+        except ValueError:
+            raise ValueError(f"SIM_WORKERS must be a positive integer, got {env!r}")
+        if n < 1:
+            raise ValueError(f"SIM_WORKERS must be a positive integer, got {env!r}")
+        return n
+    return os.cpu_count() or 1
+
+class SimPool:
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or default_workers()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                if os.name == "posix":
+                    # tracker shared memory harus hidup sebelum fork supaya worker memakai
+                    # tracker yang sama dengan proses UI (lihat catatan di shm.py)
+                    resource_tracker.ensure_running()
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_context())
+                # satu tugas kosong per worker supaya semua proses sudah siap sebelum dipakai
+                for _ in range(self.workers):
+                    self._executor.submit(_warm)
+            return self._executor
+
+    def submit(self, fn, *args):
+        try:
+            return self.start().submit(fn, *args)
+        except BrokenProcessPool:
+            # worker mati (mis. di-kill); buat pool baru sekali lalu coba lagi
+            with self._lock:
+                self._executor = None
+            return self.start().submit(fn, *args)
+
+    def simulate(self, name: str, proc_tuples: list, stats: Optional[SimStats] = None, **kwargs):
+        # blocking, dipanggil dari thread worker halaman; hasil sama seperti engine lokal
+        procs, gantt, total_time, worker_stats = self.submit(_run, name, proc_tuples, kwargs, stats is not None).result()
+        if stats is not None:
+            stats.__dict__.update(worker_stats.__dict__)
+        return procs, gantt, total_time
+
+    def shutdown(self, wait: bool = True):
+        # CLI batch: tunggu worker keluar dulu, kalau tidak thread manajer executor bisa masih
+        # menutup pipe saat interpreter berhenti (OSError: Bad file descriptor). wait=False
+        # hanya untuk keluar dari Tk, supaya jendela tidak tertahan run yang dibatalkan.
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+_POOL = SimPool()
+
+def get_pool() -> SimPool:
+    return _POOL
@@ -2,7 +2,6 @@
 from tkinter import *
 from tkinter import ttk, messagebox, filedialog
 import threading, os
-from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 import matplotlib
 try:
@@ -13,97 +12,13 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-
-# ---------------- Data class ----------------
-@dataclass(order=True)
-class Process:
-    sort_index: tuple = field(init=False, repr=False)
-    pid: str
-    arrival: int
-    burst: int
-    priority: int
-    remaining: int = field(init=False)
-    start_time: Optional[int] = None
-    completion_time: Optional[int] = None
-    waiting_time: Optional[int] = None
-    turnaround_time: Optional[int] = None
-
-    def __post_init__(self):
-        self.remaining = self.burst
-        self.sort_index = (self.priority, self.arrival, self.pid)
-
-# ---------------- Scheduling logic ----------------
-def simulate_priority_processes(proc_tuples: List[Tuple[str,int,int,int]], preemptive: bool=False):
-    procs = [Process(pid, at, bt, pr) for (pid, at, bt, pr) in proc_tuples]
-    procs_sorted = sorted(procs, key=lambda p: (p.arrival, p.priority, p.pid))
-    n = len(procs)
-    time_now = 0
-    completed = 0
-    ready: List[Process] = []
-    arrival_idx = 0
-    gantt_marks = []
-
-    def add_arrivals(t):
-        nonlocal arrival_idx
-        while arrival_idx < n and procs_sorted[arrival_idx].arrival <= t:
-            ready.append(procs_sorted[arrival_idx])
-            arrival_idx += 1
-
-    add_arrivals(time_now)
-    last_pid = None
-
-    if n == 0:
-        return procs, [], 0
-
-    while completed < n:
-        if not ready:
-            if arrival_idx < n:
-                time_now = procs_sorted[arrival_idx].arrival
-                add_arrivals(time_now)
-                continue
-            else:
-                break
-
-        ready.sort(key=lambda p: (p.priority, p.arrival, p.pid))
-        cur = ready[0]
-        if cur.start_time is None:
-            cur.start_time = time_now
-
-        if last_pid != cur.pid:
-            gantt_marks.append((time_now, cur.pid))
-            last_pid = cur.pid
-
-        run_len = 1 if preemptive else cur.remaining
-        ran = 0
-        while ran < run_len:
-            time_now += 1
-            cur.remaining -= 1
-            ran += 1
-            add_arrivals(time_now)
-            if preemptive and cur.remaining > 0 and ready:
-                ready.sort(key=lambda p: (p.priority, p.arrival, p.pid))
-                if ready[0].pid != cur.pid:
-                    break
-        if cur.remaining == 0:
-            cur.completion_time = time_now
-            cur.turnaround_time = cur.completion_time - cur.arrival
-            cur.waiting_time = cur.turnaround_time - cur.burst
-            if cur in ready:
-                ready.remove(cur)
-            completed += 1
-
-    merged = []
-    if gantt_marks:
-        for i, (s, pid) in enumerate(gantt_marks):
-            if i == 0:
-                merged.append([s, None, pid])
-            else:
-                merged[-1][1] = s
-                merged.append([s, None, pid])
-        merged[-1][1] = time_now
-    gantt = [(m[0], m[1], m[2]) for m in merged]
-
-    return procs, gantt, time_now
+from priority_core import Process, simulate_priority_processes
+from instrument import SimStats
+from metrics import compute_metrics
+from widgets import StatsPanel, SMPControls, draw_gantt_3d
+from pool import get_pool
+from playback import PlaybackWindow
+from workload import parse_time, read_workload
 
 # ---------------- UI constants ----------------
 APP_BG = "#69259c"
@@ -112,6 +27,10 @@ TEXT_COLOR = "#ffddff"
 
 # ---------------- PriorityPage ----------------
 class PriorityPage(Frame):
+    PAGE_TITLE = "Priority Scheduler"
+    GANTT_TITLE = "3D Gantt (Priority Scheduling)"
+    PNG_NAME = "gantt_priority.png"
+
     def __init__(self, parent, app=None):
         super().__init__(parent, bg=APP_BG)
         self.pack(fill=BOTH, expand=True)
@@ -124,6 +43,7 @@ class PriorityPage(Frame):
 
         # Data
         self.process_list: List[Tuple[str,int,int,int]] = []
+        self.last_run = None   # (gantt, procs_meta, total_time) untuk playback
 
         # Layout: three columns
         main_frame = Frame(self, bg=APP_BG)
@@ -144,7 +64,7 @@ class PriorityPage(Frame):
         right_frame.pack(side=LEFT, fill=BOTH, expand=True, padx=6, pady=6)
 
         # Left widgets
-        Label(left_frame, text="Priority Scheduler", font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
+        Label(left_frame, text=self.PAGE_TITLE, font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
 
         inp_frame = Frame(left_frame, bg=APP_BG)
         inp_frame.pack(pady=6)
@@ -170,6 +90,11 @@ class PriorityPage(Frame):
         self.btn_reset = Button(ctrl_frame, text="🔁 Reset", bg="#f2d6ef", command=self.reset_all)
         self.btn_reset.pack(side=LEFT, padx=6)
 
+        self.smp_controls = SMPControls(left_frame, bg=APP_BG)
+        self.smp_controls.pack(pady=4, fill=X)
+
+        self.build_params(left_frame)
+
         scale_frame = Frame(left_frame, bg=APP_BG)
         scale_frame.pack(pady=8, fill=X)
         Label(scale_frame, text="Gantt scale (px/unit):", bg=APP_BG).pack(anchor=W, padx=6)
@@ -179,6 +104,8 @@ class PriorityPage(Frame):
 
         self.btn_save = Button(left_frame, text="Save Gantt PNG", fg="white", bg="#fb47b2", command=self.save_gantt_png)
         self.btn_save.pack(fill=X, padx=12, pady=6)
+        self.btn_play = Button(left_frame, text="▶ Playback", bg="#f2d6ef", command=self.open_playback)
+        self.btn_play.pack(fill=X, padx=12, pady=2)
 
         Label(left_frame, text="Results (per-process)", bg=APP_BG, fg=TEXT_COLOR, font=("Segoe UI",11,"bold")).pack(pady=6)
         res_cols = ("PID","AT","BT","PR","ST","CT","TAT","WT")
@@ -188,9 +115,12 @@ class PriorityPage(Frame):
             self.res_tree.column(c, width=36, anchor=CENTER)
         self.res_tree.pack(fill=BOTH, expand=False, padx=8, pady=6)
 
-        self.avg_label = Label(left_frame, text="Avg WT: -    Avg TAT: -", bg=APP_BG, font=("Segoe UI",11,"bold"), fg=TEXT_COLOR)
+        self.avg_label = Label(left_frame, text="Avg WT: -    Avg TAT: -", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR, justify=LEFT)
         self.avg_label.pack(pady=6)
 
+        self.stats_panel = StatsPanel(left_frame, bg=APP_BG, fg=TEXT_COLOR)
+        self.stats_panel.pack(fill=X, padx=6, pady=2)
+
         # Middle: process list + back button
         Label(mid_frame, text="Processes", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
         cols = ("PID","Arrival","Burst","Priority")
@@ -222,11 +152,11 @@ class PriorityPage(Frame):
 
     def add_process(self):
         try:
-            at = int(self.entry_at.get())
-            bt = int(self.entry_bt.get())
+            at = parse_time(self.entry_at.get())
+            bt = parse_time(self.entry_bt.get())
             pr = int(self.entry_pr.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Arrival, Burst, Priority must be integers.")
+            messagebox.showerror("Input Error", "Arrival and Burst must be numbers, Priority an integer.")
             return
         pid = f"P{len(self.process_list)+1}"
         self.process_list.append((pid, at, bt, pr))
@@ -239,33 +169,12 @@ class PriorityPage(Frame):
         self.update_treeviews()
 
     def import_csv(self):
-        path = filedialog.askopenfilename(filetypes=[("CSV files","*.csv"),("All files","*.*")])
+        path = filedialog.askopenfilename(filetypes=[("CSV files","*.csv"),("Workload cache","*.npz"),("All files","*.*")])
         if not path:
             return
         try:
-            with open(path, newline='') as f:
-                import csv
-                rows = list(csv.reader(f))
-                if not rows:
-                    messagebox.showerror("CSV Error", "Empty CSV")
-                    return
-                header = rows[0]
-                start_idx = 0
-                if any(not cell.strip().isdigit() for cell in header[1:]):
-                    start_idx = 1
-                pl = []
-                for i,row in enumerate(rows[start_idx:], start=1):
-                    if len(row) >= 4:
-                        pid = row[0].strip()
-                        at = int(row[1]); bt = int(row[2]); pr = int(row[3])
-                    elif len(row) == 3:
-                        pid = f"P{i}"
-                        at = int(row[0]); bt = int(row[1]); pr = int(row[2])
-                    else:
-                        continue
-                    pl.append((pid, at, bt, pr))
-                self.process_list = pl
-                self.update_treeviews()
+            self.process_list = read_workload(path)
+            self.update_treeviews()
         except Exception as e:
             messagebox.showerror("CSV Error", f"Failed to read CSV: {e}")
 
@@ -274,45 +183,16 @@ class PriorityPage(Frame):
         self.update_treeviews()
         self.res_tree.delete(*self.res_tree.get_children())
         self.avg_label.config(text="Avg WT: -    Avg TAT: -")
+        self.stats_panel.clear()
+        self.last_run = None
         self.ax.clear()
         self.canvas.draw()
 
     # ----- Gantt rendering -----
     def render_3d_gantt(self, gantt_segments: List[Tuple[int,int,str]], procs_meta: List[Process], total_time: int):
-        ax = self.ax
-        fig = self.fig
-        ax.clear()
-        ax.set_facecolor(APP_BG)
-        fig.patch.set_facecolor(APP_BG)
-        pids_order = []
-        for seg in gantt_segments:
-            if seg[2] not in pids_order:
-                pids_order.append(seg[2])
-        if not pids_order:
-            pids_order = [p.pid for p in procs_meta]
-        y_pos = {pid: idx for idx,pid in enumerate(pids_order)}
-        xs=[]; ys=[]; zs=[]; dxs=[]; dys=[]; dzs=[]; colors=[]
-        for start,end,pid in gantt_segments:
-            dur = end - start
-            xs.append(start); ys.append(y_pos[pid]); zs.append(0)
-            dxs.append(dur); dys.append(0.6); dzs.append(1)
-            colors.append(BAR_COLOR)
-        if xs:
-            ax.bar3d(xs, ys, zs, dxs, dys, dzs, color=colors, shade=True, edgecolor="#222222", linewidth=0.2)
-        ax.set_yticks(list(y_pos.values()))
-        ax.set_yticklabels(list(y_pos.keys()))
-        ax.set_xlabel("Time")
-        ax.set_zlim(0,1.5)
-        ax.set_zlabel("")
-        ax.set_title("3D Gantt (Priority Scheduling)", color=TEXT_COLOR)
-        ax.view_init(elev=20, azim=-60)
-        if gantt_segments:
-            max_t = max(seg[1] for seg in gantt_segments)
-        else:
-            max_t = total_time
-        # safe xticks
-        step = max(1, max(1, max_t//10))
-        ax.set_xticks(range(0, max(1, max_t+1), step))
+        self.fig.patch.set_facecolor(APP_BG)
+        draw_gantt_3d(self.ax, gantt_segments, self.GANTT_TITLE, APP_BG, BAR_COLOR, TEXT_COLOR,
+                      pids=[p.pid for p in procs_meta], total_time=total_time)
         self.canvas.draw()
 
     # ----- simulate -----
@@ -323,13 +203,93 @@ class PriorityPage(Frame):
         self.btn_start.config(state=DISABLED)
         self.btn_reset.config(state=DISABLED)
         snapshot = self.process_list.copy()
-        preempt = self.preempt_var.get()
+        stats = self.stats_panel.new_stats()
+        try:
+            cores = self.smp_controls.cores()
+        except ValueError:
+            messagebox.showerror("Input Error", "Cores must be a positive integer.")
+            self.btn_start.config(state=NORMAL)
+            self.btn_reset.config(state=NORMAL)
+            return
+        per_core = self.smp_controls.per_core
+        try:
+            params = self.read_params()
+            if cores > 1 and (params.get("cs_cost") or params.get("dispatch_cost")):
+                # engine SMP belum memodelkan overhead; jangan diam-diam dibuang
+                raise ValueError("CS and dispatch cost are only modelled on a single core; set them to 0 or use 1 core.")
+            if cores > 1 and params.get("aging"):
+                # begitu juga aging: engine SMP memakai prioritas statis
+                raise ValueError("Aging is only modelled on a single core; clear it or use 1 core.")
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            self.btn_start.config(state=NORMAL)
+            self.btn_reset.config(state=NORMAL)
+            return
         def worker():
-            procs_meta, gantt, total_time = simulate_priority_processes(snapshot, preemptive=preempt)
-            self.after(0, self.update_after_sim, procs_meta, gantt, total_time)
+            try:
+                procs_meta, gantt, total_time = self.simulate(snapshot, params, stats, cores, per_core)
+            except Exception as e:
+                self.after(0, self.sim_failed, e)
+                return
+            self.after(0, self.update_after_sim, procs_meta, gantt, total_time, stats, cores)
         threading.Thread(target=worker).start()
 
-    def update_after_sim(self, procs_meta: List[Process], gantt: List[Tuple[int,int,str]], total_time: int):
+    def sim_failed(self, err):
+        messagebox.showerror("Error", f"Simulation failed: {err}")
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    # ----- parameter hooks (di-override oleh halaman turunan, mis. CFS) -----
+    def build_params(self, left_frame):
+        ovh_frame = Frame(left_frame, bg=APP_BG)
+        ovh_frame.pack(pady=2, fill=X)
+        Label(ovh_frame, text="CS cost", bg=APP_BG).pack(side=LEFT, padx=4)
+        self.entry_cs = Entry(ovh_frame, width=4); self.entry_cs.pack(side=LEFT, padx=2)
+        self.entry_cs.insert(0, "0")
+        Label(ovh_frame, text="Dispatch cost", bg=APP_BG).pack(side=LEFT, padx=4)
+        self.entry_disp = Entry(ovh_frame, width=4); self.entry_disp.pack(side=LEFT, padx=2)
+        self.entry_disp.insert(0, "0")
+        Label(ovh_frame, text="Aging", bg=APP_BG).pack(side=LEFT, padx=4)
+        self.entry_aging = Entry(ovh_frame, width=4); self.entry_aging.pack(side=LEFT, padx=2)   # kosong = tanpa aging
+
+    def read_overhead(self) -> dict:
+        try:
+            cs = parse_time(self.entry_cs.get() or 0)
+            disp = parse_time(self.entry_disp.get() or 0)
+        except ValueError:
+            cs = disp = -1
+        if cs < 0 or disp < 0:
+            raise ValueError("CS and dispatch cost must be non-negative numbers.")
+        return {"cs_cost": cs, "dispatch_cost": disp}
+
+    def read_params(self) -> dict:
+        params = self.read_overhead()
+        try:
+            aging = parse_time(self.entry_aging.get()) if self.entry_aging.get().strip() else None
+        except ValueError:
+            aging = 0
+        if aging is not None and aging <= 0:
+            raise ValueError("Aging must be a positive number (time units per priority level) or empty.")
+        params.update(preemptive=self.preempt_var.get(), aging=aging)
+        return params
+
+    def simulate(self, snapshot, params: dict, stats: Optional[SimStats], cores: int, per_core: bool):
+        if cores > 1:
+            return get_pool().simulate("smp", snapshot, stats=stats, algorithm="priority", cores=cores,
+                                       per_core=per_core, preemptive=params["preemptive"])
+        return get_pool().simulate("priority", snapshot, stats=stats, **params)
+
+    def update_after_sim(self, procs_meta: List[Process], gantt: List[Tuple[int,int,str]], total_time: int, stats: Optional[SimStats] = None, cores: int = 1):
+        self.fill_results(procs_meta)
+        metrics = compute_metrics(procs_meta, gantt, total_time, stats, cores=cores)
+        self.avg_label.config(text=metrics.summary_text())
+        self.render_3d_gantt(gantt, procs_meta, total_time)
+        self.last_run = (gantt, procs_meta, total_time)
+        self.stats_panel.show(stats)
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def fill_results(self, procs_meta: List[Process]):
         self.res_tree.delete(*self.res_tree.get_children())
         for p in sorted(procs_meta, key=lambda x: x.pid):
             st = p.start_time if p.start_time is not None else "-"
@@ -337,17 +297,16 @@ class PriorityPage(Frame):
             tat = p.turnaround_time if p.turnaround_time is not None else "-"
             wt = p.waiting_time if p.waiting_time is not None else ""
             self.res_tree.insert("", END, values=(p.pid, p.arrival, p.burst, p.priority, st, ct, tat, wt))
-        tats = [p.turnaround_time for p in procs_meta if p.turnaround_time is not None]
-        wts = [p.waiting_time for p in procs_meta if p.waiting_time is not None]
-        avg_tat = sum(tats)/len(tats) if tats else 0
-        avg_wt = sum(wts)/len(wts) if wts else 0
-        self.avg_label.config(text=f"Avg WT: {avg_wt:.2f}    Avg TAT: {avg_tat:.2f}")
-        self.render_3d_gantt(gantt, procs_meta, total_time)
-        self.btn_start.config(state=NORMAL)
-        self.btn_reset.config(state=NORMAL)
+
+    def open_playback(self):
+        if self.last_run is None:
+            messagebox.showinfo("Playback", "Run the simulation first.")
+            return
+        gantt, procs_meta, total_time = self.last_run
+        PlaybackWindow(self, gantt, procs_meta, total_time, f"Playback ({self.PAGE_TITLE})", APP_BG, TEXT_COLOR)
 
     def save_gantt_png(self):
-        p = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG","*.png")], initialfile="gantt_priority.png")
+        p = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG","*.png")], initialfile=self.PNG_NAME)
         if not p:
             return
         try:
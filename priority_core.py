@@ -0,0 +1,180 @@
+#priority_core.py
+# Engine Priority (preemptive / non-preemptive) tanpa dependensi UI; dipakai priority.py dan worker pool.
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional
+from time import perf_counter
+from instrument import SimStats, Time, CS_PID, DISPATCH_PID
+
+# ---------------- Data class ----------------
+@dataclass(order=True)
+class Process:
+    sort_index: tuple = field(init=False, repr=False)
+    pid: str
+    arrival: Time
+    burst: Time
+    priority: int
+    remaining: Time = field(init=False)
+    start_time: Optional[Time] = None
+    completion_time: Optional[Time] = None
+    waiting_time: Optional[Time] = None
+    turnaround_time: Optional[Time] = None
+
+    def __post_init__(self):
+        self.remaining = self.burst
+        self.sort_index = (self.priority, self.arrival, self.pid)
+
+# ---------------- Ready queue ----------------
+class BucketQueue:
+    # bucket queue: satu deque per tingkat prioritas (urut arrival), bitmap bucket tidak kosong
+    # di satu int -> insert O(1), bucket terbaik = bit terendah. Tingkat prioritas dipetakan
+    # ke indeks rapat (rank), jadi prioritas negatif / jarang tetap murah.
+    # aging (opsional): tiap `aging` satuan waktu menunggu sejak arrival menaikkan prioritas satu
+    # tingkat. Efektifnya priority - (t - arrival)/aging; urutan dua proses tidak berubah
+    # terhadap t, jadi cukup kunci statis aging*priority + arrival (lazy, tanpa rescan per tick).
+    # Di dalam satu bucket kunci itu naik sesuai arrival, jadi pop cukup membandingkan kepala
+    # tiap bucket yang tidak kosong.
+    def __init__(self, priorities, aging: Optional[Time] = None):
+        levels = sorted(set(priorities))
+        self.rank = {pr: i for i, pr in enumerate(levels)}
+        self.buckets = [deque() for _ in levels]
+        self.bitmap = 0
+        self.aging = aging
+
+    def push(self, p: "Process"):
+        i = self.rank[p.priority]
+        self.buckets[i].append(p)
+        self.bitmap |= 1 << i
+
+    def peek(self) -> Optional["Process"]:
+        bm = self.bitmap
+        if not bm:
+            return None
+        if self.aging is None:
+            return self.buckets[(bm & -bm).bit_length() - 1][0]
+        best = best_key = None
+        while bm:
+            low = bm & -bm
+            p = self.buckets[low.bit_length() - 1][0]
+            key = (self.aging * p.priority + p.arrival, p.priority)
+            if best is None or key < best_key:
+                best, best_key = p, key
+            bm ^= low
+        return best
+
+    def remove_head(self, p: "Process"):
+        # p harus kepala bucket-nya (proses yang sedang jalan selalu begitu)
+        i = self.rank[p.priority]
+        self.buckets[i].popleft()
+        if not self.buckets[i]:
+            self.bitmap &= ~(1 << i)
+
+# ---------------- Scheduling logic ----------------
+def simulate_priority_processes(proc_tuples: List[Tuple[str,Time,Time,int]], preemptive: bool=False, stats: Optional[SimStats] = None,
+                                cs_cost: Time = 0, dispatch_cost: Time = 0, aging: Optional[Time] = None):
+    if stats is not None:
+        t0 = perf_counter()
+    if aging is not None and aging <= 0:
+        raise ValueError("aging must be positive")
+    procs = [Process(pid, at, bt, pr) for (pid, at, bt, pr) in proc_tuples]
+    procs_sorted = sorted(procs, key=lambda p: (p.arrival, p.priority, p.pid))
+    n = len(procs)
+    time_now = 0
+    completed = 0
+    # proses yang sedang jalan tetap di kepala bucket-nya (tidak ada yang bisa menyalip di
+    # dalam bucket), dan baru dikeluarkan saat selesai
+    ready = BucketQueue((p.priority for p in procs), aging)
+    arrival_idx = 0
+    gantt_marks = []
+
+    def add_arrivals(t):
+        nonlocal arrival_idx
+        while arrival_idx < n and procs_sorted[arrival_idx].arrival <= t:
+            ready.push(procs_sorted[arrival_idx])
+            arrival_idx += 1
+
+    best = ready.peek
+
+    add_arrivals(time_now)
+    last_pid = None
+
+    if n == 0:
+        return procs, [], 0
+    if stats is not None:
+        t1 = perf_counter()
+
+    while completed < n:
+        cur = best()
+        if cur is None:
+            if arrival_idx < n:
+                time_now = procs_sorted[arrival_idx].arrival
+                add_arrivals(time_now)
+                continue
+            else:
+                break
+
+        if last_pid != cur.pid:
+            # overhead: context switch kalau ganti proses, lalu dispatch cost
+            if cs_cost and last_pid is not None:
+                gantt_marks.append((time_now, CS_PID))
+                time_now += cs_cost
+                add_arrivals(time_now)
+            if dispatch_cost:
+                gantt_marks.append((time_now, DISPATCH_PID))
+                time_now += dispatch_cost
+                add_arrivals(time_now)
+            if preemptive and best() is not cur:
+                # dikalahkan proses yang datang selama overhead: cur belum jalan, jadi tidak
+                # dapat start_time/segmen; konteks lama sudah disimpan, CS tidak ditagih lagi
+                last_pid = None
+                continue
+            gantt_marks.append((time_now, cur.pid))
+            last_pid = cur.pid
+        if cur.start_time is None:
+            cur.start_time = time_now
+
+        # event-driven: jalan sampai selesai, atau (preemptive) sampai arrival berikutnya
+        # kalau arrival itu mengalahkan proses sekarang
+        while True:
+            if preemptive and best() is not cur:
+                # dikalahkan proses yang datang selama overhead: dispatch ulang tanpa jalan
+                break
+            end = time_now + cur.remaining
+            if preemptive and arrival_idx < n and procs_sorted[arrival_idx].arrival < end:
+                t = procs_sorted[arrival_idx].arrival
+                cur.remaining -= t - time_now
+                time_now = t
+                add_arrivals(time_now)
+            else:
+                cur.remaining = 0
+                time_now = end
+                add_arrivals(time_now)
+                break
+        if cur.remaining == 0:
+            cur.completion_time = time_now
+            cur.turnaround_time = cur.completion_time - cur.arrival
+            cur.waiting_time = cur.turnaround_time - cur.burst
+            ready.remove_head(cur)
+            completed += 1
+
+    if stats is not None:
+        t2 = perf_counter()
+    merged = []
+    if gantt_marks:
+        done_at = {p.pid: p.completion_time for p in procs}
+        for i, (s, pid) in enumerate(gantt_marks):
+            if i == 0:
+                merged.append([s, None, pid])
+            else:
+                # segmen berhenti saat proses selesai, jangan ikut menutupi idle gap
+                prev = merged[-1]
+                done = done_at.get(prev[2])
+                prev[1] = min(s, done) if done is not None else s
+                merged.append([s, None, pid])
+        merged[-1][1] = time_now
+    gantt = [(m[0], m[1], m[2]) for m in merged]
+
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=t2 - t1, merge=perf_counter() - t2)
+        stats.collect(procs, gantt, time_now)
+    return procs, gantt, time_now
@@ -0,0 +1,263 @@
+#realtime.py
+# Halaman real-time: task periodik (period, WCET, deadline, phase) dijadwalkan dengan EDF atau
+# RM (engine di realtime_core.py, dijalankan di worker pool). Hasil per task: jumlah job,
+# deadline miss, response time dan lateness maksimum; gantt hanya menampilkan awal jadwal.
+from tkinter import *
+from tkinter import ttk, messagebox, filedialog
+import threading
+from typing import List
+import matplotlib
+try:
+    matplotlib.use("TkAgg")
+except Exception:
+    pass
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from pool import get_pool
+from realtime_core import (DEMO_TASKS, RTResult, RTTask, hyperperiod, read_taskset, rm_bound,
+                           simulate_realtime, utilization)
+from widgets import draw_gantt_3d
+from workload import parse_time
+
+# ---------------- UI constants ----------------
+APP_BG = "#69259c"
+BAR_COLOR = "#fb47b2"
+TEXT_COLOR = "#ffddff"
+GANTT_SEGMENTS = 300     # batang 3D mahal; gantt cukup potongan awal jadwal
+
+# ---------------- RealTimePage ----------------
+class RealTimePage(Frame):
+    def __init__(self, parent, app=None):
+        super().__init__(parent, bg=APP_BG)
+        self.pack(fill=BOTH, expand=True)
+        self.app = app
+
+        self.fig = plt.Figure(figsize=(7,5), dpi=100)
+        self.ax = self.fig.add_subplot(111, projection='3d')
+        self.fig.patch.set_facecolor(APP_BG)
+
+        self.task_list: List[RTTask] = []
+
+        # Layout: three columns
+        main_frame = Frame(self, bg=APP_BG)
+        main_frame.pack(fill=BOTH, expand=True, padx=8, pady=8)
+
+        left_frame = Frame(main_frame, bg=APP_BG, width=330)
+        left_frame.pack(side=LEFT, fill=Y, padx=6, pady=6)
+        left_frame.pack_propagate(False)
+
+        mid_frame = Frame(main_frame, bg=APP_BG, width=460)
+        mid_frame.pack(side=LEFT, fill=Y, padx=6, pady=6)
+        mid_frame.pack_propagate(False)
+
+        right_frame = Frame(main_frame, bg=APP_BG)
+        right_frame.pack(side=LEFT, fill=BOTH, expand=True, padx=6, pady=6)
+
+        # Left widgets
+        Label(left_frame, text="Real-Time Scheduler", font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
+
+        inp_frame = Frame(left_frame, bg=APP_BG)
+        inp_frame.pack(pady=6)
+        Label(inp_frame, text="Period", bg=APP_BG).grid(row=0, column=0, padx=4, pady=4)
+        self.entry_period = Entry(inp_frame, width=6); self.entry_period.grid(row=0, column=1, padx=4)
+        Label(inp_frame, text="WCET", bg=APP_BG).grid(row=0, column=2, padx=4, pady=4)
+        self.entry_wcet = Entry(inp_frame, width=6); self.entry_wcet.grid(row=0, column=3, padx=4)
+        Label(inp_frame, text="Deadline", bg=APP_BG).grid(row=1, column=0, padx=4, pady=4)
+        self.entry_deadline = Entry(inp_frame, width=6); self.entry_deadline.grid(row=1, column=1, padx=4)  # kosong = period
+        Label(inp_frame, text="Phase", bg=APP_BG).grid(row=1, column=2, padx=4, pady=4)
+        self.entry_phase = Entry(inp_frame, width=6); self.entry_phase.grid(row=1, column=3, padx=4)
+
+        self.btn_add = Button(left_frame, text="➕ Add Task", bg=BAR_COLOR, fg="white", command=self.add_task)
+        self.btn_add.pack(fill=X, padx=12, pady=6)
+
+        prm_frame = Frame(left_frame, bg=APP_BG)
+        prm_frame.pack(pady=4, fill=X)
+        self.policy_var = StringVar(value="edf")
+        Radiobutton(prm_frame, text="EDF", variable=self.policy_var, value="edf", bg=APP_BG).pack(side=LEFT, padx=6)
+        Radiobutton(prm_frame, text="RM", variable=self.policy_var, value="rm", bg=APP_BG).pack(side=LEFT, padx=6)
+        self.abort_var = BooleanVar(value=False)
+        Checkbutton(prm_frame, text="Abort late jobs", variable=self.abort_var, bg=APP_BG).pack(side=LEFT, padx=6)
+
+        hz_frame = Frame(left_frame, bg=APP_BG)
+        hz_frame.pack(pady=2, fill=X)
+        Label(hz_frame, text="Horizon", bg=APP_BG).pack(side=LEFT, padx=4)
+        self.entry_horizon = Entry(hz_frame, width=10); self.entry_horizon.pack(side=LEFT, padx=2)   # kosong = hyperperiod
+        Label(hz_frame, text="(empty = hyperperiod)", bg=APP_BG).pack(side=LEFT, padx=2)
+
+        ctrl_frame = Frame(left_frame, bg=APP_BG)
+        ctrl_frame.pack(pady=6, fill=X)
+        self.btn_start = Button(ctrl_frame, text="▶ Start", bg="#f2d6ef", command=self.run_sim)
+        self.btn_start.pack(side=LEFT, padx=6)
+        self.btn_reset = Button(ctrl_frame, text="🔁 Reset", bg="#f2d6ef", command=self.reset_all)
+        self.btn_reset.pack(side=LEFT, padx=6)
+        self.btn_import = Button(ctrl_frame, text="Import CSV", bg="#f2d6ef", command=self.import_csv)
+        self.btn_import.pack(side=LEFT, padx=6)
+
+        Label(left_frame, text="Results (per-task)", bg=APP_BG, fg=TEXT_COLOR, font=("Segoe UI",11,"bold")).pack(pady=6)
+        res_cols = ("Task","Jobs","Miss","MaxR","MaxL")
+        self.res_tree = ttk.Treeview(left_frame, columns=res_cols, show="headings", height=8)
+        for c in res_cols:
+            self.res_tree.heading(c, text=c)
+            self.res_tree.column(c, width=56, anchor=CENTER)
+        self.res_tree.pack(fill=BOTH, expand=False, padx=8, pady=6)
+
+        self.avg_label = Label(left_frame, text="", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR, justify=LEFT)
+        self.avg_label.pack(pady=6)
+
+        # Middle: task set + back button
+        Label(mid_frame, text="Task set", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
+        cols = ("Task","Period","WCET","Deadline","Phase")
+        self.tree = ttk.Treeview(mid_frame, columns=cols, show="headings", height=18)
+        for c in cols:
+            self.tree.heading(c, text=c)
+            self.tree.column(c, width=80, anchor=CENTER)
+        self.tree.pack(fill=BOTH, expand=True, padx=6, pady=6)
+
+        self.util_label = Label(mid_frame, text="", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR, justify=LEFT)
+        self.util_label.pack(pady=4)
+
+        mid_btn_frame = Frame(mid_frame, bg=APP_BG)
+        mid_btn_frame.pack(fill=X, pady=4)
+        self.btn_back = Button(mid_btn_frame, text="↩ Back", bg="#f2d6ef", command=self._on_back)
+        self.btn_back.pack(side=LEFT, padx=6)
+
+        # Right: 3D Gantt
+        Label(right_frame, text="3D Gantt Chart", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=6, pady=6)
+
+        self.load_sample()
+
+    # ----- helpers -----
+    def update_treeviews(self):
+        self.tree.delete(*self.tree.get_children())
+        for t in self.task_list:
+            self.tree.insert("", END, values=(t.name, t.period, t.wcet, t.deadline, t.phase))
+        n = len(self.task_list)
+        if n:
+            self.util_label.config(text=f"U = {utilization(self.task_list):.3f}   RM bound {rm_bound(n):.3f}\n"
+                                        f"Hyperperiod {hyperperiod(self.task_list)}")
+        else:
+            self.util_label.config(text="")
+
+    def add_task(self):
+        try:
+            period = parse_time(self.entry_period.get())
+            wcet = parse_time(self.entry_wcet.get())
+            deadline = parse_time(self.entry_deadline.get()) if self.entry_deadline.get().strip() else None
+            phase = parse_time(self.entry_phase.get()) if self.entry_phase.get().strip() else 0
+            task = RTTask(f"T{len(self.task_list)+1}", period, wcet, deadline, phase)
+            task.validate()
+        except ValueError:
+            messagebox.showerror("Input Error", "Period, WCET and deadline must be positive numbers, phase >= 0.")
+            return
+        self.task_list.append(task)
+        self.update_treeviews()
+        for e in (self.entry_period, self.entry_wcet, self.entry_deadline, self.entry_phase):
+            e.delete(0, END)
+
+    def load_sample(self):
+        self.task_list = [RTTask(t.name, t.period, t.wcet, t.deadline, t.phase) for t in DEMO_TASKS]
+        self.update_treeviews()
+
+    def import_csv(self):
+        path = filedialog.askopenfilename(filetypes=[("CSV files","*.csv"),("All files","*.*")])
+        if not path:
+            return
+        try:
+            self.task_list = read_taskset(path)
+            self.update_treeviews()
+        except Exception as e:
+            messagebox.showerror("CSV Error", f"Failed to read CSV: {e}")
+
+    def reset_all(self):
+        self.task_list = []
+        self.update_treeviews()
+        self.res_tree.delete(*self.res_tree.get_children())
+        self.avg_label.config(text="")
+        self.ax.clear()
+        self.canvas.draw()
+
+    # ----- simulate -----
+    def run_sim(self):
+        if not self.task_list:
+            messagebox.showwarning("No tasks", "Add at least one task first.")
+            return
+        try:
+            horizon = parse_time(self.entry_horizon.get()) if self.entry_horizon.get().strip() else None
+            if horizon is not None and horizon <= 0: raise ValueError
+        except ValueError:
+            messagebox.showerror("Input Error", "Horizon must be a positive number or empty.")
+            return
+        self.btn_start.config(state=DISABLED)
+        self.btn_reset.config(state=DISABLED)
+        self.avg_label.config(text="Running...")
+        tasks = list(self.task_list)
+        policy = self.policy_var.get()
+        abort_late = self.abort_var.get()
+        def worker():
+            try:
+                res = get_pool().submit(simulate_realtime, tasks, policy, horizon, abort_late,
+                                        GANTT_SEGMENTS).result()
+            except Exception as e:
+                self.after(0, self.sim_failed, e)
+                return
+            self.after(0, self.update_after_sim, res)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def sim_failed(self, err):
+        messagebox.showerror("Error", f"Simulation failed: {err}")
+        self.avg_label.config(text="")
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def fill_results(self, res: RTResult):
+        self.res_tree.delete(*self.res_tree.get_children())
+        for name, st in res.per_task.items():
+            late = "-" if st.max_lateness is None else st.max_lateness
+            self.res_tree.insert("", END, values=(name, st.jobs, st.misses, st.max_response, late))
+
+    def update_after_sim(self, res: RTResult):
+        self.fill_results(res)
+        self.avg_label.config(text=res.summary_text())
+        self.render_3d_gantt(res)
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def render_3d_gantt(self, res: RTResult):
+        self.fig.patch.set_facecolor(APP_BG)
+        title = f"3D Gantt ({res.policy.upper()})"
+        if res.gantt_truncated:
+            title += f" - first {len(res.gantt)} segments"
+        total_time = res.gantt[-1][1] if res.gantt else 0
+        draw_gantt_3d(self.ax, res.gantt, title, APP_BG, BAR_COLOR, TEXT_COLOR,
+                      pids=list(res.per_task), total_time=total_time)
+        self.canvas.draw()
+
+    # ----- back handling -----
+    def _on_back(self):
+        if getattr(self, "app", None):
+            try:
+                if hasattr(self.app, "_mode_page"):
+                    self.app._mode_page()
+                else:
+                    self.app._home_page()
+            except Exception:
+                pass
+        else:
+            top = self.winfo_toplevel()
+            try:
+                top.destroy()
+            except:
+                pass
+
+# ---------------- standalone fallback ----------------
+def main_standalone():
+    root = Tk()
+    root.title("Real-Time Scheduler - Kelompok 4 AB")
+    root.geometry("1300x760")
+    RealTimePage(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main_standalone()
@@ -0,0 +1,278 @@
+#realtime_core.py
+# Engine real-time periodik tanpa dependensi UI; dipakai realtime.py dan CLI di bawah.
+# Task set = daftar task periodik (phase, period, wcet, deadline relatif). Job ke-k task i
+# rilis di phase + k*period dengan deadline absolut rilis + deadline. Job tidak pernah dibuat
+# sekaligus: heap rilis hanya berisi satu entri per task (rilis berikutnya), jadi memori
+# sebanding jumlah task + backlog ready queue, bukan jumlah job di hyperperiod.
+# Kebijakan (preemptive, single CPU):
+# - EDF: ready heap dengan kunci deadline absolut
+# - RM : prioritas statis per task, period terpendek menang
+# Statistik per job (response time, lateness) langsung diakumulasi lalu dibuang; gantt hanya
+# disimpan sampai gantt_limit segmen pertama (untuk tampilan).
+import argparse, csv, heapq, math, sys
+from dataclasses import dataclass, field
+from fractions import Fraction
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence, Tuple
+from instrument import Time
+from metrics import Summary, _StreamSummary
+from workload import parse_time
+
+POLICIES = ("edf", "rm")
+
+# ---------------- Task set ----------------
+@dataclass
+class RTTask:
+    name: str
+    period: Time
+    wcet: Time
+    deadline: Optional[Time] = None     # None = implicit deadline (= period)
+    phase: Time = 0
+
+    def __post_init__(self):
+        if self.deadline is None:
+            self.deadline = self.period
+
+    def validate(self):
+        if self.period <= 0 or self.wcet <= 0 or self.deadline <= 0:
+            raise ValueError(f"{self.name}: period, wcet and deadline must be positive")
+        if self.phase < 0:
+            raise ValueError(f"{self.name}: phase must be >= 0")
+
+def utilization(tasks: Sequence[RTTask]) -> float:
+    return sum(t.wcet / t.period for t in tasks)
+
+def rm_bound(n: int) -> float:
+    # batas Liu & Layland: RM pasti feasible kalau U <= n(2^(1/n) - 1) (deadline = period)
+    return n * (2 ** (1 / n) - 1) if n else 0.0
+
+def hyperperiod(tasks: Sequence[RTTask]) -> Time:
+    # lcm semua period; period pecahan lewat Fraction (lcm pembilang / gcd penyebut)
+    fr = [Fraction(t.period).limit_denominator(10**9) for t in tasks]
+    if not fr:
+        return 0
+    num = math.lcm(*(f.numerator for f in fr))
+    den = math.gcd(*(f.denominator for f in fr))
+    h = Fraction(num, den)
+    return int(h) if h.denominator == 1 else float(h)
+
+def read_taskset(path: str) -> List[RTTask]:
+    # CSV: name,period,wcet[,deadline[,phase]]; header opsional, deadline kosong = period
+    tasks = []
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            row = [c.strip() for c in row]
+            if not row or not row[0] or row[0].startswith("#"):
+                continue
+            try:
+                period, wcet = parse_time(row[1]), parse_time(row[2])
+            except (IndexError, ValueError):
+                if not tasks and row[0].lower() == "name":
+                    continue          # header
+                raise ValueError(f"{path}: bad task row {row!r}")
+            deadline = parse_time(row[3]) if len(row) > 3 and row[3] else None
+            phase = parse_time(row[4]) if len(row) > 4 and row[4] else 0
+            tasks.append(RTTask(row[0], period, wcet, deadline, phase))
+    return tasks
+
+# ---------------- Result ----------------
+@dataclass
+class TaskStats:
+    jobs: int = 0
+    misses: int = 0
+    aborted: int = 0
+    max_response: Time = 0
+    max_lateness: Optional[Time] = None   # maksimum completion - deadline (boleh negatif)
+
+@dataclass
+class RTResult:
+    policy: str
+    horizon: Time
+    utilization: float
+    jobs: int = 0
+    misses: int = 0
+    aborted: int = 0
+    busy_time: Time = 0
+    end_time: Time = 0
+    context_switches: int = 0
+    preemptions: int = 0
+    ready_peak: int = 0
+    response: Summary = field(default_factory=Summary)
+    lateness: Summary = field(default_factory=Summary)     # hanya job yang terlambat (> 0)
+    per_task: Dict[str, TaskStats] = field(default_factory=dict)
+    gantt: List[Tuple[Time, Time, str]] = field(default_factory=list)
+    gantt_truncated: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def miss_ratio(self) -> float:
+        return self.misses / self.jobs if self.jobs else 0.0
+
+    def summary_text(self) -> str:
+        lines = [f"{self.policy.upper()}  U = {self.utilization:.3f}  horizon {self.horizon}",
+                 f"Jobs {self.jobs}  misses {self.misses} ({self.miss_ratio * 100:.2f}%)"
+                 + (f"  aborted {self.aborted}" if self.aborted else ""),
+                 f"Response  mean {self.response.mean:.2f}  {self.response.short()}"]
+        if self.misses:
+            lines.append(f"Lateness  mean {self.lateness.mean:.2f}  {self.lateness.short()}")
+        lines.append(f"Ctx switches {self.context_switches}  preemptions {self.preemptions}  "
+                     f"ready peak {self.ready_peak}")
+        return "\n".join(lines)
+
+# ---------------- Scheduling logic ----------------
+def simulate_realtime(tasks: Sequence[RTTask], policy: str = "edf", horizon: Optional[Time] = None,
+                      abort_late: bool = False, gantt_limit: int = 10000) -> RTResult:
+    # job dirilis dalam [0, horizon) (default: phase terbesar + hyperperiod), lalu disimulasikan
+    # sampai semuanya selesai. abort_late=True: deadline firm, job dibuang saat deadline lewat.
+    t0 = perf_counter()
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    for t in tasks:
+        t.validate()
+    if horizon is None:
+        horizon = max((t.phase for t in tasks), default=0) + hyperperiod(tasks)
+    res = RTResult(policy, horizon, utilization(tasks),
+                   per_task={t.name: TaskStats() for t in tasks})
+    response = _StreamSummary()
+    lateness = _StreamSummary()
+    stats = [res.per_task[t.name] for t in tasks]
+
+    # rilis berikutnya per task: (waktu, indeks task, k)
+    releases = [(t.phase, i, 0) for i, t in enumerate(tasks) if t.phase < horizon]
+    heapq.heapify(releases)
+    # item ready: (kunci..., job); job = [task, release, deadline, remaining]
+    # kunci unik per job (task + release), jadi list job tidak pernah dibandingkan
+    ready: List[tuple] = []
+    gantt = res.gantt
+    time_now = 0
+    last_job = None
+
+    def release_due(t):
+        while releases and releases[0][0] <= t:
+            r, i, k = heapq.heappop(releases)
+            task = tasks[i]
+            d = r + task.deadline
+            job = [i, r, d, task.wcet]
+            key = (d, r, i) if policy == "edf" else (task.period, i, r)
+            heapq.heappush(ready, (*key, job))
+            nxt = task.phase + (k + 1) * task.period
+            if nxt < horizon:
+                heapq.heappush(releases, (nxt, i, k + 1))
+        if len(ready) > res.ready_peak:
+            res.ready_peak = len(ready)
+
+    def finish(job, t):
+        i, r, d = job[0], job[1], job[2]
+        st = stats[i]
+        st.jobs += 1
+        res.jobs += 1
+        rt = t - r
+        response.add(rt)
+        if rt > st.max_response:
+            st.max_response = rt
+        late = t - d
+        if st.max_lateness is None or late > st.max_lateness:
+            st.max_lateness = late
+        if late > 0:
+            st.misses += 1
+            res.misses += 1
+            lateness.add(late)
+
+    def abort(job):
+        st = stats[job[0]]
+        st.jobs += 1
+        st.misses += 1
+        st.aborted += 1
+        res.jobs += 1
+        res.misses += 1
+        res.aborted += 1
+
+    while releases or ready:
+        release_due(time_now)
+        if not ready:
+            time_now = releases[0][0]
+            continue
+        job = ready[0][-1]
+        if abort_late and job[2] <= time_now:
+            heapq.heappop(ready)
+            abort(job)
+            continue
+        end = time_now + job[3]
+        stop = end
+        if releases and releases[0][0] < stop:
+            stop = releases[0][0]
+        if abort_late and job[2] < stop:
+            stop = job[2]
+
+        if job is not last_job:
+            if last_job is not None:
+                res.context_switches += 1
+            last_job = job
+        name = tasks[job[0]].name
+        if gantt and gantt[-1][2] == name and gantt[-1][1] == time_now:
+            gantt[-1] = (gantt[-1][0], stop, name)
+        elif len(gantt) < gantt_limit:
+            gantt.append((time_now, stop, name))
+        else:
+            res.gantt_truncated = True
+        res.busy_time += stop - time_now
+
+        if stop == end:
+            heapq.heappop(ready)
+            job[3] = 0
+            time_now = end
+            finish(job, time_now)
+        else:
+            job[3] -= stop - time_now
+            time_now = stop
+            if abort_late and job[2] <= time_now:
+                heapq.heappop(ready)
+                abort(job)
+            else:
+                release_due(time_now)
+                if ready[0][-1] is not job:
+                    res.preemptions += 1
+
+    res.end_time = time_now
+    res.response = response.result()
+    res.lateness = lateness.result()
+    res.elapsed = perf_counter() - t0
+    return res
+
+# ---------------- CLI ----------------
+DEMO_TASKS = [RTTask("T1", 5, 1), RTTask("T2", 7, 2), RTTask("T3", 11, 3), RTTask("T4", 13, 2)]
+
+def format_tasks(res: RTResult) -> str:
+    lines = [f"{'task':<10}{'jobs':>10}{'misses':>10}{'aborted':>9}{'max resp':>12}{'max late':>12}"]
+    for name, st in res.per_task.items():
+        late = "-" if st.max_lateness is None else f"{st.max_lateness:g}"
+        lines.append(f"{name:<10}{st.jobs:>10}{st.misses:>10}{st.aborted:>9}{st.max_response:>12g}{late:>12}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Simulate a periodic real-time task set under EDF or RM.")
+    ap.add_argument("taskset", nargs="?", help="CSV: name,period,wcet[,deadline[,phase]] (default: built-in demo set)")
+    ap.add_argument("--policy", choices=POLICIES + ("both",), default="both")
+    ap.add_argument("--horizon", type=parse_time, default=None, help="release jobs in [0, horizon) (default: max phase + hyperperiod)")
+    ap.add_argument("--abort-late", action="store_true", help="firm deadlines: drop a job when its deadline passes")
+    args = ap.parse_args(argv)
+
+    try:
+        tasks = read_taskset(args.taskset) if args.taskset else DEMO_TASKS
+    except (OSError, ValueError) as e:
+        ap.error(str(e))
+    n = len(tasks)
+    print(f"{n} tasks, U = {utilization(tasks):.3f} (RM bound {rm_bound(n):.3f}), hyperperiod {hyperperiod(tasks)}")
+    for policy in (POLICIES if args.policy == "both" else (args.policy,)):
+        try:
+            res = simulate_realtime(tasks, policy, args.horizon, args.abort_late, gantt_limit=0)
+        except ValueError as e:
+            ap.error(str(e))
+        print()
+        print(res.summary_text())
+        print(format_tasks(res))
+        print(f"({res.elapsed:.2f}s, {res.jobs / res.elapsed if res.elapsed else 0:,.0f} jobs/s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
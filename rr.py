@@ -2,7 +2,6 @@
 from tkinter import *
 from tkinter import ttk, messagebox, filedialog
 import threading
-from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 import matplotlib
 try:
@@ -12,58 +11,13 @@ except Exception:
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import deque
-
-# ---------------- Data class ----------------
-@dataclass
-class Process:
-    pid: str
-    arrival: int
-    burst: int
-    remaining: int = field(init=False)
-    start_time: Optional[int] = None
-    completion_time: Optional[int] = None
-    waiting_time: Optional[int] = None
-    turnaround_time: Optional[int] = None
-
-    def __post_init__(self):
-        self.remaining = self.burst
-
-# ---------------- Scheduling logic ----------------
-def simulate_rr(proc_tuples: List[Tuple[str,int,int]], quantum: int = 2):
-    procs = [Process(pid, at, bt) for (pid, at, bt) in proc_tuples]
-    time_now = 0
-    completed = 0
-    n = len(procs)
-    gantt: List[Tuple[int,int,str]] = []
-    ready_queue = deque()
-    while completed < n:
-        # Add arrived processes
-        for p in procs:
-            if p.start_time is None and p.arrival <= time_now and p not in ready_queue:
-                ready_queue.append(p)
-        if not ready_queue:
-            time_now += 1
-            continue
-        cur = ready_queue.popleft()
-        if cur.start_time is None:
-            cur.start_time = time_now
-        run_time = min(cur.remaining, quantum)
-        gantt.append((time_now, time_now + run_time, cur.pid))
-        cur.remaining -= run_time
-        time_now += run_time
-        # Add newly arrived processes during execution
-        for p in procs:
-            if p.start_time is None and p.arrival <= time_now and p not in ready_queue:
-                ready_queue.append(p)
-        if cur.remaining > 0:
-            ready_queue.append(cur)
-        else:
-            cur.completion_time = time_now
-            cur.turnaround_time = cur.completion_time - cur.arrival
-            cur.waiting_time = cur.turnaround_time - cur.burst
-            completed += 1
-    return procs, gantt, time_now
+from rr_core import Process, simulate_rr
+from instrument import SimStats
+from metrics import compute_metrics
+from widgets import StatsPanel, SMPControls, draw_gantt_3d
+from pool import get_pool
+from playback import PlaybackWindow
+from workload import parse_time
 
 # ---------------- UI constants ----------------
 APP_BG = "#69259c"
@@ -72,6 +26,10 @@ TEXT_COLOR = "#ffddff"
 
 # ---------------- RRPage ----------------
 class RRPage(Frame):
+    PAGE_TITLE = "Round Robin Scheduler"
+    GANTT_TITLE = "3D Gantt (Round Robin)"
+    PNG_NAME = "gantt_rr.png"
+
     def __init__(self, parent, app=None):
         super().__init__(parent, bg=APP_BG)
         self.pack(fill=BOTH, expand=True)
@@ -83,6 +41,7 @@ class RRPage(Frame):
         self.fig.patch.set_facecolor(APP_BG)
 
         self.process_list: List[Tuple[str,int,int]] = []
+        self.last_run = None   # (gantt, procs_meta, total_time) untuk playback
 
         # Layout: three columns
         main_frame = Frame(self, bg=APP_BG)
@@ -103,7 +62,7 @@ class RRPage(Frame):
         right_frame.pack(side=LEFT, fill=BOTH, expand=True, padx=6, pady=6)
 
         # Left widgets
-        Label(left_frame, text="Round Robin Scheduler", font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
+        Label(left_frame, text=self.PAGE_TITLE, font=("Segoe UI", 16, "bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=8)
 
         inp_frame = Frame(left_frame, bg=APP_BG)
         inp_frame.pack(pady=6)
@@ -112,10 +71,7 @@ class RRPage(Frame):
         Label(inp_frame, text="Burst", bg=APP_BG).grid(row=0, column=2, padx=4, pady=4)
         self.entry_bt = Entry(inp_frame, width=6); self.entry_bt.grid(row=0, column=3, padx=4)
 
-        Label(left_frame, text="Quantum:", bg=APP_BG).pack(anchor=W, padx=12)
-        self.entry_q = Entry(left_frame, width=6)
-        self.entry_q.pack(anchor=W, padx=12, pady=4)
-        self.entry_q.insert(0,"2")
+        self.build_params(left_frame)
 
         self.btn_add = Button(left_frame, text="➕ Add Process", bg=BAR_COLOR, fg="white", command=self.add_process)
         self.btn_add.pack(fill=X, padx=12, pady=6)
@@ -127,6 +83,9 @@ class RRPage(Frame):
         self.btn_reset = Button(ctrl_frame, text="🔁 Reset", bg="#f2d6ef", command=self.reset_all)
         self.btn_reset.pack(side=LEFT, padx=6)
 
+        self.smp_controls = SMPControls(left_frame, bg=APP_BG)
+        self.smp_controls.pack(pady=4, fill=X)
+
         scale_frame = Frame(left_frame, bg=APP_BG)
         scale_frame.pack(pady=8, fill=X)
         Label(scale_frame, text="Gantt scale (px/unit):", bg=APP_BG).pack(anchor=W, padx=6)
@@ -136,6 +95,8 @@ class RRPage(Frame):
 
         self.btn_save = Button(left_frame, text="Save Gantt PNG", fg="white", bg="#fb47b2", command=self.save_gantt_png)
         self.btn_save.pack(fill=X, padx=12, pady=6)
+        self.btn_play = Button(left_frame, text="▶ Playback", bg="#f2d6ef", command=self.open_playback)
+        self.btn_play.pack(fill=X, padx=12, pady=2)
 
         Label(left_frame, text="Results (per-process)", bg=APP_BG, fg=TEXT_COLOR, font=("Segoe UI",11,"bold")).pack(pady=6)
         res_cols = ("PID","AT","BT","ST","CT","TAT","WT")
@@ -145,9 +106,12 @@ class RRPage(Frame):
             self.res_tree.column(c, width=36, anchor=CENTER)
         self.res_tree.pack(fill=BOTH, expand=False, padx=8, pady=6)
 
-        self.avg_label = Label(left_frame, text="Avg WT: -    Avg TAT: -", bg=APP_BG, font=("Segoe UI",11,"bold"), fg=TEXT_COLOR)
+        self.avg_label = Label(left_frame, text="Avg WT: -    Avg TAT: -", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR, justify=LEFT)
         self.avg_label.pack(pady=6)
 
+        self.stats_panel = StatsPanel(left_frame, bg=APP_BG, fg=TEXT_COLOR)
+        self.stats_panel.pack(fill=X, padx=6, pady=2)
+
         # Middle: process list + back button
         Label(mid_frame, text="Processes", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
         cols = ("PID","Arrival","Burst")
@@ -177,10 +141,10 @@ class RRPage(Frame):
 
     def add_process(self):
         try:
-            at = int(self.entry_at.get())
-            bt = int(self.entry_bt.get())
+            at = parse_time(self.entry_at.get())
+            bt = parse_time(self.entry_bt.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Arrival and Burst must be integers.")
+            messagebox.showerror("Input Error", "Arrival and Burst must be numbers.")
             return
         pid = f"P{len(self.process_list)+1}"
         self.process_list.append((pid, at, bt))
@@ -196,34 +160,16 @@ class RRPage(Frame):
         self.update_treeviews()
         self.res_tree.delete(*self.res_tree.get_children())
         self.avg_label.config(text="Avg WT: -    Avg TAT: -")
+        self.stats_panel.clear()
+        self.last_run = None
         self.ax.clear()
         self.canvas.draw()
 
     # ----- Gantt rendering -----
     def render_3d_gantt(self, gantt_segments: List[Tuple[int,int,str]], procs_meta: List[Process], total_time: int):
-        ax = self.ax
-        fig = self.fig
-        ax.clear()
-        ax.set_facecolor(APP_BG)
-        fig.patch.set_facecolor(APP_BG)
-        y_pos = {pid: idx for idx,pid in enumerate([seg[2] for seg in gantt_segments])}
-        xs=[]; ys=[]; zs=[]; dxs=[]; dys=[]; dzs=[]; colors=[]
-        for start,end,pid in gantt_segments:
-            dur = end - start
-            xs.append(start); ys.append(y_pos[pid]); zs.append(0)
-            dxs.append(dur); dys.append(0.6); dzs.append(1)
-            colors.append(BAR_COLOR)
-        if xs:
-            ax.bar3d(xs, ys, zs, dxs, dys, dzs, color=colors, shade=True, edgecolor="#222222", linewidth=0.2)
-        ax.set_yticks(list(y_pos.values()))
-        ax.set_yticklabels(list(y_pos.keys()))
-        ax.set_xlabel("Time")
-        ax.set_zlim(0,1.5)
-        ax.set_zlabel("")
-        ax.set_title("3D Gantt (Round Robin)", color=TEXT_COLOR)
-        ax.view_init(elev=20, azim=-60)
-        step = max(1, max([seg[1] for seg in gantt_segments]+[1])//10)
-        ax.set_xticks(range(0, max([seg[1] for seg in gantt_segments]+[1])+1, step))
+        self.fig.patch.set_facecolor(APP_BG)
+        draw_gantt_3d(self.ax, gantt_segments, self.GANTT_TITLE, APP_BG, BAR_COLOR, TEXT_COLOR,
+                      pids=[p.pid for p in procs_meta], total_time=total_time)
         self.canvas.draw()
 
     # ----- simulate -----
@@ -234,20 +180,89 @@ class RRPage(Frame):
         self.btn_start.config(state=DISABLED)
         self.btn_reset.config(state=DISABLED)
         snapshot = self.process_list.copy()
+        stats = self.stats_panel.new_stats()
         try:
-            q = int(self.entry_q.get())
-            if q <= 0: raise ValueError
-        except:
-            messagebox.showerror("Input Error", "Quantum must be a positive integer.")
+            cores = self.smp_controls.cores()
+        except ValueError:
+            messagebox.showerror("Input Error", "Cores must be a positive integer.")
+            self.btn_start.config(state=NORMAL)
+            self.btn_reset.config(state=NORMAL)
+            return
+        per_core = self.smp_controls.per_core
+        try:
+            params = self.read_params()
+            if cores > 1 and (params.get("cs_cost") or params.get("dispatch_cost")):
+                # engine SMP belum memodelkan overhead; jangan diam-diam dibuang
+                raise ValueError("CS and dispatch cost are only modelled on a single core; set them to 0 or use 1 core.")
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
             self.btn_start.config(state=NORMAL)
             self.btn_reset.config(state=NORMAL)
             return
         def worker():
-            procs_meta, gantt, total_time = simulate_rr(snapshot, quantum=q)
-            self.after(0, self.update_after_sim, procs_meta, gantt, total_time)
+            try:
+                procs_meta, gantt, total_time = self.simulate(snapshot, params, stats, cores, per_core)
+            except Exception as e:
+                self.after(0, self.sim_failed, e)
+                return
+            self.after(0, self.update_after_sim, procs_meta, gantt, total_time, stats, cores)
         threading.Thread(target=worker).start()
 
-    def update_after_sim(self, procs_meta: List[Process], gantt: List[Tuple[int,int,str]], total_time: int):
+    def sim_failed(self, err):
+        messagebox.showerror("Error", f"Simulation failed: {err}")
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    # ----- parameter hooks (di-override oleh halaman turunan, mis. MLFQ) -----
+    def build_params(self, left_frame):
+        Label(left_frame, text="Quantum:", bg=APP_BG).pack(anchor=W, padx=12)
+        self.entry_q = Entry(left_frame, width=6)
+        self.entry_q.pack(anchor=W, padx=12, pady=4)
+        self.entry_q.insert(0,"2")
+
+        ovh_frame = Frame(left_frame, bg=APP_BG)
+        ovh_frame.pack(anchor=W, padx=12, pady=2)
+        Label(ovh_frame, text="CS cost", bg=APP_BG).pack(side=LEFT, padx=2)
+        self.entry_cs = Entry(ovh_frame, width=4); self.entry_cs.pack(side=LEFT, padx=2)
+        self.entry_cs.insert(0, "0")
+        Label(ovh_frame, text="Dispatch cost", bg=APP_BG).pack(side=LEFT, padx=2)
+        self.entry_disp = Entry(ovh_frame, width=4); self.entry_disp.pack(side=LEFT, padx=2)
+        self.entry_disp.insert(0, "0")
+
+    def read_params(self) -> dict:
+        try:
+            q = parse_time(self.entry_q.get())
+        except ValueError:
+            q = 0
+        if q <= 0:
+            raise ValueError("Quantum must be a positive number.")
+        try:
+            cs = parse_time(self.entry_cs.get() or 0)
+            disp = parse_time(self.entry_disp.get() or 0)
+        except ValueError:
+            cs = disp = -1
+        if cs < 0 or disp < 0:
+            raise ValueError("CS and dispatch cost must be non-negative numbers.")
+        return {"quantum": q, "cs_cost": cs, "dispatch_cost": disp}
+
+    def simulate(self, snapshot, params: dict, stats: Optional[SimStats], cores: int, per_core: bool):
+        if cores > 1:
+            return get_pool().simulate("smp", snapshot, stats=stats, algorithm="rr", cores=cores,
+                                       per_core=per_core, quantum=params["quantum"])
+        return get_pool().simulate("rr", snapshot, stats=stats, quantum=params["quantum"],
+                                   cs_cost=params["cs_cost"], dispatch_cost=params["dispatch_cost"])
+
+    def update_after_sim(self, procs_meta: List[Process], gantt: List[Tuple[int,int,str]], total_time: int, stats: Optional[SimStats] = None, cores: int = 1):
+        self.fill_results(procs_meta)
+        metrics = compute_metrics(procs_meta, gantt, total_time, stats, cores=cores)
+        self.avg_label.config(text=metrics.summary_text())
+        self.render_3d_gantt(gantt, procs_meta, total_time)
+        self.last_run = (gantt, procs_meta, total_time)
+        self.stats_panel.show(stats)
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def fill_results(self, procs_meta: List[Process]):
         self.res_tree.delete(*self.res_tree.get_children())
         for p in procs_meta:
             st = p.start_time if p.start_time is not None else "-"
@@ -255,17 +270,16 @@ class RRPage(Frame):
             tat = p.turnaround_time if p.turnaround_time is not None else "-"
             wt = p.waiting_time if p.waiting_time is not None else "-"
             self.res_tree.insert("", END, values=(p.pid, p.arrival, p.burst, st, ct, tat, wt))
-        tats = [p.turnaround_time for p in procs_meta if p.turnaround_time is not None]
-        wts = [p.waiting_time for p in procs_meta if p.waiting_time is not None]
-        avg_tat = sum(tats)/len(tats) if tats else 0
-        avg_wt = sum(wts)/len(wts) if wts else 0
-        self.avg_label.config(text=f"Avg WT: {avg_wt:.2f}    Avg TAT: {avg_tat:.2f}")
-        self.render_3d_gantt(gantt, procs_meta, total_time)
-        self.btn_start.config(state=NORMAL)
-        self.btn_reset.config(state=NORMAL)
+
+    def open_playback(self):
+        if self.last_run is None:
+            messagebox.showinfo("Playback", "Run the simulation first.")
+            return
+        gantt, procs_meta, total_time = self.last_run
+        PlaybackWindow(self, gantt, procs_meta, total_time, f"Playback ({self.PAGE_TITLE})", APP_BG, TEXT_COLOR)
 
     def save_gantt_png(self):
-        p = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG","*.png")], initialfile="gantt_rr.png")
+        p = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG","*.png")], initialfile=self.PNG_NAME)
         if not p:
             return
         try:
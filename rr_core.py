@@ -0,0 +1,82 @@
+#rr_core.py
+# Engine Round Robin tanpa dependensi UI; dipakai rr.py, mlfq.py dan worker pool.
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional
+from time import perf_counter
+from instrument import SimStats, Time, CS_PID, DISPATCH_PID
+
+# ---------------- Data class ----------------
+@dataclass
+class Process:
+    pid: str
+    arrival: Time
+    burst: Time
+    remaining: Time = field(init=False)
+    start_time: Optional[Time] = None
+    completion_time: Optional[Time] = None
+    waiting_time: Optional[Time] = None
+    turnaround_time: Optional[Time] = None
+
+    def __post_init__(self):
+        self.remaining = self.burst
+
+# ---------------- Scheduling logic ----------------
+def simulate_rr(proc_tuples: List[Tuple[str,Time,Time]], quantum: Time = 2, stats: Optional[SimStats] = None,
+                cs_cost: Time = 0, dispatch_cost: Time = 0):
+    if stats is not None:
+        t0 = perf_counter()
+    if quantum <= 0:
+        # caller headless (pool, service, export) tidak lewat validasi halaman RR
+        raise ValueError("quantum must be positive")
+    procs = [Process(pid, at, bt) for (pid, at, bt) in proc_tuples]
+    time_now = 0
+    completed = 0
+    n = len(procs)
+    gantt: List[Tuple[Time,Time,str]] = []
+    ready_queue = deque()
+    last_pid = None
+    # arrival masuk antrian urut waktu; seri -> urutan input (sort stabil)
+    order = sorted(procs, key=lambda p: p.arrival)
+    arr_i = 0
+    if stats is not None:
+        t1 = perf_counter()
+    while completed < n:
+        # Add arrived processes
+        while arr_i < n and order[arr_i].arrival <= time_now:
+            ready_queue.append(order[arr_i])
+            arr_i += 1
+        if not ready_queue:
+            # CPU idle: lompat langsung ke arrival berikutnya
+            time_now = order[arr_i].arrival
+            continue
+        cur = ready_queue.popleft()
+        # overhead: context switch kalau ganti proses, dispatch cost di setiap dispatch
+        if cs_cost and last_pid is not None and last_pid != cur.pid:
+            gantt.append((time_now, time_now + cs_cost, CS_PID))
+            time_now += cs_cost
+        if dispatch_cost:
+            gantt.append((time_now, time_now + dispatch_cost, DISPATCH_PID))
+            time_now += dispatch_cost
+        last_pid = cur.pid
+        if cur.start_time is None:
+            cur.start_time = time_now
+        run_time = min(cur.remaining, quantum)
+        gantt.append((time_now, time_now + run_time, cur.pid))
+        cur.remaining -= run_time
+        time_now += run_time
+        # Add newly arrived processes during execution
+        while arr_i < n and order[arr_i].arrival <= time_now:
+            ready_queue.append(order[arr_i])
+            arr_i += 1
+        if cur.remaining > 0:
+            ready_queue.append(cur)
+        else:
+            cur.completion_time = time_now
+            cur.turnaround_time = cur.completion_time - cur.arrival
+            cur.waiting_time = cur.turnaround_time - cur.burst
+            completed += 1
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=perf_counter() - t1)
+        stats.collect(procs, gantt, time_now)
+    return procs, gantt, time_now
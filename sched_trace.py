@@ -0,0 +1,267 @@
+#sched_trace.py
+# Import trace scheduler (teks) menjadi workload (pid, arrival, burst, priority) supaya beban
+# produksi bisa di-replay lewat FCFS/SJF/Priority/RR. Setiap task dipecah menjadi job: job mulai
+# saat wakeup dan berisi total waktu on-CPU (switch-in .. switch-out) sampai wakeup berikutnya
+# atau exit. File dibaca baris per baris dalam potongan byte yang diparse paralel di worker
+# pool; state task yang melewati batas potongan disambung ulang berurutan di proses utama.
+#
+# Format yang dikenali (boleh campur, baris '#' dan kosong dilewati):
+#   ftrace:     "<comm>-<pid> [cpu] ... <sec.usec>: sched_wakeup: comm=.. pid=.. prio=.. ..."
+#               (juga sched_wakeup_new, sched_switch, sched_process_exit)
+#   sederhana:  "<ts> wakeup <task> [prio]" | "<ts> switch <prev> <next>" | "<ts> exit <task>"
+#
+#   python sched_trace.py traces/*.log -o workload.npz --unit us --workers 8 --simulate rr
+import argparse, csv, os, re, sys
+from typing import Dict, Iterator, List, Optional, Tuple
+from pool import SimPool
+from streaming import STREAM_ENGINES
+from workload import parse_time, save_workload_npz
+
+CHUNK_BYTES = 64 << 20
+# satuan waktu output untuk timestamp ftrace (detik.mikrodetik) -> unit per detik
+UNITS = {"ns": 10**9, "us": 10**6, "ms": 10**3, "s": 1}
+IDLE_TASKS = ("0", "-", "idle")
+
+WAKEUP, SWITCH_IN, SWITCH_OUT, EXIT = range(4)
+_SIMPLE_KINDS = {"wakeup": WAKEUP, "exit": EXIT}
+
+# event: (ts, kind, key task, label, priority atau None)
+Event = tuple
+
+# ---------------- Parsing ----------------
+_FTRACE = re.compile(r"\s(\d+(?:\.\d+)?):\s+(\w+):\s+(.*)$")
+_FT_WAKEUP = re.compile(r"comm=(.*?) pid=(\d+) prio=(-?\d+)")
+_FT_SWITCH = re.compile(r"prev_comm=(.*?) prev_pid=(\d+) .*?==> next_comm=(.*?) next_pid=(\d+) next_prio=(-?\d+)")
+_FT_EXIT = re.compile(r"comm=(.*?) pid=(\d+)")
+
+def _ftrace_ts(s: str, unit: str):
+    # tanpa float untuk unit integer supaya timestamp besar tidak kehilangan presisi
+    if unit == "s":
+        return float(s)
+    scale = UNITS[unit]
+    sec, _, frac = s.partition(".")
+    return int(sec) * scale + int((frac + "000000000")[:9]) * scale // 10**9
+
+def parse_line(line: str, unit: str = "us") -> List[Event]:
+    # satu baris -> 0..2 event (switch = out untuk prev + in untuk next)
+    line = line.strip()
+    if not line or line[0] == "#":
+        return []
+    m = _FTRACE.search(line)
+    if m:
+        ts = _ftrace_ts(m.group(1), unit)
+        name, args = m.group(2), m.group(3)
+        if name.startswith("sched_wakeup"):
+            a = _FT_WAKEUP.search(args)
+            if a and a.group(2) not in IDLE_TASKS:
+                return [(ts, WAKEUP, a.group(2), f"{a.group(1)}-{a.group(2)}", int(a.group(3)))]
+        elif name == "sched_switch":
+            a = _FT_SWITCH.search(args)
+            if a:
+                out = []
+                if a.group(2) not in IDLE_TASKS:
+                    out.append((ts, SWITCH_OUT, a.group(2), f"{a.group(1)}-{a.group(2)}", None))
+                if a.group(4) not in IDLE_TASKS:
+                    out.append((ts, SWITCH_IN, a.group(4), f"{a.group(3)}-{a.group(4)}", int(a.group(5))))
+                return out
+        elif name == "sched_process_exit":
+            a = _FT_EXIT.search(args)
+            if a and a.group(2) not in IDLE_TASKS:
+                return [(ts, EXIT, a.group(2), f"{a.group(1)}-{a.group(2)}", None)]
+        return []
+    parts = line.split()
+    if len(parts) < 3:
+        raise ValueError(f"unrecognised trace line: {line[:80]!r}")
+    ts = parse_time(parts[0])
+    kind = parts[1].lower()
+    if kind == "switch":
+        if len(parts) < 4:
+            raise ValueError(f"switch record needs prev and next task: {line[:80]!r}")
+        out = []
+        if parts[2] not in IDLE_TASKS:
+            out.append((ts, SWITCH_OUT, parts[2], parts[2], None))
+        if parts[3] not in IDLE_TASKS:
+            out.append((ts, SWITCH_IN, parts[3], parts[3], None))
+        return out
+    if kind not in _SIMPLE_KINDS:
+        raise ValueError(f"unknown trace event {parts[1]!r}")
+    prio = int(parts[3]) if kind == "wakeup" and len(parts) > 3 else None
+    return [(ts, _SIMPLE_KINDS[kind], parts[2], parts[2], prio)]
+
+# ---------------- Task state ----------------
+class _Task:
+    # job: [arrival, burst, priority, label] atau None; running_since: waktu switch-in terakhir
+    __slots__ = ("job", "running_since")
+
+    def __init__(self, job: Optional[list] = None, running_since=None):
+        self.job = job
+        self.running_since = running_since
+
+    def _close(self, emit):
+        if self.job is not None:
+            emit(self.job)
+        self.job = None
+
+    def apply(self, ev: Event, emit):
+        ts, kind, _, label, prio = ev
+        if kind == WAKEUP:
+            # wakeup saat masih jalan tidak memulai job baru
+            if self.running_since is None:
+                self._close(emit)
+                self.job = [ts, 0, prio or 0, label]
+        elif kind == SWITCH_IN:
+            if self.job is None:
+                # task sudah aktif sebelum trace mulai (atau tanpa wakeup): job mulai di sini
+                self.job = [ts, 0, prio or 0, label]
+            self.running_since = ts
+        else:
+            if self.running_since is not None:
+                self.job[1] += ts - self.running_since
+                self.running_since = None
+            if kind == EXIT:
+                self._close(emit)
+
+# ---------------- Chunks ----------------
+def plan_chunks(paths: List[str], chunk_bytes: int = CHUNK_BYTES) -> List[Tuple[str, int, int]]:
+    # -> [(path, start, end)] berurutan; baris milik potongan tempat byte pertamanya berada
+    chunks = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), chunk_bytes):
+            chunks.append((path, start, min(size, start + chunk_bytes)))
+    return chunks
+
+def _lines(path: str, start: int, end: int) -> Iterator[str]:
+    with open(path, "rb") as f:
+        pos = start
+        if start:
+            # mundur satu byte: kalau start tepat di awal baris, readline hanya memakan '\n' sebelumnya
+            f.seek(start - 1)
+            pos = start - 1 + len(f.readline())
+        for raw in f:
+            if pos >= end:
+                break
+            pos += len(raw)
+            yield raw.decode("utf-8", errors="replace")
+
+def parse_chunk(path: str, start: int, end: int, unit: str = "us"):
+    # dijalankan di worker. Tanpa tahu state task di awal potongan, event task disimpan mentah
+    # ("head") sampai state-nya pasti: setelah exit, atau wakeup setelah switch-out. Sesudah itu
+    # task diproses lokal dan job yang selesai langsung dikumpulkan.
+    # -> (head {key: [event]}, local {key: (job, running_since)}, jobs, ts terakhir)
+    head: Dict[str, List[Event]] = {}
+    running: Dict[str, bool] = {}
+    local: Dict[str, _Task] = {}
+    jobs: List[list] = []
+    emit = jobs.append
+    last_ts = None
+    for line in _lines(path, start, end):
+        for ev in parse_line(line, unit):
+            ts, kind, key = ev[0], ev[1], ev[2]
+            last_ts = ts
+            t = local.get(key)
+            if t is not None:
+                t.apply(ev, emit)
+                continue
+            head.setdefault(key, []).append(ev)
+            if kind == EXIT:
+                local[key] = _Task()
+            elif kind == WAKEUP and running.get(key) is False:
+                local[key] = _Task([ts, 0, ev[4] or 0, ev[3]])
+            elif kind != WAKEUP:
+                running[key] = kind == SWITCH_IN
+    return head, {k: (t.job, t.running_since) for k, t in local.items()}, jobs, last_ts
+
+# ---------------- Import ----------------
+def _stitch(results: Iterator[tuple]) -> Tuple[List[list], int]:
+    # gabungkan hasil potongan berurutan -> (semua job, jumlah task)
+    tasks: Dict[str, _Task] = {}
+    jobs: List[list] = []
+    seen = set()
+    last_ts = None
+    for head, local, chunk_jobs, chunk_last in results:
+        for key, events in head.items():
+            t = tasks.get(key) or _Task()
+            for ev in events:
+                t.apply(ev, jobs.append)
+            tasks[key] = t
+            seen.add(key)
+        for key, (job, running_since) in local.items():
+            tasks[key] = _Task(job, running_since)
+        jobs.extend(chunk_jobs)
+        if chunk_last is not None:
+            last_ts = chunk_last
+    # akhir trace: job yang masih terbuka ditutup, waktu jalan dihitung sampai event terakhir
+    for t in tasks.values():
+        if t.running_since is not None:
+            t.job[1] += last_ts - t.running_since
+        t._close(jobs.append)
+    return jobs, len(seen)
+
+def import_trace(paths: List[str], unit: str = "us", workers: Optional[int] = None,
+                 chunk_bytes: int = CHUNK_BYTES, rebase: bool = True) -> Tuple[list, int]:
+    # -> ([(pid, arrival, burst, priority)] urut arrival, jumlah task). pid = "<task>#<k>".
+    # rebase: arrival digeser supaya job pertama datang di t=0.
+    chunks = plan_chunks(paths, chunk_bytes)
+    if workers == 1 or len(chunks) <= 1:
+        jobs, n_tasks = _stitch(parse_chunk(*c, unit) for c in chunks)
+    else:
+        pool = SimPool(workers)
+        try:
+            futures = [pool.submit(parse_chunk, *c, unit) for c in chunks]
+            # disambung sesuai urutan file; hasil potongan dibuang begitu selesai dipakai
+            jobs, n_tasks = _stitch(f.result() for f in futures)
+        finally:
+            pool.shutdown()
+    jobs = [j for j in jobs if j[1] > 0]
+    jobs.sort(key=lambda j: (j[0], j[3]))
+    base = jobs[0][0] if jobs and rebase else 0
+    count: Dict[str, int] = {}
+    out = []
+    for at, bt, pr, label in jobs:
+        k = count[label] = count.get(label, 0) + 1
+        out.append((f"{label}#{k}", at - base, bt, pr))
+    return out, n_tasks
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Import scheduler trace logs (wakeup/switch/exit) as a workload for replay.")
+    ap.add_argument("inputs", nargs="+", help="trace files, processed in the given order")
+    ap.add_argument("-o", "--output", default=None, help="write workload as .npz (binary cache) or .csv")
+    ap.add_argument("--unit", choices=tuple(UNITS), default="us", help="time unit for ftrace timestamps")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--chunk-mb", type=int, default=CHUNK_BYTES >> 20)
+    ap.add_argument("--no-rebase", action="store_true", help="keep absolute trace timestamps")
+    ap.add_argument("--simulate", choices=tuple(STREAM_ENGINES), default=None, help="replay through an engine and print statistics")
+    ap.add_argument("--quantum", type=parse_time, default=2, help="RR quantum (in --unit)")
+    ap.add_argument("--preemptive", action="store_true")
+    args = ap.parse_args(argv)
+
+    try:
+        procs, n_tasks = import_trace(args.inputs, args.unit, args.workers, args.chunk_mb << 20, not args.no_rebase)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    span = procs[-1][1] - procs[0][1] if procs else 0
+    print(f"{len(procs)} job(s) from {n_tasks} task(s), arrival span {span} {args.unit}")
+    if args.output:
+        if args.output.lower().endswith(".npz"):
+            save_workload_npz(args.output, procs)
+        else:
+            with open(args.output, "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(("pid", "arrival", "burst", "priority"))
+                w.writerows(procs)
+    if args.simulate:
+        kwargs = {}
+        if args.simulate == "rr":
+            kwargs["quantum"] = args.quantum
+        elif args.simulate == "priority":
+            kwargs["preemptive"] = args.preemptive
+        sm, total_time = STREAM_ENGINES[args.simulate](iter(procs), **kwargs)
+        print(sm.result().summary_text())
+        print(f"Total time {total_time} {args.unit}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
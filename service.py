@@ -0,0 +1,326 @@
+#service.py
+# Service simulasi lokal (asyncio) untuk tool lain: satu proses melayani banyak klien lewat
+# Unix socket atau localhost. Protokol: satu JSON per baris.
+#
+#   request : {"id": 1, "algo": "rr", "params": {"quantum": 4},
+#              "workload": [["P1", 0, 5], ...]}          atau "path": "runs/a.csv" / ".npz"
+#             {"id": 2, "op": "stats"}                    counter service
+#   response: {"id": 1, "type": "result", "cached": false, "total_time": .., "summary": {..},
+#              "n_procs": .., "n_gantt": .., "proc_columns": [..]}
+#             {"id": 1, "type": "procs", "rows": [[..], ..]}    (beberapa chunk)
+#             {"id": 1, "type": "gantt", "rows": [[..], ..]}    (beberapa chunk)
+#             {"id": 1, "type": "end"}
+#             {"id": 1, "type": "error", "error": ".."}
+#
+# Request yang datang bersamaan dikumpulkan dalam jendela batch singkat lalu dikirim ke worker
+# pool sebagai beberapa batch (satu per worker), request identik yang sedang jalan digabung,
+# dan hasil disimpan di cache LRU dalam bentuk chunk JSON yang sudah di-encode.
+#
+#   python service.py serve --socket /tmp/sched.sock
+#   python service.py query --socket /tmp/sched.sock --algo sjf runs/a.csv
+import argparse, asyncio, hashlib, json, os, signal, sys
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from metrics import compute_metrics
+from pool import ENGINES, SimPool
+from workload import read_workload
+
+DEFAULT_PORT = 8765
+CHUNK_ROWS = 5000
+MAX_LINE = 64 << 20          # batas satu baris request (workload inline bisa besar)
+BATCH_WINDOW = 0.005         # detik menunggu request lain sebelum batch dikirim
+MAX_BATCH = 64
+CACHE_SIZE = 256
+PROC_COLUMNS = ("pid", "arrival", "burst", "start", "completion", "tat", "wt")
+
+def _json_default(o):
+    if isinstance(o, np.generic):
+        return o.item()
+    raise TypeError(f"{type(o).__name__} is not JSON serializable")
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=_json_default)
+
+# ---------------- Worker side ----------------
+def _encode_result(procs: list, gantt: list, total_time, chunk_rows: int) -> dict:
+    # chunk baris sudah di-encode JSON di worker; event loop cukup menempelkan id
+    rows = [[p.pid, p.arrival, p.burst, p.start_time, p.completion_time, p.turnaround_time, p.waiting_time]
+            for p in procs]
+    seg_rows = [list(seg) for seg in gantt]
+    return {
+        "total_time": total_time,
+        "summary": asdict(compute_metrics(procs, gantt, total_time)),
+        "n_procs": len(rows),
+        "n_gantt": len(seg_rows),
+        "procs": [_dumps(rows[i:i + chunk_rows]) for i in range(0, len(rows), chunk_rows)],
+        "gantt": [_dumps(seg_rows[i:i + chunk_rows]) for i in range(0, len(seg_rows), chunk_rows)],
+    }
+
+def run_batch(jobs: List[Tuple[str, list, dict]], chunk_rows: int = CHUNK_ROWS) -> List[Tuple[bool, object]]:
+    # -> [(ok, payload atau pesan error)] dengan urutan sama seperti jobs
+    out = []
+    for algo, tuples, params in jobs:
+        try:
+            procs, gantt, total_time = ENGINES[algo][0](tuples, **params)
+            out.append((True, _encode_result(procs, gantt, total_time, chunk_rows)))
+        except Exception as e:
+            out.append((False, f"{type(e).__name__}: {e}"))
+    return out
+
+# ---------------- Request handling ----------------
+def _normalize(msg: dict) -> Tuple[str, list, dict]:
+    algo = msg.get("algo")
+    if algo not in ENGINES:
+        raise ValueError(f"unknown algo {algo!r}; expected one of {', '.join(ENGINES)}")
+    params = msg.get("params") or {}
+    if not isinstance(params, dict):
+        raise ValueError("params must be an object")
+    with_priority = ENGINES[algo][1]
+    tuples = []
+    for row in msg.get("workload") or []:
+        if len(row) < 3 or (with_priority and len(row) < 4):
+            raise ValueError(f"workload rows need pid, arrival, burst{', priority' if with_priority else ''}: {row!r}")
+        tuples.append(tuple(row[:4] if with_priority else row[:3]))
+    return algo, tuples, params
+
+def cache_key(algo: str, tuples: list, params: dict) -> str:
+    h = hashlib.sha256()
+    h.update(_dumps([algo, sorted(params.items())]).encode())
+    h.update(_dumps(tuples).encode())
+    return h.hexdigest()
+
+class SimService:
+    def __init__(self, workers: Optional[int] = None, batch_window: float = BATCH_WINDOW,
+                 max_batch: int = MAX_BATCH, cache_size: int = CACHE_SIZE, chunk_rows: int = CHUNK_ROWS):
+        self.pool = SimPool(workers)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self.chunk_rows = chunk_rows
+        self.cache: "OrderedDict[str, dict]" = OrderedDict()
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.counters = {"requests": 0, "cache_hits": 0, "coalesced": 0, "batches": 0, "simulations": 0, "errors": 0}
+        self._pending: List[Tuple[str, tuple, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    # ----- batching -----
+    async def simulate(self, algo: str, tuples: list, params: dict) -> Tuple[dict, bool]:
+        # -> (payload, dari cache)
+        key = cache_key(algo, tuples, params)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.counters["cache_hits"] += 1
+            return self.cache[key], True
+        fut = self.inflight.get(key)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = self.inflight[key] = loop.create_future()
+            self._pending.append((key, (algo, tuples, params), fut))
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        else:
+            self.counters["coalesced"] += 1
+        # shield: klien yang putus tidak membatalkan hasil yang ditunggu klien lain
+        return await asyncio.shield(fut), False
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        # dibagi rata ke worker supaya batch besar tetap paralel
+        n = min(len(batch), self.pool.workers)
+        for part in (batch[i::n] for i in range(n)):
+            task = asyncio.ensure_future(self._run_batch(part))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, tuple, asyncio.Future]]):
+        self.counters["batches"] += 1
+        self.counters["simulations"] += len(batch)
+        try:
+            results = await asyncio.wrap_future(self.pool.submit(run_batch, [job for _, job, _ in batch], self.chunk_rows))
+        except Exception as e:
+            results = [(False, f"{type(e).__name__}: {e}")] * len(batch)
+        for (key, _, fut), (ok, payload) in zip(batch, results):
+            self.inflight.pop(key, None)
+            if fut.done():
+                continue
+            if ok:
+                self.cache[key] = payload
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+                fut.set_result(payload)
+            else:
+                fut.set_exception(ValueError(payload))
+
+    # ----- protocol -----
+    async def _send(self, writer: asyncio.StreamWriter, lock: asyncio.Lock, line: str):
+        async with lock:
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+
+    async def _serve(self, raw: bytes, writer: asyncio.StreamWriter, lock: asyncio.Lock):
+        rid = None
+        try:
+            msg = json.loads(raw)
+            if not isinstance(msg, dict):
+                raise ValueError("request must be a JSON object")
+            rid = msg.get("id")
+            self.counters["requests"] += 1
+            if msg.get("op") == "stats":
+                await self._send(writer, lock, _dumps({"id": rid, "type": "stats", **self.counters,
+                                                       "cache_entries": len(self.cache)}))
+                return
+            if msg.get("path"):
+                tuples = await asyncio.get_running_loop().run_in_executor(None, read_workload, msg["path"])
+                msg = dict(msg, workload=tuples)
+            payload, cached = await self.simulate(*_normalize(msg))
+        except Exception as e:
+            self.counters["errors"] += 1
+            await self._send(writer, lock, _dumps({"id": rid, "type": "error", "error": str(e)}))
+            return
+        head = {k: payload[k] for k in ("total_time", "summary", "n_procs", "n_gantt")}
+        await self._send(writer, lock, _dumps({"id": rid, "type": "result", "cached": cached,
+                                               "proc_columns": PROC_COLUMNS, **head}))
+        prefix = '{"id":' + _dumps(rid) + ',"type":'
+        for kind in ("procs", "gantt"):
+            for chunk in payload[kind]:
+                await self._send(writer, lock, f'{prefix}"{kind}","rows":{chunk}}}')
+        await self._send(writer, lock, _dumps({"id": rid, "type": "end"}))
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # request dalam satu koneksi dilayani bersamaan; setiap baris respons membawa id
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    raw = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    await self._send(writer, lock, _dumps({"id": None, "type": "error", "error": "request line too long"}))
+                    break
+                if not raw:
+                    break
+                if not raw.strip():
+                    continue
+                task = asyncio.create_task(self._serve(raw, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, socket_path: Optional[str] = None, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        self.pool.start()
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server = await asyncio.start_unix_server(self.handle, path=socket_path, limit=MAX_LINE)
+            where = socket_path
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port, limit=MAX_LINE)
+            where = f"{host}:{port}"
+        stop = asyncio.get_running_loop().create_future()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                asyncio.get_running_loop().add_signal_handler(sig, lambda: stop.done() or stop.set_result(None))
+            except (NotImplementedError, RuntimeError):
+                pass
+        print(f"simulation service listening on {where}", file=sys.stderr, flush=True)
+        try:
+            async with server:
+                await stop
+        finally:
+            self.pool.shutdown()
+            if socket_path and os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+# ---------------- Client ----------------
+async def request(msg: dict, socket_path: Optional[str] = None, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> dict:
+    # kirim satu request lalu rakit respons chunk -> {"result": header, "procs": [..], "gantt": [..]}
+    if socket_path:
+        reader, writer = await asyncio.open_unix_connection(socket_path, limit=MAX_LINE)
+    else:
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    try:
+        writer.write(_dumps(msg).encode() + b"\n")
+        await writer.drain()
+        out = {"result": None, "procs": [], "gantt": []}
+        while True:
+            raw = await reader.readline()
+            if not raw:
+                raise ConnectionError("service closed the connection")
+            reply = json.loads(raw)
+            kind = reply["type"]
+            if kind == "error":
+                raise RuntimeError(reply["error"])
+            if kind in ("procs", "gantt"):
+                out[kind].extend(reply["rows"])
+            elif kind in ("end", "stats"):
+                if kind == "stats":
+                    out["result"] = reply
+                return out
+            else:
+                out["result"] = reply
+    finally:
+        writer.close()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Local simulation service (JSON lines over a Unix socket or localhost).")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for name in ("serve", "query"):
+        p = sub.add_parser(name)
+        p.add_argument("--socket", default=None, help="Unix socket path (default: TCP on localhost)")
+        p.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve = sub.choices["serve"]
+    serve.add_argument("--workers", type=int, default=None)
+    serve.add_argument("--cache-size", type=int, default=CACHE_SIZE)
+    serve.add_argument("--batch-ms", type=float, default=BATCH_WINDOW * 1000)
+    query = sub.choices["query"]
+    query.add_argument("workload", nargs="?", help="workload CSV/.npz path (read by the service)")
+    query.add_argument("--algo", choices=tuple(ENGINES), default="fcfs")
+    query.add_argument("--params", default="{}", help='engine keyword arguments as JSON, e.g. \'{"quantum": 4}\'')
+    query.add_argument("--stats", action="store_true", help="print service counters instead")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "serve":
+        service = SimService(args.workers, batch_window=args.batch_ms / 1000, cache_size=args.cache_size)
+        asyncio.run(service.serve(args.socket, port=args.port))
+        return 0
+    if args.stats:
+        msg = {"id": 0, "op": "stats"}
+    else:
+        if not args.workload:
+            ap.error("query needs a workload path (or --stats)")
+        msg = {"id": 0, "algo": args.algo, "params": json.loads(args.params), "path": os.path.abspath(args.workload)}
+    try:
+        out = asyncio.run(request(msg, args.socket, port=args.port))
+    except (OSError, RuntimeError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    res = out["result"]
+    if args.stats:
+        print(_dumps(res))
+        return 0
+    s = res["summary"]
+    print(f"{res['n_procs']} processes, total time {res['total_time']}{' (cached)' if res['cached'] else ''}")
+    print(f"Avg WT {s['wt']['mean']:.2f}  Avg TAT {s['tat']['mean']:.2f}  CPU {s['cpu_util'] * 100:.1f}%  "
+          f"CS {s['context_switches']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#share.py
+# Halaman proportional-share: Lottery dan Stride (engine di share_core.py).
+# Halaman memakai layout PriorityPage; kolom priority dibaca sebagai jumlah tiket dan tenant
+# diambil dari pid ("web#1" -> tenant "web"). Share tercapai vs target per tenant ditampilkan
+# di bawah ringkasan metrik.
+from tkinter import *
+import sys
+from typing import Optional
+from share_core import Process, shares_text, simulate_lottery, simulate_stride
+from instrument import SimStats
+from priority import PriorityPage, APP_BG
+from pool import get_pool
+from workload import parse_time
+
+# ---------------- LotteryPage ----------------
+class LotteryPage(PriorityPage):
+    PAGE_TITLE = "Lottery Scheduler"
+    GANTT_TITLE = "3D Gantt (Lottery)"
+    PNG_NAME = "gantt_lottery.png"
+    ENGINE = "lottery"
+
+    def __init__(self, parent, app=None):
+        super().__init__(parent, app=app)
+        # engine proportional-share hanya single-CPU dan selalu berbasis quantum
+        self.smp_controls.pack_forget()
+        self.chk_preempt.pack_forget()
+        self.tree.heading("Priority", text="Tickets")
+
+    def build_params(self, left_frame):
+        prm = Frame(left_frame, bg=APP_BG)
+        prm.pack(pady=2, fill=X)
+        Label(prm, text="Quantum", bg=APP_BG).grid(row=0, column=0, padx=4, sticky=W)
+        self.entry_q = Entry(prm, width=5); self.entry_q.grid(row=0, column=1, padx=2)
+        self.entry_q.insert(0, "1")
+        if self.ENGINE == "lottery":
+            Label(prm, text="Seed", bg=APP_BG).grid(row=0, column=2, padx=4, sticky=W)
+            self.entry_seed = Entry(prm, width=5); self.entry_seed.grid(row=0, column=3, padx=2)
+            self.entry_seed.insert(0, "0")
+        Label(prm, text="CS cost", bg=APP_BG).grid(row=1, column=0, padx=4, sticky=W)
+        self.entry_cs = Entry(prm, width=5); self.entry_cs.grid(row=1, column=1, padx=2)
+        self.entry_cs.insert(0, "0")
+        Label(prm, text="Dispatch cost", bg=APP_BG).grid(row=1, column=2, padx=4, sticky=W)
+        self.entry_disp = Entry(prm, width=5); self.entry_disp.grid(row=1, column=3, padx=2)
+        self.entry_disp.insert(0, "0")
+
+    def load_sample(self):
+        # tenant = bagian pid sebelum '#'
+        self.process_list = [("web#1",0,8,3),("web#2",2,6,3),("batch#1",0,12,1),("db#1",1,5,2)]
+        self.update_treeviews()
+
+    def read_params(self) -> dict:
+        params = self.read_overhead()
+        try:
+            q = parse_time(self.entry_q.get())
+        except ValueError:
+            q = 0
+        if q <= 0:
+            raise ValueError("Quantum must be a positive number.")
+        params["quantum"] = q
+        if self.ENGINE == "lottery":
+            try:
+                params["seed"] = int(self.entry_seed.get())
+            except ValueError:
+                raise ValueError("Seed must be an integer.")
+        if any(t[3] < 1 for t in self.process_list):
+            raise ValueError("Tickets (priority column) must be >= 1.")
+        return params
+
+    def simulate(self, snapshot, params: dict, stats: Optional[SimStats], cores: int, per_core: bool):
+        return get_pool().simulate(self.ENGINE, snapshot, stats=stats, **params)
+
+    def update_after_sim(self, procs_meta, gantt, total_time, stats: Optional[SimStats] = None, cores: int = 1):
+        super().update_after_sim(procs_meta, gantt, total_time, stats, cores)
+        self.avg_label.config(text=self.avg_label.cget("text") + "\nShare (achieved / target):\n" + shares_text(procs_meta))
+
+# ---------------- StridePage ----------------
+class StridePage(LotteryPage):
+    PAGE_TITLE = "Stride Scheduler"
+    GANTT_TITLE = "3D Gantt (Stride)"
+    PNG_NAME = "gantt_stride.png"
+    ENGINE = "stride"
+
+# ---------------- standalone fallback ----------------
+def main_standalone(page=LotteryPage):
+    root = Tk()
+    root.title(f"{page.PAGE_TITLE} - Kelompok 4 AB")
+    root.geometry("1300x760")
+    page(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main_standalone(StridePage if "--stride" in sys.argv else LotteryPage)
@@ -0,0 +1,220 @@
+#share_core.py
+# Engine proportional-share (lottery & stride) tanpa dependensi UI; dipakai share.py dan worker pool.
+# Kolom priority dibaca sebagai jumlah tiket (>= 1, makin besar makin banyak CPU). Tenant =
+# bagian pid sebelum '#' (format pid sched_trace.py, mis. "web#3"); pid tanpa '#' = tenant sendiri.
+# - Lottery: tiap quantum diundi dengan RNG ber-seed; tiket proses runnable disimpan di Fenwick
+#   tree, jadi undian dan update O(log n).
+# - Stride: heap pada nilai pass; stride = STRIDE1 / tiket, pass bertambah stride per quantum.
+# Target share dihitung lazy: V(t) = integral dt / total tiket runnable (hanya saat CPU jalan),
+# jatah proses = tiket * (V saat selesai - V saat datang). Jumlah jatah semua proses = busy time.
+import heapq, random
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Optional
+from time import perf_counter
+from instrument import SimStats, Time, CS_PID, DISPATCH_PID
+
+STRIDE1 = 1 << 20
+
+def tenant_of(pid: str) -> str:
+    return pid.split("#", 1)[0]
+
+# ---------------- Data class ----------------
+@dataclass(order=True)
+class Process:
+    sort_index: tuple = field(init=False, repr=False)
+    pid: str
+    arrival: Time
+    burst: Time
+    priority: int
+    remaining: Time = field(init=False)
+    start_time: Optional[Time] = None
+    completion_time: Optional[Time] = None
+    waiting_time: Optional[Time] = None
+    turnaround_time: Optional[Time] = None
+    target_service: float = 0.0       # CPU yang menjadi jatah proses selama runnable
+
+    def __post_init__(self):
+        if self.priority < 1:
+            raise ValueError(f"{self.pid}: tickets (priority column) must be >= 1")
+        self.remaining = self.burst
+        self.sort_index = (self.arrival, self.pid)
+
+    @property
+    def tickets(self) -> int:
+        return self.priority
+
+# ---------------- Fenwick tree ----------------
+class Fenwick:
+    # prefix sum tiket per slot; find(r) = slot pertama dengan prefix > r (undian).
+    # Ukuran dibulatkan ke pangkat dua supaya find tidak perlu cek batas.
+    def __init__(self, n: int):
+        self.size = 1 << max(0, n - 1).bit_length()
+        self.tree = [0] * (self.size + 1)
+
+    def add(self, i: int, delta: int):
+        i += 1
+        tree, size = self.tree, self.size
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def find(self, r: int) -> int:
+        # r harus < total tiket
+        tree = self.tree
+        pos = 0
+        step = self.size >> 1
+        while step:
+            nxt = pos + step
+            if tree[nxt] <= r:
+                pos = nxt
+                r -= tree[nxt]
+            step >>= 1
+        return pos
+
+# ---------------- Scheduling logic ----------------
+def _simulate_share(proc_tuples, policy: str, quantum: Time, seed: Optional[int], stats: Optional[SimStats],
+                    cs_cost: Time, dispatch_cost: Time):
+    if stats is not None:
+        t0 = perf_counter()
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+    procs = [Process(pid, at, bt, pr) for (pid, at, bt, pr) in proc_tuples]
+    procs_sorted = sorted(procs, key=lambda p: (p.arrival, p.pid))
+    n = len(procs)
+    if n == 0:
+        return procs, [], 0
+    time_now = 0
+    completed = 0
+    arrival_idx = 0
+    total_tickets = 0
+    vclock = 0.0                 # V(t)
+    joined = [0.0] * n           # V saat slot i masuk
+    gantt_marks = []
+    last_pid = None
+
+    if policy == "lottery":
+        rng = random.Random(seed)
+        fen = Fenwick(n)
+    else:
+        heap: List[tuple] = []   # (pass, slot)
+        passes = [0.0] * n
+        global_pass = 0.0
+
+    def add_arrivals(t):
+        nonlocal arrival_idx, total_tickets
+        while arrival_idx < n and procs_sorted[arrival_idx].arrival <= t:
+            i = arrival_idx
+            p = procs_sorted[i]
+            joined[i] = vclock
+            total_tickets += p.priority
+            if policy == "lottery":
+                fen.add(i, p.priority)
+            else:
+                # join: mulai satu stride di depan global pass (Waldspurger)
+                passes[i] = global_pass + STRIDE1 / p.priority
+                heapq.heappush(heap, (passes[i], i))
+            arrival_idx += 1
+
+    add_arrivals(time_now)
+    if stats is not None:
+        t1 = perf_counter()
+
+    while completed < n:
+        if total_tickets == 0:
+            time_now = procs_sorted[arrival_idx].arrival
+            add_arrivals(time_now)
+            continue
+        if policy == "lottery":
+            i = fen.find(rng.randrange(total_tickets))
+        else:
+            i = heap[0][1]
+        cur = procs_sorted[i]
+
+        if last_pid != cur.pid:
+            # overhead: context switch kalau ganti proses, lalu dispatch cost
+            if cs_cost and last_pid is not None:
+                gantt_marks.append((time_now, CS_PID))
+                time_now += cs_cost
+            if dispatch_cost:
+                gantt_marks.append((time_now, DISPATCH_PID))
+                time_now += dispatch_cost
+            gantt_marks.append((time_now, cur.pid))
+            last_pid = cur.pid
+        if cur.start_time is None:
+            cur.start_time = time_now
+
+        run = min(quantum, cur.remaining)
+        vclock += run / total_tickets
+        time_now += run
+        cur.remaining -= run
+        if policy == "stride":
+            global_pass += STRIDE1 * run / (quantum * total_tickets)
+            passes[i] += STRIDE1 / cur.priority * run / quantum
+        if cur.remaining <= 0:
+            cur.remaining = 0
+            cur.completion_time = time_now
+            cur.turnaround_time = cur.completion_time - cur.arrival
+            cur.waiting_time = cur.turnaround_time - cur.burst
+            cur.target_service = cur.priority * (vclock - joined[i])
+            total_tickets -= cur.priority
+            completed += 1
+            if policy == "lottery":
+                fen.add(i, -cur.priority)
+            else:
+                heapq.heappop(heap)
+        elif policy == "stride":
+            heapq.heapreplace(heap, (passes[i], i))
+        add_arrivals(time_now)
+
+    if stats is not None:
+        t2 = perf_counter()
+    merged = []
+    if gantt_marks:
+        done_at = {p.pid: p.completion_time for p in procs}
+        for i, (s, pid) in enumerate(gantt_marks):
+            if i == 0:
+                merged.append([s, None, pid])
+            else:
+                # segmen berhenti saat proses selesai, jangan ikut menutupi idle gap
+                prev = merged[-1]
+                done = done_at.get(prev[2])
+                prev[1] = min(s, done) if done is not None else s
+                merged.append([s, None, pid])
+        merged[-1][1] = time_now
+    gantt = [(m[0], m[1], m[2]) for m in merged]
+
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=t2 - t1, merge=perf_counter() - t2)
+        stats.collect(procs, gantt, time_now)
+    return procs, gantt, time_now
+
+def simulate_lottery(proc_tuples: List[Tuple[str,Time,Time,int]], quantum: Time = 1, seed: Optional[int] = 0,
+                     stats: Optional[SimStats] = None, cs_cost: Time = 0, dispatch_cost: Time = 0):
+    return _simulate_share(proc_tuples, "lottery", quantum, seed, stats, cs_cost, dispatch_cost)
+
+def simulate_stride(proc_tuples: List[Tuple[str,Time,Time,int]], quantum: Time = 1,
+                    stats: Optional[SimStats] = None, cs_cost: Time = 0, dispatch_cost: Time = 0):
+    return _simulate_share(proc_tuples, "stride", quantum, None, stats, cs_cost, dispatch_cost)
+
+# ---------------- Tenant shares ----------------
+def tenant_shares(procs: List[Process]) -> Dict[str, Tuple[int, float, float]]:
+    # -> {tenant: (tiket, share tercapai, share target)}; keduanya relatif terhadap total CPU
+    # yang dipakai proses selesai, diurutkan dari share target terbesar
+    acc: Dict[str, list] = {}
+    for p in procs:
+        if p.completion_time is None:
+            continue
+        a = acc.setdefault(tenant_of(p.pid), [0, 0.0, 0.0])
+        a[0] += p.priority
+        a[1] += p.burst
+        a[2] += p.target_service
+    busy = sum(a[1] for a in acc.values()) or 1
+    rows = {t: (a[0], a[1] / busy, a[2] / busy) for t, a in acc.items()}
+    return dict(sorted(rows.items(), key=lambda kv: -kv[1][2]))
+
+def shares_text(procs: List[Process], limit: int = 6) -> str:
+    rows = tenant_shares(procs)
+    lines = [f"{t}: {got * 100:.1f}% / target {want * 100:.1f}%" for t, (_, got, want) in list(rows.items())[:limit]]
+    if len(rows) > limit:
+        lines.append(f"... {len(rows) - limit} more tenants")
+    return "\n".join(lines)
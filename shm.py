@@ -0,0 +1,158 @@
+#shm.py
+# Transfer workload & hasil antara UI dan worker process lewat multiprocessing.shared_memory.
+# Data disimpan sebagai kolom numerik kompak (int64, atau float64 untuk waktu pecahan); yang dikirim antar proses hanya descriptor
+# (nama segmen + shape + dtype), jadi fan-out ke banyak worker hampir zero-copy.
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple
+import numpy as np
+from instrument import Time, CS_PID, DISPATCH_PID
+from workload import encode_workload, time_dtype
+
+# index pid khusus untuk segmen overhead di kolom gantt
+_OVERHEAD_INDEX = {CS_PID: -1, DISPATCH_PID: -2}
+_OVERHEAD_NAME = {v: k for k, v in _OVERHEAD_INDEX.items()}
+
+# ---------------- Descriptors ----------------
+@dataclass(frozen=True)
+class ShmDescriptor:
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+@dataclass(frozen=True)
+class WorkloadDescriptor:
+    cols: ShmDescriptor      # (n, 3) int64/float64: arrival, burst, priority (urut arrival)
+    pids: ShmDescriptor      # (n,) bytes
+
+@dataclass(frozen=True)
+class ResultDescriptor:
+    times: ShmDescriptor     # (n, 2) int64/float64: start, completion (urutan sama dengan workload)
+    gantt: ShmDescriptor     # (m, 3) int64/float64: start, end, index proses (-1 = CS, -2 = DISP)
+    total_time: Time
+
+# ---------------- Low-level ----------------
+# Catatan resource_tracker (Python < 3.13): worker pool berbagi tracker dengan proses UI,
+# dan tracker menyimpan nama segmen sebagai set. Jadi attach tidak boleh unregister
+# (itu akan menghapus registrasi milik pemilik); yang unregister hanya unlink() oleh pemilik.
+def share_array(arr: np.ndarray) -> Tuple[SharedMemory, ShmDescriptor]:
+    arr = np.ascontiguousarray(arr)
+    shm = SharedMemory(create=True, size=max(1, arr.nbytes))
+    if arr.nbytes:
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, ShmDescriptor(shm.name, tuple(arr.shape), arr.dtype.str)
+
+def alloc_array(shape: Tuple[int, ...], dtype) -> Tuple[SharedMemory, ShmDescriptor]:
+    # segmen kosong tanpa salinan sumber (share_array(np.empty(...)) akan mengalokasi dua kali)
+    dtype = np.dtype(dtype)
+    shm = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    return shm, ShmDescriptor(shm.name, tuple(shape), dtype.str)
+
+@contextmanager
+def attached(desc: ShmDescriptor):
+    # view langsung ke segmen (tanpa copy); jangan simpan referensi view di luar blok with
+    shm = SharedMemory(name=desc.name)
+    view = np.ndarray(desc.shape, dtype=np.dtype(desc.dtype), buffer=shm.buf)
+    try:
+        yield view
+    finally:
+        del view
+        shm.close()
+
+def read_array(desc: ShmDescriptor, unlink: bool = False) -> np.ndarray:
+    # attach, salin keluar, lalu tutup (dan unlink kalau kita pemilik terakhir)
+    shm = SharedMemory(name=desc.name)
+    try:
+        view = np.ndarray(desc.shape, dtype=np.dtype(desc.dtype), buffer=shm.buf)
+        out = view.copy()
+        del view
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    return out
+
+# ---------------- Workload ----------------
+class SharedWorkload:
+    # dibuat sekali di sisi UI; worker cukup menerima .descriptor
+    def __init__(self, proc_tuples: list):
+        self.pids, self.cols = encode_workload(proc_tuples)
+        if len(set(self.pids)) != len(self.pids):
+            # hasil dipetakan balik lewat pid (export_result/import_result), jadi pid harus unik
+            raise ValueError("Process IDs must be unique")
+        pid_bytes = np.char.encode(np.array(self.pids, dtype=str), "utf-8") if self.pids else np.empty(0, dtype="S1")
+        self._segments: List[SharedMemory] = []
+        shm_cols, d_cols = share_array(self.cols)
+        shm_pids, d_pids = share_array(pid_bytes)
+        self._segments += [shm_cols, shm_pids]
+        self.descriptor = WorkloadDescriptor(d_cols, d_pids)
+
+    def close(self):
+        for shm in self._segments:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def load_workload(desc: WorkloadDescriptor, with_priority: bool = True) -> Tuple[list, list]:
+    # -> (pids, proc_tuples) siap untuk simulate_*
+    with attached(desc.pids) as raw:
+        pids = [p.decode() for p in raw.tolist()]
+    with attached(desc.cols) as cols:
+        at, bt, pr = cols[:, 0].tolist(), cols[:, 1].tolist(), cols[:, 2].astype(np.int64).tolist()
+    if with_priority:
+        return pids, list(zip(pids, at, bt, pr))
+    return pids, list(zip(pids, at, bt))
+
+# ---------------- Results ----------------
+def export_result(procs: list, gantt: list, total_time: Time, pids: list) -> ResultDescriptor:
+    # dipanggil di worker; segmen di-unlink oleh proses pemanggil import_result
+    index = {pid: i for i, pid in enumerate(pids)}
+    dtype = time_dtype([total_time] + [seg[1] for seg in gantt])
+    times = np.full((len(pids), 2), -1, dtype=dtype)
+    for p in procs:
+        i = index[p.pid]
+        times[i, 0] = p.start_time if p.start_time is not None else -1
+        times[i, 1] = p.completion_time if p.completion_time is not None else -1
+    rows = np.empty((len(gantt), 3), dtype=dtype)
+    for k, seg in enumerate(gantt):
+        rows[k, 0] = seg[0]
+        rows[k, 1] = seg[1]
+        rows[k, 2] = _OVERHEAD_INDEX.get(seg[2], index.get(seg[2], -3))
+    shm_t, d_t = share_array(times)
+    shm_g, d_g = share_array(rows)
+    shm_t.close()
+    shm_g.close()
+    return ResultDescriptor(d_t, d_g, total_time)
+
+def release_result(desc: ResultDescriptor):
+    # buang hasil tanpa membacanya (mis. run lain gagal); segmen yang sudah di-unlink dilewati
+    for d in (desc.times, desc.gantt):
+        try:
+            shm = SharedMemory(name=d.name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+def import_result_arrays(desc: ResultDescriptor) -> Tuple[np.ndarray, np.ndarray]:
+    # -> (times, rows gantt) apa adanya, tanpa membangun list gantt (lihat gantt_from_rows)
+    return read_array(desc.times, unlink=True), read_array(desc.gantt, unlink=True)
+
+def gantt_from_rows(rows: np.ndarray, pids: list) -> list:
+    idx = rows[:, 2].astype(np.int64).tolist()
+    return [(s, e, pids[i] if i >= 0 else _OVERHEAD_NAME.get(i, "?"))
+            for (s, e), i in zip(rows[:, :2].tolist(), idx)]
+
+def import_result(desc: ResultDescriptor, pids: list) -> Tuple[np.ndarray, list]:
+    times, rows = import_result_arrays(desc)
+    return times, gantt_from_rows(rows, pids)
@@ -2,7 +2,6 @@
 from tkinter import *
 from tkinter import ttk, messagebox, filedialog
 import threading
-from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 import matplotlib
 try:
@@ -12,43 +11,13 @@ except Exception:
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-# ---------------- Data class ----------------
-@dataclass
-class Process:
-    pid: str
-    arrival: int
-    burst: int
-    start_time: Optional[int] = None
-    completion_time: Optional[int] = None
-    waiting_time: Optional[int] = None
-    turnaround_time: Optional[int] = None
-
-# ---------------- Scheduling logic ----------------
-def simulate_sjf(proc_tuples: List[Tuple[str,int,int]]):
-    procs = [Process(pid, at, bt) for (pid, at, bt) in proc_tuples]
-    time_now = 0
-    completed = 0
-    n = len(procs)
-    gantt: List[Tuple[int,int,str]] = []
-
-    while completed < n:
-        # Pick arrived processes that are not completed
-        ready = [p for p in procs if p.start_time is None and p.arrival <= time_now]
-        if not ready:
-            time_now += 1
-            continue
-        # Pick process with shortest burst
-        cur = min(ready, key=lambda x: x.burst)
-        cur.start_time = time_now
-        gantt.append((time_now, time_now + cur.burst, cur.pid))
-        time_now += cur.burst
-        cur.completion_time = time_now
-        cur.turnaround_time = cur.completion_time - cur.arrival
-        cur.waiting_time = cur.turnaround_time - cur.burst
-        completed += 1
-
-    return procs, gantt, time_now
+from sjf_core import Process, simulate_sjf
+from instrument import SimStats
+from metrics import compute_metrics
+from widgets import StatsPanel, SMPControls, draw_gantt_3d
+from pool import get_pool
+from playback import PlaybackWindow
+from workload import parse_time
 
 # ---------------- UI constants ----------------
 APP_BG = "#69259c"
@@ -68,6 +37,7 @@ class SJFPage(Frame):
         self.fig.patch.set_facecolor(APP_BG)
 
         self.process_list: List[Tuple[str,int,int]] = []
+        self.last_run = None   # (gantt, procs_meta, total_time) untuk playback
 
         # Layout: three columns
         main_frame = Frame(self, bg=APP_BG)
@@ -104,8 +74,13 @@ class SJFPage(Frame):
         self.btn_reset = Button(ctrl_frame, text="🔁 Reset", bg="#f2d6ef", command=self.reset_all)
         self.btn_reset.pack(side=LEFT, padx=6)
 
+        self.smp_controls = SMPControls(left_frame, bg=APP_BG)
+        self.smp_controls.pack(pady=4, fill=X)
+
         self.btn_save = Button(left_frame, text="Save Gantt PNG", fg="white", bg="#fb47b2", command=self.save_gantt_png)
         self.btn_save.pack(fill=X, padx=12, pady=6)
+        self.btn_play = Button(left_frame, text="▶ Playback", bg="#f2d6ef", command=self.open_playback)
+        self.btn_play.pack(fill=X, padx=12, pady=2)
 
         Label(left_frame, text="Results (per-process)", bg=APP_BG, fg=TEXT_COLOR, font=("Segoe UI",11,"bold")).pack(pady=6)
         res_cols = ("PID","AT","BT","ST","CT","TAT","WT")
@@ -115,9 +90,12 @@ class SJFPage(Frame):
             self.res_tree.column(c, width=36, anchor=CENTER)
         self.res_tree.pack(fill=BOTH, expand=False, padx=8, pady=6)
 
-        self.avg_label = Label(left_frame, text="Avg WT: -    Avg TAT: -", bg=APP_BG, font=("Segoe UI",11,"bold"), fg=TEXT_COLOR)
+        self.avg_label = Label(left_frame, text="Avg WT: -    Avg TAT: -", bg=APP_BG, font=("Segoe UI",9,"bold"), fg=TEXT_COLOR, justify=LEFT)
         self.avg_label.pack(pady=6)
 
+        self.stats_panel = StatsPanel(left_frame, bg=APP_BG, fg=TEXT_COLOR)
+        self.stats_panel.pack(fill=X, padx=6, pady=2)
+
         # Mid frame: process list + back
         Label(mid_frame, text="Processes", font=("Segoe UI",13,"bold"), bg=APP_BG, fg=TEXT_COLOR).pack(pady=6)
         cols = ("PID","Arrival","Burst")
@@ -147,10 +125,10 @@ class SJFPage(Frame):
 
     def add_process(self):
         try:
-            at = int(self.entry_at.get())
-            bt = int(self.entry_bt.get())
+            at = parse_time(self.entry_at.get())
+            bt = parse_time(self.entry_bt.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Arrival and Burst must be integers.")
+            messagebox.showerror("Input Error", "Arrival and Burst must be numbers.")
             return
         pid = f"P{len(self.process_list)+1}"
         self.process_list.append((pid, at, bt))
@@ -166,34 +144,16 @@ class SJFPage(Frame):
         self.update_treeviews()
         self.res_tree.delete(*self.res_tree.get_children())
         self.avg_label.config(text="Avg WT: -    Avg TAT: -")
+        self.stats_panel.clear()
+        self.last_run = None
         self.ax.clear()
         self.canvas.draw()
 
     # ----- Gantt rendering -----
-    def render_3d_gantt(self, gantt_segments: List[Tuple[int,int,str]]):
-        ax = self.ax
-        fig = self.fig
-        ax.clear()
-        ax.set_facecolor(APP_BG)
-        fig.patch.set_facecolor(APP_BG)
-        y_pos = {pid: idx for idx,pid in enumerate([seg[2] for seg in gantt_segments])}
-        xs=[]; ys=[]; zs=[]; dxs=[]; dys=[]; dzs=[]; colors=[]
-        for start,end,pid in gantt_segments:
-            dur = end - start
-            xs.append(start); ys.append(y_pos[pid]); zs.append(0)
-            dxs.append(dur); dys.append(0.6); dzs.append(1)
-            colors.append(BAR_COLOR)
-        if xs:
-            ax.bar3d(xs, ys, zs, dxs, dys, dzs, color=colors, shade=True, edgecolor="#222222", linewidth=0.2)
-        ax.set_yticks(list(y_pos.values()))
-        ax.set_yticklabels(list(y_pos.keys()))
-        ax.set_xlabel("Time")
-        ax.set_zlim(0,1.5)
-        ax.set_zlabel("")
-        ax.set_title("3D Gantt (SJF)", color=TEXT_COLOR)
-        ax.view_init(elev=20, azim=-60)
-        step = max(1, max([seg[1] for seg in gantt_segments]+[1])//10)
-        ax.set_xticks(range(0, max([seg[1] for seg in gantt_segments]+[1])+1, step))
+    def render_3d_gantt(self, gantt_segments: List[Tuple[int,int,str]], procs_meta: List[Process], total_time: int):
+        self.fig.patch.set_facecolor(APP_BG)
+        draw_gantt_3d(self.ax, gantt_segments, "3D Gantt (SJF)", APP_BG, BAR_COLOR, TEXT_COLOR,
+                      pids=[p.pid for p in procs_meta], total_time=total_time)
         self.canvas.draw()
 
     # ----- simulate -----
@@ -204,12 +164,44 @@ class SJFPage(Frame):
         self.btn_start.config(state=DISABLED)
         self.btn_reset.config(state=DISABLED)
         snapshot = self.process_list.copy()
+        stats = self.stats_panel.new_stats()
+        try:
+            cores = self.smp_controls.cores()
+        except ValueError:
+            messagebox.showerror("Input Error", "Cores must be a positive integer.")
+            self.btn_start.config(state=NORMAL)
+            self.btn_reset.config(state=NORMAL)
+            return
+        per_core = self.smp_controls.per_core
         def worker():
-            procs_meta, gantt, total_time = simulate_sjf(snapshot)
-            self.after(0, self.update_after_sim, procs_meta, gantt, total_time)
+            try:
+                if cores > 1:
+                    procs_meta, gantt, total_time = get_pool().simulate("smp", snapshot, stats=stats, algorithm="sjf",
+                                                                        cores=cores, per_core=per_core)
+                else:
+                    procs_meta, gantt, total_time = get_pool().simulate("sjf", snapshot, stats=stats)
+            except Exception as e:
+                self.after(0, self.sim_failed, e)
+                return
+            self.after(0, self.update_after_sim, procs_meta, gantt, total_time, stats, cores)
         threading.Thread(target=worker).start()
 
-    def update_after_sim(self, procs_meta: List[Process], gantt: List[Tuple[int,int,str]], total_time: int):
+    def sim_failed(self, err):
+        messagebox.showerror("Error", f"Simulation failed: {err}")
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def update_after_sim(self, procs_meta: List[Process], gantt: List[Tuple[int,int,str]], total_time: int, stats: Optional[SimStats] = None, cores: int = 1):
+        self.fill_results(procs_meta)
+        metrics = compute_metrics(procs_meta, gantt, total_time, stats, cores=cores)
+        self.avg_label.config(text=metrics.summary_text())
+        self.render_3d_gantt(gantt, procs_meta, total_time)
+        self.last_run = (gantt, procs_meta, total_time)
+        self.stats_panel.show(stats)
+        self.btn_start.config(state=NORMAL)
+        self.btn_reset.config(state=NORMAL)
+
+    def fill_results(self, procs_meta: List[Process]):
         self.res_tree.delete(*self.res_tree.get_children())
         for p in procs_meta:
             st = p.start_time if p.start_time is not None else "-"
@@ -217,14 +209,13 @@ class SJFPage(Frame):
             tat = p.turnaround_time if p.turnaround_time is not None else "-"
             wt = p.waiting_time if p.waiting_time is not None else "-"
             self.res_tree.insert("", END, values=(p.pid, p.arrival, p.burst, st, ct, tat, wt))
-        tats = [p.turnaround_time for p in procs_meta if p.turnaround_time is not None]
-        wts = [p.waiting_time for p in procs_meta if p.waiting_time is not None]
-        avg_tat = sum(tats)/len(tats) if tats else 0
-        avg_wt = sum(wts)/len(wts) if wts else 0
-        self.avg_label.config(text=f"Avg WT: {avg_wt:.2f}    Avg TAT: {avg_tat:.2f}")
-        self.render_3d_gantt(gantt)
-        self.btn_start.config(state=NORMAL)
-        self.btn_reset.config(state=NORMAL)
+
+    def open_playback(self):
+        if self.last_run is None:
+            messagebox.showinfo("Playback", "Run the simulation first.")
+            return
+        gantt, procs_meta, total_time = self.last_run
+        PlaybackWindow(self, gantt, procs_meta, total_time, "Playback (SJF)", APP_BG, TEXT_COLOR)
 
     def save_gantt_png(self):
         p = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG","*.png")], initialfile="gantt_sjf.png")
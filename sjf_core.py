@@ -0,0 +1,58 @@
+#sjf_core.py
+# Engine SJF (non-preemptive) tanpa dependensi UI; dipakai sjf.py dan worker pool.
+import heapq
+from dataclasses import dataclass
+from typing import List, Tuple, Optional
+from time import perf_counter
+from instrument import SimStats, Time
+
+# ---------------- Data class ----------------
+@dataclass
+class Process:
+    pid: str
+    arrival: Time
+    burst: Time
+    start_time: Optional[Time] = None
+    completion_time: Optional[Time] = None
+    waiting_time: Optional[Time] = None
+    turnaround_time: Optional[Time] = None
+
+# ---------------- Scheduling logic ----------------
+def simulate_sjf(proc_tuples: List[Tuple[str,Time,Time]], stats: Optional[SimStats] = None):
+    if stats is not None:
+        t0 = perf_counter()
+    procs = [Process(pid, at, bt) for (pid, at, bt) in proc_tuples]
+    time_now = 0
+    completed = 0
+    n = len(procs)
+    gantt: List[Tuple[Time,Time,str]] = []
+    # urut arrival (stabil) + heap (burst, index input): seri burst -> urutan input
+    order = sorted(range(n), key=lambda i: procs[i].arrival)
+    ready: List[Tuple[Time,int]] = []
+    arr_i = 0
+    if stats is not None:
+        t1 = perf_counter()
+
+    while completed < n:
+        while arr_i < n and procs[order[arr_i]].arrival <= time_now:
+            i = order[arr_i]
+            heapq.heappush(ready, (procs[i].burst, i))
+            arr_i += 1
+        if not ready:
+            # CPU idle: lompat langsung ke arrival berikutnya
+            time_now = procs[order[arr_i]].arrival
+            continue
+        # Pick process with shortest burst
+        cur = procs[heapq.heappop(ready)[1]]
+        cur.start_time = time_now
+        gantt.append((time_now, time_now + cur.burst, cur.pid))
+        time_now += cur.burst
+        cur.completion_time = time_now
+        cur.turnaround_time = cur.completion_time - cur.arrival
+        cur.waiting_time = cur.turnaround_time - cur.burst
+        completed += 1
+
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=perf_counter() - t1)
+        stats.collect(procs, gantt, time_now)
+    return procs, gantt, time_now
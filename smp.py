@@ -0,0 +1,219 @@
+#smp.py
+# Mode multi-CPU (SMP) untuk FCFS / SJF / Priority / RR.
+# Event-driven: waktu langsung lompat ke event berikutnya (arrival atau core selesai /
+# quantum habis), jadi biaya tidak tergantung jumlah core x panjang timeline.
+# Ready queue bisa global (satu untuk semua core) atau per-core dengan work stealing.
+# Gantt berisi (start, end, pid, core) -> satu lane per core.
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import List, Optional, Tuple
+from instrument import SimStats
+
+ALGORITHMS = ("fcfs", "sjf", "priority", "rr")
+
+# ---------------- Data class ----------------
+@dataclass
+class Process:
+    pid: str
+    arrival: int
+    burst: int
+    priority: int = 0
+    remaining: int = field(init=False)
+    start_time: Optional[int] = None
+    completion_time: Optional[int] = None
+    waiting_time: Optional[int] = None
+    turnaround_time: Optional[int] = None
+    seq: int = 0
+    core: Optional[int] = None
+
+    def __post_init__(self):
+        self.remaining = self.burst
+
+# ---------------- Ready queues ----------------
+class _FifoQueue:
+    def __init__(self):
+        self.q = deque()
+
+    def __len__(self):
+        return len(self.q)
+
+    def push(self, p):
+        self.q.append(p)
+
+    def pop(self):
+        return self.q.popleft()
+
+    def steal(self):
+        # pencuri ambil dari ekor supaya tidak berebut dengan pemilik queue
+        return self.q.pop()
+
+class _HeapQueue:
+    def __init__(self, key):
+        self.h = []
+        self.key = key
+
+    def __len__(self):
+        return len(self.h)
+
+    def push(self, p):
+        heapq.heappush(self.h, (self.key(p), p.seq, p))
+
+    def pop(self):
+        return heapq.heappop(self.h)[-1]
+
+    def steal(self):
+        return heapq.heappop(self.h)[-1]
+
+    def peek(self):
+        return self.h[0][-1]
+
+def _prio_key(p):
+    return (p.priority, p.arrival, p.seq)
+
+def _make_queue(algorithm: str):
+    if algorithm in ("fcfs", "rr"):
+        return _FifoQueue()
+    if algorithm == "sjf":
+        return _HeapQueue(lambda p: (p.burst, p.arrival))
+    return _HeapQueue(lambda p: (p.priority, p.arrival))
+
+# ---------------- Scheduling logic ----------------
+def simulate_smp(proc_tuples: List[tuple], algorithm: str = "fcfs", cores: int = 2, per_core: bool = False,
+                 quantum: int = 2, preemptive: bool = False, stats: Optional[SimStats] = None):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if cores < 1:
+        raise ValueError("cores must be >= 1")
+    if algorithm == "rr" and quantum <= 0:
+        raise ValueError("quantum must be positive")
+    if stats is not None:
+        t0 = perf_counter()
+    procs = [Process(*t) for t in proc_tuples]
+    if algorithm == "priority":
+        order = sorted(procs, key=lambda p: (p.arrival, p.priority, p.pid))
+    else:
+        order = sorted(procs, key=lambda p: p.arrival)
+    for i, p in enumerate(order):
+        p.seq = i
+    n = len(procs)
+    gantt: List[Tuple[int,int,str,int]] = []
+    if n == 0:
+        return procs, gantt, 0
+
+    rr = algorithm == "rr"
+    preempt = preemptive and algorithm == "priority"
+    queues = [_make_queue(algorithm) for _ in range(cores if per_core else 1)]
+    queued = 0
+    running: List[Optional[Process]] = [None] * cores
+    seg_start = [0] * cores
+    version = [0] * cores
+    events: List[Tuple[int,int,int]] = []    # (time, core, version)
+    idle = list(range(cores))                # heap id core yang idle -> core terkecil dipakai dulu
+    place = 0                                # penempatan arrival round-robin (mode per-core)
+    arr_i = 0
+    completed = 0
+    time_now = 0
+    if stats is not None:
+        t1 = perf_counter()
+
+    def queue_of(c):
+        return queues[c] if per_core else queues[0]
+
+    def stop(c, t, to_idle=True):
+        # hentikan proses di core c pada waktu t, kembalikan prosesnya
+        p = running[c]
+        if t > seg_start[c]:
+            gantt.append((seg_start[c], t, p.pid, c))
+        p.remaining -= t - seg_start[c]
+        running[c] = None
+        version[c] += 1
+        if to_idle:
+            heapq.heappush(idle, c)
+        return p
+
+    def start(c, p, t):
+        if p.start_time is None:
+            p.start_time = t
+        p.core = c
+        running[c] = p
+        seg_start[c] = t
+        version[c] += 1
+        run = min(quantum, p.remaining) if rr else p.remaining
+        heapq.heappush(events, (t + run, c, version[c]))
+
+    while completed < n:
+        next_arr = order[arr_i].arrival if arr_i < n else None
+        if events and (next_arr is None or events[0][0] <= next_arr):
+            time_now = events[0][0]
+        else:
+            time_now = next_arr
+
+        # core yang selesai / quantum habis pada time_now
+        expired = []
+        while events and events[0][0] == time_now:
+            _, c, ver = heapq.heappop(events)
+            if ver != version[c]:
+                continue
+            p = stop(c, time_now)
+            if p.remaining == 0:
+                p.completion_time = time_now
+                p.turnaround_time = p.completion_time - p.arrival
+                p.waiting_time = p.turnaround_time - p.burst
+                completed += 1
+            else:
+                expired.append(p)
+
+        # arrival masuk sebelum proses yang di-requeue (sama seperti simulate_rr)
+        touched = set()
+        while arr_i < n and order[arr_i].arrival <= time_now:
+            p = order[arr_i]
+            arr_i += 1
+            if per_core:
+                c = place
+                place = (place + 1) % cores
+            else:
+                c = 0
+            queue_of(c).push(p)
+            queued += 1
+            touched.add(c)
+        for p in expired:
+            queue_of(p.core).push(p)
+            queued += 1
+
+        # dispatch ke core idle
+        while idle and queued:
+            c = heapq.heappop(idle)
+            q = queue_of(c)
+            if len(q):
+                p = q.pop()
+            else:
+                # work stealing dari queue terpanjang
+                p = max(queues, key=len).steal()
+            queued -= 1
+            start(c, p, time_now)
+
+        # preemptive priority: ganti proses yang kalah prioritas dengan kepala ready queue
+        if preempt and touched:
+            cands = touched if per_core else range(cores)
+            while queued:
+                if per_core:
+                    victims = [c for c in cands if running[c] is not None and len(queues[c])]
+                else:
+                    victims = [max(cands, key=lambda k: _prio_key(running[k]))] if not idle else []
+                swapped = False
+                for v in victims:
+                    q = queue_of(v)
+                    if _prio_key(q.peek()) < _prio_key(running[v]):
+                        q.push(stop(v, time_now, to_idle=False))
+                        start(v, q.pop(), time_now)
+                        swapped = True
+                if per_core or not swapped:
+                    break
+
+    gantt.sort()
+    if stats is not None:
+        stats.phases.update(setup=t1 - t0, dispatch=perf_counter() - t1)
+        stats.collect(procs, gantt, time_now, cores=cores)
+    return procs, gantt, time_now
@@ -0,0 +1,194 @@
+#streaming.py
+# Mode statistik online dengan memori konstan untuk run berjuta-juta proses. Engine di sini
+# membaca proses dari iterator (urut arrival, mis. workload.iter_workload), dan setiap proses
+# yang selesai langsung dimasukkan ke StreamingMetrics lalu dibuang -- tidak ada list procs
+# maupun gantt. Memori puncak hanya sebanding dengan ukuran ready queue.
+# Urutan dispatch sama dengan engine di *_core (diverifikasi terhadap compute_metrics).
+import argparse, heapq
+from collections import deque
+from typing import Iterable, Iterator, Optional, Tuple
+from metrics import StreamingMetrics
+from workload import WorkloadSpec, iter_workload
+
+# ---------------- Input ----------------
+class _Arrivals:
+    # pembungkus iterator dengan satu elemen look-ahead
+    def __init__(self, proc_iter: Iterable[tuple]):
+        self._it: Iterator[tuple] = iter(proc_iter)
+        self._last = float("-inf")
+        self.head: Optional[tuple] = None
+        self._advance()
+
+    def _advance(self):
+        self.head = next(self._it, None)
+        if self.head is not None:
+            if self.head[1] < self._last:
+                raise ValueError("streaming engines need processes sorted by arrival")
+            self._last = self.head[1]
+
+    def pop(self) -> tuple:
+        t = self.head
+        self._advance()
+        return t
+
+    def due(self, t) -> bool:
+        return self.head is not None and self.head[1] <= t
+
+# ---------------- Engines ----------------
+# Setiap engine -> (StreamingMetrics, total_time). Item ready queue: list
+# [pid, arrival, burst, remaining, start] supaya bisa di-update tanpa objek Process.
+def stream_fcfs(proc_iter: Iterable[tuple], sm: Optional[StreamingMetrics] = None) -> Tuple[StreamingMetrics, int]:
+    sm = sm or StreamingMetrics()
+    arr = _Arrivals(proc_iter)
+    time_now = 0
+    last_pid = None
+    while arr.head is not None:
+        pid, at, bt = arr.pop()[:3]
+        if time_now < at:
+            time_now = at
+        if last_pid is not None and pid != last_pid:
+            sm.context_switches += 1
+        last_pid = pid
+        sm.add(at, bt, time_now, time_now + bt)
+        time_now += bt
+    sm.ready_peak = max(sm.ready_peak, 1 if sm.n else 0)
+    return sm, time_now
+
+def stream_sjf(proc_iter: Iterable[tuple], sm: Optional[StreamingMetrics] = None) -> Tuple[StreamingMetrics, int]:
+    # non-preemptive; tie-break urutan input, sama seperti min() di simulate_sjf
+    sm = sm or StreamingMetrics()
+    arr = _Arrivals(proc_iter)
+    heap = []
+    seq = 0
+    time_now = 0
+    last_pid = None
+    while heap or arr.head is not None:
+        while arr.due(time_now):
+            pid, at, bt = arr.pop()[:3]
+            heapq.heappush(heap, (bt, seq, pid, at))
+            seq += 1
+        if len(heap) > sm.ready_peak:
+            sm.ready_peak = len(heap)
+        if not heap:
+            time_now = arr.head[1]
+            continue
+        bt, _, pid, at = heapq.heappop(heap)
+        if last_pid is not None and pid != last_pid:
+            sm.context_switches += 1
+        last_pid = pid
+        sm.add(at, bt, time_now, time_now + bt)
+        time_now += bt
+    return sm, time_now
+
+def stream_rr(proc_iter: Iterable[tuple], quantum: int = 2, cs_cost: int = 0, dispatch_cost: int = 0,
+              sm: Optional[StreamingMetrics] = None) -> Tuple[StreamingMetrics, int]:
+    # arrival selama satu slice masuk antrian sebelum proses yang di-requeue (seperti simulate_rr)
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+    sm = sm or StreamingMetrics()
+    arr = _Arrivals(proc_iter)
+    ready = deque()
+    time_now = 0
+    last_pid = None
+    while ready or arr.head is not None:
+        while arr.due(time_now):
+            pid, at, bt = arr.pop()[:3]
+            ready.append([pid, at, bt, bt, None])
+        if len(ready) > sm.ready_peak:
+            sm.ready_peak = len(ready)
+        if not ready:
+            time_now = arr.head[1]
+            continue
+        cur = ready.popleft()
+        if cs_cost and last_pid is not None and last_pid != cur[0]:
+            time_now += cs_cost
+            sm.overhead_time += cs_cost
+        if dispatch_cost:
+            time_now += dispatch_cost
+            sm.overhead_time += dispatch_cost
+        if last_pid is not None and cur[0] != last_pid:
+            sm.context_switches += 1
+        last_pid = cur[0]
+        if cur[4] is None:
+            cur[4] = time_now
+        run = min(cur[3], quantum)
+        cur[3] -= run
+        time_now += run
+        while arr.due(time_now):
+            pid, at, bt = arr.pop()[:3]
+            ready.append([pid, at, bt, bt, None])
+        if cur[3] > 0:
+            ready.append(cur)
+        else:
+            sm.add(cur[1], cur[2], cur[4], time_now)
+    return sm, time_now
+
+def stream_priority(proc_iter: Iterable[tuple], preemptive: bool = False,
+                    sm: Optional[StreamingMetrics] = None) -> Tuple[StreamingMetrics, int]:
+    # heap dengan kunci statis (priority, arrival, pid) seperti simulate_priority_processes;
+    # mode preemptive dievaluasi ulang hanya saat ada arrival (kunci tidak berubah di antaranya)
+    sm = sm or StreamingMetrics()
+    arr = _Arrivals(proc_iter)
+    heap = []
+    time_now = 0
+    last_pid = None
+    while heap or arr.head is not None:
+        while arr.due(time_now):
+            pid, at, bt, pr = arr.pop()[:4]
+            heapq.heappush(heap, (pr, at, pid, [bt, bt, None]))
+        if len(heap) > sm.ready_peak:
+            sm.ready_peak = len(heap)
+        if not heap:
+            time_now = arr.head[1]
+            continue
+        item = heapq.heappop(heap)
+        pid, at, state = item[2], item[1], item[3]
+        if last_pid is not None and pid != last_pid:
+            sm.context_switches += 1
+        last_pid = pid
+        if state[2] is None:
+            state[2] = time_now
+        end = time_now + state[1]
+        if preemptive and arr.head is not None and arr.head[1] < end:
+            end = arr.head[1]
+        state[1] -= end - time_now
+        time_now = end
+        if state[1] > 0:
+            heapq.heappush(heap, item)
+        else:
+            sm.add(at, state[0], state[2], time_now)
+    return sm, time_now
+
+STREAM_ENGINES = {"fcfs": stream_fcfs, "sjf": stream_sjf, "rr": stream_rr, "priority": stream_priority}
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Constant-memory simulation of a seeded synthetic workload; prints aggregate statistics only.")
+    ap.add_argument("-n", type=int, required=True, help="number of processes")
+    ap.add_argument("--algo", choices=tuple(STREAM_ENGINES), default="fcfs")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--rate", type=float, default=0.2, help="mean arrivals per time unit")
+    ap.add_argument("--burst-mean", type=float, default=4.0)
+    ap.add_argument("--quantum", type=int, default=2)
+    ap.add_argument("--preemptive", action="store_true")
+    args = ap.parse_args(argv)
+    if args.algo == "rr" and args.quantum <= 0:
+        ap.error("--quantum must be positive")
+
+    spec = WorkloadSpec(rate=args.rate, burst_mean=args.burst_mean)
+    procs = iter_workload(args.n, spec, seed=args.seed, with_priority=(args.algo == "priority"))
+    kwargs = {"quantum": args.quantum} if args.algo == "rr" else {}
+    if args.algo == "priority":
+        kwargs["preemptive"] = args.preemptive
+    sm, total_time = STREAM_ENGINES[args.algo](procs, **kwargs)
+    m = sm.result()
+    print(m.summary_text())
+    print(f"Total time {total_time}  ready-queue peak {sm.ready_peak}")
+    for name in ("wt", "tat"):
+        s = getattr(m, name)
+        print(f"{name.upper()} std {s.std:.2f}  histogram:")
+        for low, high, count in getattr(sm, name).hist.buckets():
+            print(f"  [{low:g}, {high:g})  {count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+#conftest.py
+# Modul simulator berupa file datar di root repo; tambahkan root ke sys.path untuk test.
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,38 @@
+import os
+import numpy as np
+import pytest
+from busy_period import busy_period_starts, simulate_split
+from pool import ENGINES, SimPool
+from workload import WorkloadSpec, generate_workload, to_tuples
+
+def test_starts_exact_above_float_precision():
+    # di sekitar 2^60 jarak antar float64 = 256: P2 datang 1 ns sebelum P1 selesai, tapi setelah
+    # dibulatkan keduanya jatuh di titik yang sama dan akan dipotong jadi busy period baru
+    base = 2 ** 60
+    arrival = np.array([base, base + 200, base + 500], dtype=np.int64)
+    burst = np.array([201, 5, 5], dtype=np.int64)
+    assert busy_period_starts(arrival, burst).tolist() == [0, 2]
+    assert busy_period_starts(arrival.astype(np.float64), burst.astype(np.float64)).tolist() == [0, 1, 2]
+
+@pytest.mark.parametrize("engine,kwargs", [("fcfs", {}), ("rr", {"quantum": 3}), ("priority", {"preemptive": True})])
+def test_split_matches_serial(engine, kwargs):
+    at, bt, pr = generate_workload(3000, WorkloadSpec(rate=0.15), seed=1)
+    tuples = to_tuples(at, bt, pr)
+    res = simulate_split(tuples, engine, parts=6, workers=2, **kwargs)
+    rows = sorted(tuples, key=lambda t: t[1])
+    procs, gantt, total_time = ENGINES[engine][0](rows if ENGINES[engine][1] else [t[:3] for t in rows], **kwargs)
+    done = {p.pid: (p.start_time, p.completion_time) for p in procs}
+    assert res.total_time == total_time
+    assert res.gantt == gantt
+    assert all(done[pid] == tuple(row) for pid, row in zip(res.pids, res.times.tolist()))
+
+def test_failed_range_releases_shared_memory():
+    before = set(os.listdir("/dev/shm"))
+    tuples = [("P1", 0, 3, 1), ("P2", 10, 2, 1), ("P3", 20, 2, 1)]
+    pool = SimPool(2)
+    try:
+        with pytest.raises(ValueError, match="aging"):
+            simulate_split(tuples, "priority", pool, parts=3, aging=-1)
+    finally:
+        pool.shutdown()
+    assert set(os.listdir("/dev/shm")) - before == set()
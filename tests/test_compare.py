@@ -0,0 +1,25 @@
+import os
+import pytest
+from compare import compare_all
+from shm import SharedWorkload
+
+TUPLES = [("P1", 0, 3, 2), ("P2", 1, 4, 1), ("P3", 2, 2, 3)]
+
+def _segments():
+    return set(os.listdir("/dev/shm"))
+
+def test_failed_run_releases_shared_memory():
+    before = _segments()
+    with pytest.raises(ValueError, match="aging"):
+        compare_all(TUPLES, {"quantum": 2, "aging": -1})
+    assert _segments() - before == set()
+
+def test_compare_all_runs_every_algorithm():
+    before = _segments()
+    res = compare_all(TUPLES, {"quantum": 2})
+    assert set(res) == {"FCFS", "SJF", "Priority", "RR", "CFS"}
+    assert _segments() - before == set()
+
+def test_duplicate_pids_rejected():
+    with pytest.raises(ValueError, match="unique"):
+        SharedWorkload([("P1", 0, 3, 1), ("P1", 1, 2, 1)])
@@ -0,0 +1,14 @@
+import pytest
+from export import output_names, plan_jobs
+
+def test_unique_stems_keep_plain_names():
+    assert output_names(["runs/a.csv", "runs/b.npz"]) == {"runs/a.csv": "a", "runs/b.npz": "b"}
+
+def test_same_stem_in_different_dirs_or_formats_do_not_collide():
+    names = output_names(["x/a/run.csv", "x/b/run.csv", "x/a/run.npz", "x/a/other.csv"])
+    assert names == {"x/a/run.csv": "a_run_csv", "x/b/run.csv": "b_run_csv",
+                     "x/a/run.npz": "a_run_npz", "x/a/other.csv": "other"}
+
+def test_plan_jobs_rejects_remaining_clash(tmp_path):
+    with pytest.raises(ValueError, match="same file name"):
+        plan_jobs(["a/run.csv", "a_run_csv.csv", "b/run.csv"], str(tmp_path), "fcfs", {})
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+from fcfs_core import fcfs_scan, simulate_fcfs
+from pool import SimPool
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float64])
+def test_parallel_scan_matches_serial_engine(dtype):
+    rng = np.random.default_rng(0)
+    at = np.sort(rng.integers(0, 5000, 4000)).astype(dtype)
+    bt = rng.integers(1, 5, 4000).astype(dtype)
+    procs, _, total_time = simulate_fcfs([(f"P{i}", a, b) for i, (a, b) in enumerate(zip(at.tolist(), bt.tolist()))])
+    pool = SimPool(3)
+    try:
+        start, completion = fcfs_scan(at, bt, pool.workers, pool)
+    finally:
+        pool.shutdown()
+    assert start.tolist() == [p.start_time for p in procs]
+    assert completion.tolist() == [p.completion_time for p in procs]
+    assert completion[-1] == total_time
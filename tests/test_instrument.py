@@ -0,0 +1,24 @@
+import pytest
+from instrument import SimStats
+from rr_core import simulate_rr
+from smp import simulate_smp
+
+@pytest.mark.parametrize("kwargs", [{}, {"dispatch_cost": 1}])
+def test_lone_rr_process_is_one_dispatch(kwargs):
+    stats = SimStats()
+    simulate_rr([("a", 0, 6)], quantum=2, stats=stats, **kwargs)
+    assert (stats.dispatches, stats.preemptions, stats.context_switches) == (1, 0, 0)
+    assert stats.queue_ops == 2 and stats.ready_peak == 1
+
+@pytest.mark.parametrize("kwargs", [{}, {"cs_cost": 1}])
+def test_rr_preemption_counted_when_another_process_runs(kwargs):
+    # a[0,2] b[2,4] a[4,6]: a keluar sekali karena b
+    stats = SimStats()
+    simulate_rr([("a", 0, 4), ("b", 0, 2)], quantum=2, stats=stats, **kwargs)
+    assert (stats.dispatches, stats.preemptions, stats.context_switches) == (3, 1, 2)
+    assert stats.queue_ops == 6 and stats.ready_peak == 2
+
+def test_smp_counts_per_lane():
+    stats = SimStats()
+    simulate_smp([("a", 0, 4), ("b", 0, 4)], cores=2, algorithm="rr", quantum=2, stats=stats)
+    assert (stats.dispatches, stats.preemptions, stats.context_switches) == (2, 0, 0)
@@ -0,0 +1,71 @@
+#test_metrics.py
+import numpy as np
+import pytest
+from metrics import LogHistogram, StreamingMetrics, compute_metrics, count_switches, metrics_from_arrays
+from rr_core import simulate_rr
+
+def test_metrics_from_arrays_hand_computed():
+    # FCFS a(0,3) b(1,2) c(10,1): start 0,3,10, selesai 3,5,11 -> WT 0,2,0  TAT 3,4,1  RT 0,2,0
+    arrival, burst = np.array([0, 1, 10]), np.array([3, 2, 1])
+    start, completion = np.array([0, 3, 10]), np.array([3, 5, 11])
+    m = metrics_from_arrays(arrival, burst, start, completion, context_switches=2)
+    assert m.n == 3
+    assert m.wt.mean == pytest.approx(2 / 3) and m.tat.mean == pytest.approx(8 / 3)
+    for summary, values in ((m.wt, [0, 2, 0]), (m.tat, [3, 4, 1]), (m.rt, [0, 2, 0])):
+        assert [summary.p50, summary.p90, summary.p99] == pytest.approx(np.percentile(values, [50, 90, 99]))
+        assert summary.max == max(values)
+    assert (m.wt.p90, m.wt.p99) == pytest.approx((1.6, 1.96))
+    assert m.makespan == 11 and m.busy_time == 6
+    assert m.throughput == pytest.approx(3 / 11)
+    assert m.cpu_util == pytest.approx(6 / 11)
+    assert m.cs_rate == pytest.approx(2 / 11)
+    # dua core: kapasitas 2 x makespan
+    m2 = metrics_from_arrays(arrival, burst, start, completion, cores=2)
+    assert m2.cpu_util == pytest.approx(6 / 22)
+
+def test_compute_metrics_with_overhead_segments():
+    # RR q=2, CS 1: a[0,2] CS[2,3] b[3,5] CS[5,6] a[6,8]
+    procs, gantt, total_time = simulate_rr([("a", 0, 4), ("b", 0, 2)], quantum=2, cs_cost=1)
+    assert gantt == [(0, 2, "a"), (2, 3, "CS"), (3, 5, "b"), (5, 6, "CS"), (6, 8, "a")]
+    m = compute_metrics(procs, gantt, total_time)
+    assert m.context_switches == 2          # segmen CS bukan proses
+    assert m.overhead_time == 2
+    assert m.wt.mean == pytest.approx(3.5) and m.rt.mean == pytest.approx(1.5)
+    assert m.makespan == 8 and m.busy_time == 6
+    assert m.cpu_util == pytest.approx(0.75) and m.throughput == pytest.approx(0.25)
+
+def test_count_switches():
+    assert count_switches([(0, 1, "a"), (1, 2, "CS"), (2, 3, "a")]) == 0
+    assert count_switches([(0, 1, "a"), (1, 2, "DISP"), (2, 3, "b"), (3, 4, "a")]) == 2
+    # SMP: per lane core, pergantian antar core tidak dihitung
+    assert count_switches([(0, 1, "a", 0), (0, 1, "b", 1), (1, 2, "a", 0), (1, 2, "c", 1)]) == 1
+
+@pytest.mark.parametrize("scale", [0.01, 1.0, 1e3, 1e12])
+def test_histogram_quantiles_match_numpy(scale):
+    # error relatif <= 1/SUB juga untuk nilai di bawah 1 dan timestamp nanodetik
+    x = np.random.default_rng(0).uniform(0, scale, 20000)
+    h = LogHistogram()
+    for v in x.tolist():
+        h.add(v)
+    for q in (0.5, 0.9, 0.99):
+        want = np.percentile(x, q * 100)
+        assert abs(h.quantile(q) - want) <= want / LogHistogram.SUB
+
+def test_streaming_percentiles_sub_unit():
+    sm = StreamingMetrics()
+    wt = np.random.default_rng(1).uniform(0, 0.01, 5000)
+    for w in wt.tolist():
+        sm.add(0.0, 0.001, w, w + 0.001)
+    m = sm.result()
+    p50, p90, p99 = np.percentile(wt, [50, 90, 99])
+    assert m.wt.p50 == pytest.approx(p50, rel=1 / 16)
+    assert m.wt.p90 == pytest.approx(p90, rel=1 / 16)
+    assert m.wt.p99 == pytest.approx(p99, rel=1 / 16)
+    assert m.wt.p50 < m.wt.p90 < m.wt.p99
+
+def test_histogram_zero_and_huge():
+    h = LogHistogram()
+    for v in (0, 0, 2 ** 70):
+        h.add(v)
+    assert h.quantile(0.0) < 1e-9
+    assert h.buckets()[0][2] == 2
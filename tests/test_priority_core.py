@@ -0,0 +1,20 @@
+#test_priority_core.py
+from instrument import SimStats
+from priority_core import simulate_priority_processes
+
+def test_preempted_during_overhead_does_not_start():
+    # P3 datang saat CS 3..5 dan mengalahkan P2: P2 tidak boleh dapat start/segmen kosong
+    stats = SimStats()
+    procs, gantt, total = simulate_priority_processes(
+        [("P1", 0, 3, 2), ("P2", 1, 4, 3), ("P3", 4, 2, 1)], preemptive=True, cs_cost=2, stats=stats)
+    assert gantt == [(0, 3, "P1"), (3, 5, "CS"), (5, 7, "P3"), (7, 9, "CS"), (9, 13, "P2")]
+    assert all(s < e for s, e, _ in gantt)
+    start = {p.pid: p.start_time for p in procs}
+    assert start == {"P1": 0, "P2": 9, "P3": 5}
+    assert total == 13
+    assert stats.dispatches == 3 and stats.preemptions == 0
+
+def test_overhead_free_schedule_unchanged():
+    procs, gantt, total = simulate_priority_processes(
+        [("P1", 0, 3, 2), ("P2", 1, 4, 3), ("P3", 4, 2, 1)], preemptive=True)
+    assert gantt == [(0, 3, "P1"), (3, 4, "P2"), (4, 6, "P3"), (6, 9, "P2")]
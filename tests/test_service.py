@@ -0,0 +1,57 @@
+import asyncio
+import os
+import tempfile
+import pytest
+from service import MAX_LINE, SimService, request
+
+WORKLOAD = [["P1", 0, 5], ["P2", 1, 3], ["P3", 2, 1]]
+
+def _run(scenario):
+    # service asli di Unix socket sementara, scenario(sock, service) dijalankan sebagai klien
+    async def main():
+        service = SimService(workers=1, batch_window=0.05)
+        sock = os.path.join(tempfile.mkdtemp(), "sched.sock")
+        server = await asyncio.start_unix_server(service.handle, path=sock, limit=MAX_LINE)
+        try:
+            async with server:
+                return await scenario(sock, service)
+        finally:
+            service.pool.shutdown()
+            os.unlink(sock)
+    return asyncio.run(main())
+
+def test_round_trip_and_cache_hit():
+    async def scenario(sock, service):
+        msg = {"id": 7, "algo": "rr", "params": {"quantum": 2}, "workload": WORKLOAD}
+        return await request(msg, sock), await request(msg, sock), service.counters
+    first, second, counters = _run(scenario)
+    assert first["result"]["id"] == 7 and first["result"]["cached"] is False
+    assert first["result"]["total_time"] == 9
+    assert [row[0] for row in first["procs"]] == ["P1", "P2", "P3"]
+    assert first["gantt"][0] == [0, 2, "P1"]
+    assert second["result"]["cached"] is True
+    assert second["procs"] == first["procs"] and second["gantt"] == first["gantt"]
+    assert counters["simulations"] == 1 and counters["cache_hits"] == 1
+
+def test_identical_inflight_requests_are_coalesced():
+    async def scenario(sock, service):
+        msg = {"id": 1, "algo": "sjf", "workload": WORKLOAD}
+        replies = await asyncio.gather(*(request(dict(msg, id=i), sock) for i in range(3)))
+        return replies, service.counters
+    replies, counters = _run(scenario)
+    assert [r["result"]["id"] for r in replies] == [0, 1, 2]
+    assert all(r["procs"] == replies[0]["procs"] for r in replies)
+    assert counters["simulations"] == 1 and counters["coalesced"] == 2
+
+@pytest.mark.parametrize("msg,error", [
+    ({"algo": "rr", "params": {"bogus": 1}, "workload": WORKLOAD}, "bogus"),
+    ({"algo": "rr", "params": [2], "workload": WORKLOAD}, "params must be an object"),
+    ({"algo": "nope", "workload": WORKLOAD}, "unknown algo"),
+    ({"algo": "rr", "params": {"quantum": 0}, "workload": WORKLOAD}, "quantum must be positive"),
+])
+def test_bad_params_get_error_reply(msg, error):
+    async def scenario(sock, service):
+        with pytest.raises(RuntimeError, match=error):
+            await request(dict(msg, id=3), sock)
+        return service.counters
+    assert _run(scenario)["errors"] == 1
@@ -0,0 +1,12 @@
+import pytest
+from smp import simulate_smp
+
+@pytest.mark.parametrize("quantum", [0, -1])
+def test_rr_rejects_non_positive_quantum(quantum):
+    with pytest.raises(ValueError, match="quantum must be positive"):
+        simulate_smp([("a", 0, 3), ("b", 0, 2)], cores=2, algorithm="rr", quantum=quantum)
+
+def test_rr_two_cores():
+    procs, gantt, total_time = simulate_smp([("a", 0, 3), ("b", 0, 2)], cores=2, algorithm="rr", quantum=2)
+    assert total_time == 3
+    assert {p.pid: p.completion_time for p in procs} == {"a": 3, "b": 2}
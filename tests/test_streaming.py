@@ -0,0 +1,18 @@
+import pytest
+from streaming import stream_fcfs, stream_rr
+
+def test_fcfs_rejects_unsorted_arrivals():
+    with pytest.raises(ValueError, match="sorted by arrival"):
+        stream_fcfs([("a", 5, 1), ("b", 0, 1)])
+
+def test_fcfs_sorted_arrivals():
+    sm, total_time = stream_fcfs([("a", 0, 3), ("b", 1, 2), ("c", 10, 1)])
+    m = sm.result()
+    assert total_time == 11
+    assert m.n == 3 and m.wt.mean == pytest.approx(2 / 3)
+    assert m.context_switches == 2
+
+@pytest.mark.parametrize("quantum", [0, -2])
+def test_rr_rejects_non_positive_quantum(quantum):
+    with pytest.raises(ValueError, match="quantum must be positive"):
+        stream_rr([("a", 0, 3)], quantum=quantum)
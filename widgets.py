@@ -0,0 +1,68 @@
+#widgets.py
+# Widget Tk yang dipakai bersama oleh halaman-halaman scheduler.
+from tkinter import *
+from instrument import SimStats
+from gantt_plot import LANE_COLORS, OVERHEAD_COLOR, draw_gantt_3d  # noqa: F401 (re-export)
+
+# ---------------- Collapsible stats panel ----------------
+class StatsPanel(Frame):
+    def __init__(self, parent, bg, fg):
+        super().__init__(parent, bg=bg)
+        self.fg = fg
+        self.expanded = False
+
+        header = Frame(self, bg=bg)
+        header.pack(fill=X)
+        self.enabled_var = BooleanVar(value=False)
+        Checkbutton(header, text="Instrument", variable=self.enabled_var, bg=bg).pack(side=LEFT, padx=6)
+        self.btn_toggle = Button(header, text="▸ Run stats", bg="#f2d6ef", command=self.toggle)
+        self.btn_toggle.pack(side=LEFT, padx=6)
+
+        self.body = Label(self, text="(no stats)", bg=bg, fg=fg, justify=LEFT, anchor=W, font=("Segoe UI", 9))
+
+    @property
+    def enabled(self) -> bool:
+        return self.enabled_var.get()
+
+    def new_stats(self):
+        # dipanggil di thread Tk sebelum worker jalan; None = instrumentasi mati
+        return SimStats() if self.enabled else None
+
+    def toggle(self):
+        self.expanded = not self.expanded
+        if self.expanded:
+            self.body.pack(fill=X, padx=8, pady=2)
+            self.btn_toggle.config(text="▾ Run stats")
+        else:
+            self.body.pack_forget()
+            self.btn_toggle.config(text="▸ Run stats")
+
+    def show(self, stats):
+        if stats is None:
+            self.body.config(text="(instrumentation off)")
+        else:
+            self.body.config(text="\n".join(stats.summary_lines()))
+
+    def clear(self):
+        self.body.config(text="(no stats)")
+
+# ---------------- SMP controls ----------------
+class SMPControls(Frame):
+    def __init__(self, parent, bg):
+        super().__init__(parent, bg=bg)
+        Label(self, text="Cores", bg=bg).pack(side=LEFT, padx=4)
+        self.entry_cores = Entry(self, width=4)
+        self.entry_cores.pack(side=LEFT, padx=4)
+        self.entry_cores.insert(0, "1")
+        self.per_core_var = BooleanVar(value=False)
+        Checkbutton(self, text="Per-core queues", variable=self.per_core_var, bg=bg).pack(side=LEFT, padx=4)
+
+    def cores(self) -> int:
+        c = int(self.entry_cores.get())
+        if c < 1:
+            raise ValueError("cores must be >= 1")
+        return c
+
+    @property
+    def per_core(self) -> bool:
+        return self.per_core_var.get()
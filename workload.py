@@ -0,0 +1,362 @@
+#workload.py
+# Generator workload sintetis (seeded) untuk load testing / benchmark.
+# Output bisa berupa NumPy arrays (generate_workload) atau stream tuple
+# (iter_workload) supaya workload yang lebih besar dari memori bisa langsung
+# dimasukkan ke simulator.
+import sys, csv, argparse
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Tuple
+from operator import itemgetter
+import numpy as np
+from instrument import Time
+
+ARRIVAL_MODELS = ("poisson", "bursty")
+BURST_MODELS = ("exponential", "pareto", "lognormal")
+
+# ---------------- Spec ----------------
+@dataclass
+class WorkloadSpec:
+    # arrivals
+    arrival: str = "poisson"
+    rate: float = 1.0                 # rata-rata arrival per unit waktu (poisson / fase off)
+    burst_rate: float = 10.0          # rate saat fase burst (bursty)
+    burst_on_len: float = 20.0        # rata-rata jumlah arrival per fase burst
+    burst_off_len: float = 50.0       # rata-rata jumlah arrival per fase tenang
+    # CPU burst lengths
+    burst: str = "pareto"
+    burst_mean: float = 5.0
+    pareto_shape: float = 2.5
+    lognormal_sigma: float = 1.0
+    max_burst: Optional[int] = None
+    # priorities (1 = tertinggi, sama seperti priority.py)
+    priority_levels: int = 5
+    priority_weights: Optional[Sequence[float]] = None
+
+    def validate(self):
+        if self.arrival not in ARRIVAL_MODELS:
+            raise ValueError(f"Unknown arrival model: {self.arrival}")
+        if self.burst not in BURST_MODELS:
+            raise ValueError(f"Unknown burst model: {self.burst}")
+        if self.rate <= 0 or self.burst_rate <= 0:
+            raise ValueError("Arrival rates must be positive.")
+        if self.burst_mean < 1:
+            raise ValueError("burst_mean must be >= 1.")
+        if self.burst == "pareto" and self.pareto_shape <= 1:
+            raise ValueError("pareto_shape must be > 1 for a finite mean.")
+        if self.priority_levels < 1:
+            raise ValueError("priority_levels must be >= 1.")
+        if self.priority_weights is not None and len(self.priority_weights) != self.priority_levels:
+            raise ValueError("priority_weights must have priority_levels entries.")
+
+# ---------------- Sampling ----------------
+def _sample_bursts(rng: np.random.Generator, spec: WorkloadSpec, k: int) -> np.ndarray:
+    if spec.burst == "exponential":
+        raw = rng.exponential(spec.burst_mean, k)
+    elif spec.burst == "pareto":
+        # Pareto klasik: mean = a*xm/(a-1)
+        a = spec.pareto_shape
+        xm = spec.burst_mean * (a - 1) / a
+        raw = xm * (1.0 + rng.pareto(a, k))
+    else:
+        s = spec.lognormal_sigma
+        mu = np.log(spec.burst_mean) - s * s / 2
+        raw = rng.lognormal(mu, s, k)
+    bursts = np.maximum(1, np.ceil(raw)).astype(np.int64)
+    if spec.max_burst is not None:
+        np.minimum(bursts, spec.max_burst, out=bursts)
+    return bursts
+
+def _sample_priorities(rng: np.random.Generator, spec: WorkloadSpec, k: int) -> np.ndarray:
+    if spec.priority_weights is None:
+        return rng.integers(1, spec.priority_levels + 1, k, dtype=np.int64)
+    w = np.asarray(spec.priority_weights, dtype=float)
+    return rng.choice(spec.priority_levels, size=k, p=w / w.sum()).astype(np.int64) + 1
+
+# ---------------- Streaming ----------------
+def iter_chunks(n: Optional[int], spec: Optional[WorkloadSpec] = None, seed: Optional[int] = 0,
+                chunk: int = 65536) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    # yield (arrival, burst, priority) per chunk; n=None -> stream tanpa batas
+    spec = spec or WorkloadSpec()
+    spec.validate()
+    rng = np.random.default_rng(seed)
+    t = 0.0
+    bursting = False
+    phase_left = 0
+    produced = 0
+    while n is None or produced < n:
+        k = chunk if n is None else min(chunk, n - produced)
+        if spec.arrival == "poisson":
+            gaps = rng.exponential(1.0 / spec.rate, k)
+        else:
+            # Markov-modulated: fase burst / tenang bergantian, panjang fase geometrik
+            rates = np.empty(k)
+            i = 0
+            while i < k:
+                if phase_left <= 0:
+                    bursting = not bursting
+                    mean_len = spec.burst_on_len if bursting else spec.burst_off_len
+                    phase_left = int(rng.geometric(1.0 / max(1.0, mean_len)))
+                take = min(phase_left, k - i)
+                rates[i:i + take] = spec.burst_rate if bursting else spec.rate
+                phase_left -= take
+                i += take
+            gaps = rng.exponential(1.0, k) / rates
+        times = t + np.cumsum(gaps)
+        t = float(times[-1])
+        arrival = np.floor(times).astype(np.int64)
+        if produced == 0:
+            # proses pertama selalu datang di t=0 (sama seperti load_sample)
+            arrival -= arrival[0]
+            t -= float(np.floor(times[0]))
+        yield arrival, _sample_bursts(rng, spec, k), _sample_priorities(rng, spec, k)
+        produced += k
+
+def iter_workload(n: Optional[int], spec: Optional[WorkloadSpec] = None, seed: Optional[int] = 0,
+                  with_priority: bool = True, chunk: int = 65536) -> Iterator[tuple]:
+    # stream tuple (pid, at, bt[, pr]) secara lazy, format yang dipakai simulate_*
+    idx = 0
+    for arrival, burst, prio in iter_chunks(n, spec, seed, chunk):
+        if with_priority:
+            for at, bt, pr in zip(arrival.tolist(), burst.tolist(), prio.tolist()):
+                idx += 1
+                yield (f"P{idx}", at, bt, pr)
+        else:
+            for at, bt in zip(arrival.tolist(), burst.tolist()):
+                idx += 1
+                yield (f"P{idx}", at, bt)
+
+def generate_workload(n: int, spec: Optional[WorkloadSpec] = None, seed: Optional[int] = 0,
+                      chunk: int = 65536) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # versi array; identik dengan iter_workload untuk seed & chunk yang sama
+    parts = list(iter_chunks(n, spec, seed, chunk))
+    if not parts:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy(), empty.copy()
+    return tuple(np.concatenate(col) for col in zip(*parts))
+
+def to_tuples(arrival: np.ndarray, burst: np.ndarray, priority: Optional[np.ndarray] = None) -> list:
+    pids = [f"P{i+1}" for i in range(len(arrival))]
+    if priority is None:
+        return list(zip(pids, arrival.tolist(), burst.tolist()))
+    return list(zip(pids, arrival.tolist(), burst.tolist(), priority.tolist()))
+
+# ---------------- Encoding ----------------
+def parse_time(s) -> Time:
+    # "3" -> 3, "2.5" / "1e3" -> float; waktu integral tetap int supaya hasil lama tidak berubah
+    s = str(s).strip()
+    try:
+        return int(s)
+    except ValueError:
+        v = float(s)
+    if v != v or v in (float("inf"), float("-inf")):
+        raise ValueError(f"invalid time value: {s!r}")
+    return v
+
+def time_dtype(values) -> np.dtype:
+    # int64 kalau semua waktu integer (termasuk timestamp nanodetik), float64 kalau ada pecahan
+    return np.dtype(np.int64) if all(isinstance(v, (int, np.integer)) for v in values) else np.dtype(np.float64)
+
+def encode_workload(proc_tuples: list) -> Tuple[list, np.ndarray]:
+    # urutkan sekali berdasarkan arrival (stabil), simpan sebagai kolom (arrival, burst, priority);
+    # int64 untuk workload integer, float64 kalau ada waktu pecahan. Kolom diambil dengan
+    # map(itemgetter) dan diurutkan dengan argsort, jadi tidak ada loop Python per baris.
+    n = len(proc_tuples)
+    if n == 0:
+        return [], np.zeros((0, 3), dtype=np.int64)
+    at = np.array(list(map(itemgetter(1), proc_tuples)))
+    bt = np.array(list(map(itemgetter(2), proc_tuples)))
+    dtype = np.dtype(np.int64) if at.dtype.kind in "iu" and bt.dtype.kind in "iu" else np.dtype(np.float64)
+    cols = np.empty((n, 3), dtype=dtype)
+    cols[:, 0] = at
+    cols[:, 1] = bt
+    if min(map(len, proc_tuples)) > 3:
+        cols[:, 2] = list(map(itemgetter(3), proc_tuples))
+    else:
+        cols[:, 2] = [t[3] if len(t) > 3 else 0 for t in proc_tuples]
+    order = np.argsort(cols[:, 0], kind="stable")
+    pids = list(map(itemgetter(0), proc_tuples))
+    return [pids[i] for i in order.tolist()], cols[order]
+
+def decode_workload(pids: list, cols: np.ndarray, with_priority: bool = True) -> list:
+    at, bt = cols[:, 0].tolist(), cols[:, 1].tolist()
+    if with_priority:
+        return list(zip(pids, at, bt, cols[:, 2].astype(np.int64).tolist()))
+    return list(zip(pids, at, bt))
+
+def _is_number(cell: str) -> bool:
+    try:
+        parse_time(cell)
+        return True
+    except ValueError:
+        return False
+
+def read_workload_csv(path: str) -> list:
+    # CSV pid,arrival,burst,priority (header opsional) atau arrival,burst,priority tanpa pid
+    # -> [(pid, arrival, burst, priority)]; format sama dengan Import CSV di halaman Priority.
+    # Arrival/burst boleh pecahan (mis. detik dari trace), priority tetap integer.
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    if not rows:
+        raise ValueError("Empty CSV")
+    start_idx = 1 if any(not _is_number(cell) for cell in rows[0][1:]) else 0
+    pl = []
+    for i, row in enumerate(rows[start_idx:], start=1):
+        if len(row) >= 4:
+            pl.append((row[0].strip(), parse_time(row[1]), parse_time(row[2]), int(row[3])))
+        elif len(row) == 3:
+            pl.append((f"P{i}", parse_time(row[0]), parse_time(row[1]), int(row[2])))
+    return pl
+
+# ---------------- Binary cache ----------------
+# .npz berisi pids (unicode) + kolom encode_workload; jauh lebih cepat dibaca daripada CSV
+# untuk workload besar (mis. hasil sched_trace.py)
+def save_workload_npz(path: str, proc_tuples: list):
+    pids, cols = encode_workload(proc_tuples)
+    np.savez(path, pids=np.array(pids, dtype=str), cols=cols)
+
+def load_workload_npz(path: str, with_priority: bool = True) -> list:
+    with np.load(path, allow_pickle=False) as z:
+        return decode_workload(z["pids"].tolist(), z["cols"], with_priority)
+
+def read_workload(path: str) -> list:
+    # -> [(pid, arrival, burst, priority)] dari .npz (cache biner) atau CSV
+    if path.lower().endswith(".npz"):
+        return load_workload_npz(path)
+    return read_workload_csv(path)
+
+# ---------------- CPU / I/O bursts ----------------
+# Workload multi-burst: tiap proses = CPU, I/O, CPU, ..., CPU (selalu mulai & berakhir dengan
+# CPU). Disimpan gaya CSR: satu array bursts datar + offsets per proses, jadi jutaan burst
+# hanya 8 byte per burst (dipakai io_core.py).
+@dataclass
+class IOWorkload:
+    pids: list
+    arrival: np.ndarray
+    priority: np.ndarray
+    offsets: np.ndarray       # panjang n+1; burst proses i = bursts[offsets[i]:offsets[i+1]]
+    bursts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def bursts_of(self, i: int) -> list:
+        return self.bursts[self.offsets[i]:self.offsets[i + 1]].tolist()
+
+    def validate(self):
+        lengths = np.diff(self.offsets)
+        if len(lengths) != len(self.pids) or np.any(lengths % 2 == 0):
+            raise ValueError("each process needs an odd number of bursts (CPU, I/O, ..., CPU)")
+        if np.any(self.bursts < 0) or np.any(self.arrival < 0):
+            raise ValueError("arrival and burst lengths must be non-negative")
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> "IOWorkload":
+        # rows: (pid, arrival, priority, [cpu, io, cpu, ...])
+        lengths = [len(r[3]) for r in rows]
+        flat = [b for r in rows for b in r[3]]
+        wl = cls([r[0] for r in rows],
+                 np.array([r[1] for r in rows], dtype=time_dtype([r[1] for r in rows])),
+                 np.array([r[2] for r in rows], dtype=np.int64),
+                 np.concatenate(([0], np.cumsum(lengths, dtype=np.int64))),
+                 np.array(flat, dtype=time_dtype(flat)))
+        wl.validate()
+        return wl
+
+    def rows(self) -> Iterator[tuple]:
+        at, pr = self.arrival.tolist(), self.priority.tolist()
+        for i, pid in enumerate(self.pids):
+            yield pid, at[i], pr[i], self.bursts_of(i)
+
+def generate_io_workload(n: int, spec: Optional[WorkloadSpec] = None, seed: Optional[int] = 0,
+                         cycles_mean: float = 4.0, io_mean: float = 10.0) -> IOWorkload:
+    # arrival & priority sama dengan generate_workload(seed); jumlah burst CPU per proses
+    # geometrik (mean cycles_mean), panjang CPU dari spec.burst, I/O eksponensial (mean io_mean)
+    spec = spec or WorkloadSpec()
+    if cycles_mean < 1 or io_mean < 0:
+        raise ValueError("cycles_mean must be >= 1 and io_mean >= 0.")
+    arrival, _, priority = generate_workload(n, spec, seed)
+    rng = np.random.default_rng(None if seed is None else [seed, 1])
+    cycles = rng.geometric(1.0 / cycles_mean, n)
+    lengths = 2 * cycles - 1
+    offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+    rel = np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+    cpu = rel % 2 == 0
+    bursts = np.empty(offsets[-1], dtype=np.int64)
+    bursts[cpu] = _sample_bursts(rng, spec, int(cpu.sum()))
+    bursts[~cpu] = np.ceil(rng.exponential(io_mean, int((~cpu).sum()))).astype(np.int64)
+    return IOWorkload([f"P{i+1}" for i in range(n)], arrival, priority, offsets, bursts)
+
+def read_io_workload(path: str) -> IOWorkload:
+    # .npz (kolom CSR) atau CSV pid,arrival,priority,bursts (bursts dipisah spasi)
+    if path.lower().endswith(".npz"):
+        with np.load(path, allow_pickle=False) as z:
+            wl = IOWorkload(z["pids"].tolist(), z["arrival"], z["priority"], z["offsets"], z["bursts"])
+        wl.validate()
+        return wl
+    rows = []
+    with open(path, newline="") as f:
+        for i, row in enumerate(csv.reader(f)):
+            if i == 0 and not _is_number(row[1]):
+                continue
+            rows.append((row[0].strip(), parse_time(row[1]), int(row[2]), [parse_time(b) for b in row[3].split()]))
+    return IOWorkload.from_rows(rows)
+
+def save_io_workload(path: str, wl: IOWorkload):
+    if path.lower().endswith(".npz"):
+        np.savez(path, pids=np.array(wl.pids, dtype=str), arrival=wl.arrival, priority=wl.priority,
+                 offsets=wl.offsets, bursts=wl.bursts)
+        return
+    with open(path, "w", newline="") as f:
+        write_io_csv(f, wl)
+
+def write_io_csv(f, wl: IOWorkload):
+    w = csv.writer(f)
+    w.writerow(("pid", "arrival", "priority", "bursts"))
+    for pid, at, pr, bursts in wl.rows():
+        w.writerow((pid, at, pr, " ".join(map(str, bursts))))
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate a seeded synthetic CPU workload as CSV (pid,arrival,burst,priority).")
+    ap.add_argument("-n", type=int, required=True, help="number of processes")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--arrival", choices=ARRIVAL_MODELS, default="poisson")
+    ap.add_argument("--rate", type=float, default=1.0)
+    ap.add_argument("--burst-rate", type=float, default=10.0)
+    ap.add_argument("--burst", choices=BURST_MODELS, default="pareto")
+    ap.add_argument("--burst-mean", type=float, default=5.0)
+    ap.add_argument("--pareto-shape", type=float, default=2.5)
+    ap.add_argument("--sigma", type=float, default=1.0, help="lognormal sigma")
+    ap.add_argument("--max-burst", type=int, default=None)
+    ap.add_argument("--levels", type=int, default=5, help="number of priority levels")
+    ap.add_argument("--weights", type=str, default=None, help="comma-separated priority weights")
+    ap.add_argument("--io-mean", type=float, default=None,
+                    help="write a CPU/I-O burst workload (pid,arrival,priority,bursts) with this mean I/O length")
+    ap.add_argument("--cycles", type=float, default=4.0, help="mean CPU bursts per process (with --io-mean)")
+    ap.add_argument("-o", "--output", type=str, default=None)
+    args = ap.parse_args(argv)
+
+    weights = [float(w) for w in args.weights.split(",")] if args.weights else None
+    spec = WorkloadSpec(arrival=args.arrival, rate=args.rate, burst_rate=args.burst_rate,
+                        burst=args.burst, burst_mean=args.burst_mean, pareto_shape=args.pareto_shape,
+                        lognormal_sigma=args.sigma, max_burst=args.max_burst,
+                        priority_levels=args.levels, priority_weights=weights)
+    if args.io_mean is not None:
+        wl = generate_io_workload(args.n, spec, args.seed, args.cycles, args.io_mean)
+        if args.output:
+            save_io_workload(args.output, wl)
+        else:
+            write_io_csv(sys.stdout, wl)
+        return
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        w = csv.writer(out)
+        w.writerow(("pid", "arrival", "burst", "priority"))
+        for row in iter_workload(args.n, spec, seed=args.seed):
+            w.writerow(row)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()